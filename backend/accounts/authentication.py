@@ -0,0 +1,114 @@
+"""
+Stateless-first JWT authentication.
+
+Access tokens carry id, role, provider_id, status and a token version ("tv",
+see accounts.tokens). Instead of loading the users row on every call:
+
+- the user's row (+ provider) is kept in a short-TTL in-process cache
+  (settings.AUTH_USER_CACHE_TTL_SECONDS); each request gets its own fresh
+  User instance built from it with Model.from_db, so no state leaks between
+  requests
+- changing role / status / provider bumps User.token_version (accounts.signals)
+  and publishes the new value in the Django cache. With a cache shared by all
+  workers (CACHE_BACKEND, e.g. Redis) older tokens are rejected everywhere
+  right away. With the default LocMemCache only the worker that made the
+  change sees it at once; the others reject them once their row cache entry
+  expires, i.e. within AUTH_USER_CACHE_TTL_SECONDS
+- tokens issued before the claims existed fall back to the database lookup
+"""
+from __future__ import annotations
+
+import copy
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings
+
+from providers.models import Provider
+
+from .models import User
+from .tokens import CLAIM_PROVIDER_ID, CLAIM_ROLE, CLAIM_STATUS, CLAIM_TOKEN_VERSION
+
+_USER_FIELDS = [f.attname for f in User._meta.concrete_fields]
+_PROVIDER_FIELDS = [f.attname for f in Provider._meta.concrete_fields]
+
+# user id -> (expires at, user row values, provider row values)
+_rows: Dict[str, Tuple[float, tuple, tuple]] = {}
+_lock = threading.Lock()
+
+
+def _token_version_key(user_id: str) -> str:
+    return f"auth:token-version:v1:{user_id}"
+
+
+def publish_token_version(user_id: str, version: int) -> None:
+    cache.set(_token_version_key(user_id), version, int(api_settings.REFRESH_TOKEN_LIFETIME.total_seconds()))
+
+
+def evict_cached_user(user_id: Optional[str] = None) -> None:
+    """Drop one user (or everyone) from this process' cache."""
+    with _lock:
+        if user_id is None:
+            _rows.clear()
+        else:
+            _rows.pop(user_id, None)
+
+
+def _cached_rows(user_id: str):
+    now = time.monotonic()
+    with _lock:
+        entry = _rows.get(user_id)
+    if entry and entry[0] > now:
+        return entry[1], entry[2]
+
+    user = User.objects.select_related("provider").filter(pk=user_id).first()
+    if user is None:
+        return None
+    rows = (
+        tuple(getattr(user, f) for f in _USER_FIELDS),
+        tuple(getattr(user.provider, f) for f in _PROVIDER_FIELDS),
+    )
+    with _lock:
+        _rows[user_id] = (now + settings.AUTH_USER_CACHE_TTL_SECONDS, *rows)
+    return rows
+
+
+def _build_user(user_row: tuple, provider_row: tuple) -> User:
+    # fresh instances per request; JSON values (skills) are copied, not shared
+    user = User.from_db(None, _USER_FIELDS, copy.deepcopy(user_row))
+    provider = Provider.from_db(None, _PROVIDER_FIELDS, provider_row)
+    User.provider.field.set_cached_value(user, provider)
+    return user
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    def get_user(self, validated_token):
+        claims = (CLAIM_ROLE, CLAIM_PROVIDER_ID, CLAIM_STATUS, CLAIM_TOKEN_VERSION)
+        if any(c not in validated_token for c in claims):
+            return super().get_user(validated_token)
+
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        if user_id is None:
+            return super().get_user(validated_token)
+        user_id = str(user_id)
+        version = validated_token[CLAIM_TOKEN_VERSION]
+
+        published = cache.get(_token_version_key(user_id))
+        if published is not None and published != version:
+            raise AuthenticationFailed("Token has been revoked.", code="token_revoked")
+
+        rows = _cached_rows(user_id)
+        if rows is None:
+            raise AuthenticationFailed("User not found", code="user_not_found")
+        user = _build_user(*rows)
+
+        if user.token_version != version:
+            raise AuthenticationFailed("Token has been revoked.", code="token_revoked")
+        if not user.is_active:
+            raise AuthenticationFailed("User is inactive", code="user_inactive")
+        return user
@@ -0,0 +1,91 @@
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import check_password, get_hasher, make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from rest_framework.test import APIRequestFactory
+
+# PASSWORD_HASHER setting value -> Django hasher algorithm
+ALGORITHMS = {"pbkdf2": "pbkdf2_sha256", "argon2": "argon2", "bcrypt": "bcrypt_sha256"}
+
+
+def _hash_worker(algorithm: str, seconds: float) -> float:
+    """Password checks per second on one core (the CPU part of a login)."""
+    encoded = make_password("benchmark-password", hasher=algorithm)
+    done = 0
+    started = time.perf_counter()
+    while time.perf_counter() - started < seconds:
+        check_password("benchmark-password", encoded)
+        done += 1
+    return done / (time.perf_counter() - started)
+
+
+def _login_worker(email: str, password: str, seconds: float) -> float:
+    """Full POST /api/auth/login/ round trips per second (lookup, hash check, tokens, serializers)."""
+    from accounts.views import LoginView
+
+    view = LoginView.as_view()
+    factory = APIRequestFactory()
+    body = json.dumps({"email": email, "password": password})
+    done = 0
+    started = time.perf_counter()
+    try:
+        while time.perf_counter() - started < seconds:
+            response = view(factory.post("/api/auth/login/", body, content_type="application/json"))
+            if response.status_code != 200:
+                raise RuntimeError(f"login returned {response.status_code}: {response.data}")
+            done += 1
+    finally:
+        connections.close_all()
+    return done / (time.perf_counter() - started)
+
+
+class Command(BaseCommand):
+    help = (
+        "Measures logins/sec per core to size gunicorn workers. By default times the password "
+        "hasher alone; with --email/--password runs the full login view against the database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--seconds", type=float, default=5.0, help="Duration per process.")
+        parser.add_argument("--processes", type=int, default=os.cpu_count() or 1, help="Parallel processes (cores).")
+        parser.add_argument(
+            "--hasher", choices=sorted(ALGORITHMS), default=None,
+            help="Hasher to time (default: settings.PASSWORD_HASHER). Ignored with --email.",
+        )
+        parser.add_argument("--email", help="Existing active user for the end-to-end benchmark.")
+        parser.add_argument("--password", help="That user's password.")
+
+    def handle(self, *args, **options):
+        seconds = options["seconds"]
+        processes = max(1, options["processes"])
+
+        if options["email"]:
+            if not options["password"]:
+                raise CommandError("--password is required with --email.")
+            label = f"login view ({settings.PASSWORD_HASHER})"
+            worker, worker_args = _login_worker, (options["email"], options["password"], seconds)
+        else:
+            algorithm = ALGORITHMS[options["hasher"] or settings.PASSWORD_HASHER]
+            try:
+                get_hasher(algorithm).algorithm
+                make_password("probe", hasher=algorithm)
+            except (ValueError, ImportError) as e:
+                raise CommandError(f"Hasher {algorithm} is not usable: {e}")
+            label = f"password check ({algorithm})"
+            worker, worker_args = _hash_worker, (algorithm, seconds)
+
+        # forked workers must open their own DB connections
+        connections.close_all()
+        self.stdout.write(f"Benchmarking {label}: {processes} process(es) x {seconds:g}s ...")
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            rates = list(pool.map(worker, *[[a] * processes for a in worker_args]))
+
+        total = sum(rates)
+        per_core = total / processes
+        self.stdout.write(self.style.SUCCESS(f"{label}: {per_core:.1f} logins/sec per core, {total:.1f} logins/sec total"))
+        self.stdout.write(f"Average latency per login (CPU-bound): {1000.0 / per_core:.1f} ms" if per_core else "No logins completed.")
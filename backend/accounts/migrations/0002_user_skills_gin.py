@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-16 22:46
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('providers', '0002_providermetrics'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['skills'], name='user_skills_gin'),
+        ),
+    ]
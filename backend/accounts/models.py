@@ -1,4 +1,5 @@
 from django.db import models
+from django.contrib.postgres.indexes import GinIndex
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin, BaseUserManager
 from providers.models import Provider
 
@@ -64,10 +65,20 @@ class User(AbstractBaseUser, PermissionsMixin):
     is_active = models.BooleanField(default=True)
     is_staff = models.BooleanField(default=False)
 
+    # Bumped when role / status / provider change; tokens carrying an older
+    # value are rejected (see accounts.authentication).
+    token_version = models.PositiveIntegerField(default=0)
+
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = ["name", "id"]
 
     objects = UserManager()
 
+    class Meta:
+        indexes = [
+            # skills @> / ?| lookups (specialist search by skill)
+            GinIndex(fields=["skills"], name="user_skills_gin"),
+        ]
+
     def __str__(self):
         return f"{self.email} ({self.role})"
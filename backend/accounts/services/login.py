@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from typing import Optional
+
+from django.contrib.auth.signals import user_login_failed
+
+from accounts.models import User
+
+
+def authenticate_login(request, email: str, password: str) -> Optional[User]:
+    """
+    Login lookup in ONE query (user + provider) instead of authenticate()
+    followed by a lazy user.provider load.
+
+    check_password() re-hashes the password with the first entry of
+    settings.PASSWORD_HASHERS when the stored hash uses another hasher or
+    weaker parameters, so switching PASSWORD_HASHER migrates users as they
+    log in.
+    """
+    user = (
+        User.objects.select_related("provider")
+        .filter(**{User.USERNAME_FIELD: User.objects.normalize_email(email)})
+        .first()
+    )
+    if user is None:
+        # spend the same hashing time as a real check (no user enumeration by timing)
+        User().set_password(password)
+    elif user.check_password(password):
+        return user
+
+    user_login_failed.send(sender=__name__, credentials={"email": email}, request=request)
+    return None
@@ -0,0 +1,50 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from accounts.authentication import evict_cached_user, publish_token_version
+from accounts.models import User
+from providers.models import Provider
+
+# changing any of these invalidates the user's outstanding tokens
+TOKEN_FIELDS = ("role", "status", "is_active", "provider_id")
+
+
+@receiver(pre_save, sender=User)
+def user_pre_save(sender, instance, raw=False, update_fields=None, **kwargs):
+    instance._token_fields_changed = False
+    if raw or instance._state.adding:
+        return
+    if update_fields is not None and not {"role", "status", "is_active", "provider", "provider_id"} & set(update_fields):
+        return
+    old = User.objects.filter(pk=instance.pk).values(*TOKEN_FIELDS).first()
+    if old and any(old[f] != getattr(instance, f) for f in TOKEN_FIELDS):
+        instance._token_fields_changed = True
+
+
+@receiver(post_save, sender=User)
+def user_saved(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    if instance._token_fields_changed:
+        instance._token_fields_changed = False
+        # F() so concurrent saves can't lose a bump; works with save(update_fields=[...])
+        User.objects.filter(pk=instance.pk).update(token_version=F("token_version") + 1)
+        instance.refresh_from_db(fields=["token_version"])
+        transaction.on_commit(partial(publish_token_version, instance.pk, instance.token_version))
+    transaction.on_commit(partial(evict_cached_user, instance.pk))
+
+
+@receiver(post_delete, sender=User)
+def user_deleted(sender, instance, **kwargs):
+    transaction.on_commit(partial(evict_cached_user, instance.pk))
+
+
+@receiver(post_save, sender=Provider)
+def provider_saved(sender, instance, raw=False, **kwargs):
+    if not raw:
+        # cached users embed their provider row; provider edits are rare
+        transaction.on_commit(evict_cached_user)
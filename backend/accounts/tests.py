@@ -1,3 +1,85 @@
+from datetime import date
+from unittest import mock
+
+from django.core.cache import cache
 from django.test import TestCase
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from providers.models import Provider
+
+from .authentication import evict_cached_user
+from .models import User
+from .tokens import tokens_for_user
+
+
+class TokenRevocationTests(TestCase):
+    """Tokens carry role/status claims; changing either revokes the outstanding ones."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.provider = Provider.objects.create(
+            id="P920", name="Provider", contact_name="c", contact_email="c@example.com",
+            contact_phone="1", address="a", created_at=date.today(),
+        )
+
+    def setUp(self):
+        cache.clear()
+        evict_cached_user()
+        self.user = User.objects.create_user(
+            email="tokens@example.com", password="pw", id="U920", name="User",
+            role="Supplier Representative", provider=self.provider, created_at=date.today(),
+        )
+        self.client = APIClient()
+
+    def _me(self, access) -> int:
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {access}")
+        return self.client.get("/api/auth/me/").status_code
+
+    def _refresh(self, refresh) -> int:
+        self.client.credentials()
+        return self.client.post("/api/auth/refresh/", {"refresh": str(refresh)}, format="json").status_code
+
+    def _save(self, **changes):
+        for field, value in changes.items():
+            setattr(self.user, field, value)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.save()
+
+    def test_role_change_revokes_tokens(self):
+        refresh = tokens_for_user(self.user)
+        self.assertEqual(self._me(refresh.access_token), 200)
+
+        self._save(role="Provider Admin")
+        self.assertEqual(self._me(refresh.access_token), 401)
+        self.assertEqual(self._refresh(refresh), 401)
+
+        fresh = tokens_for_user(self.user)
+        self.assertEqual(self._me(fresh.access_token), 200)
+        self.assertEqual(self._refresh(fresh), 200)
+
+    def test_deactivation_revokes_tokens(self):
+        refresh = tokens_for_user(self.user)
+        self.assertEqual(self._me(refresh.access_token), 200)
+
+        self._save(status="Inactive", is_active=False)
+        self.assertEqual(self._me(refresh.access_token), 401)
+        self.assertEqual(self._refresh(refresh), 401)
+
+    def test_revoked_without_the_published_version(self):
+        # another worker with a per-process cache: once its row cache entry is
+        # gone it compares against token_version from the database
+        refresh = tokens_for_user(self.user)
+        self._save(role="Provider Admin")
+        cache.clear()
+        evict_cached_user()
+        self.assertEqual(self._me(refresh.access_token), 401)
+
+    def test_tokens_without_claims_use_the_database(self):
+        refresh = RefreshToken.for_user(self.user)
+        with mock.patch("accounts.authentication._cached_rows") as cached_rows:
+            self.assertEqual(self._me(refresh.access_token), 200)
+        cached_rows.assert_not_called()
 
-# Create your tests here.
+        self._save(is_active=False)
+        self.assertEqual(self._me(refresh.access_token), 401)
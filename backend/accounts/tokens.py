@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+from .models import User
+
+# Claims stamped on every token next to the user id. ClaimsJWTAuthentication
+# trusts them only while "tv" matches User.token_version.
+CLAIM_ROLE = "role"
+CLAIM_PROVIDER_ID = "provider_id"
+CLAIM_STATUS = "status"
+CLAIM_TOKEN_VERSION = "tv"
+
+
+def stamp_user_claims(token, user: User):
+    token[CLAIM_ROLE] = user.role
+    token[CLAIM_PROVIDER_ID] = user.provider_id
+    token[CLAIM_STATUS] = user.status
+    token[CLAIM_TOKEN_VERSION] = user.token_version
+    return token
+
+
+def tokens_for_user(user: User) -> RefreshToken:
+    """Refresh token (and, via .access_token, access token) carrying the user claims."""
+    return stamp_user_claims(RefreshToken.for_user(user), user)
+
+
+class ClaimsTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Refresh re-reads the user (one query per refresh, not per request):
+    refresh tokens from before a role/status change are refused, and the new
+    access token carries the current claims.
+    """
+
+    def validate(self, attrs):
+        data = super().validate(attrs)
+
+        refresh = self.token_class(attrs["refresh"])
+        user = User.objects.filter(pk=refresh.get(api_settings.USER_ID_CLAIM)).first()
+        if user is None or user.status != "Active" or not user.is_active:
+            raise AuthenticationFailed("No active account found for the given token.", code="no_active_account")
+        if refresh.get(CLAIM_TOKEN_VERSION, user.token_version) != user.token_version:
+            raise AuthenticationFailed("Token has been revoked.", code="token_revoked")
+
+        data["access"] = str(stamp_user_claims(AccessToken.for_user(user), user))
+        return data
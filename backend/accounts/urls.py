@@ -1,5 +1,7 @@
 from django.urls import path
 from rest_framework_simplejwt.views import TokenRefreshView
+
+from .tokens import ClaimsTokenRefreshSerializer
 from .views import (
     MeView, LoginView, UserRoleUpdateView,
     UserListCreateView, UserDetailView, SpecialistListView
@@ -7,7 +9,7 @@ from .views import (
 
 urlpatterns = [
     path("auth/login/", LoginView.as_view(), name="login"),
-    path("auth/refresh/", TokenRefreshView.as_view(), name="token_refresh"),
+    path("auth/refresh/", TokenRefreshView.as_view(serializer_class=ClaimsTokenRefreshSerializer), name="token_refresh"),
     path("auth/me/", MeView.as_view(), name="me"),
     path("users/", UserListCreateView.as_view(), name="users-list-create"),
     path("users/<str:id>/", UserDetailView.as_view(), name="users-detail"),
@@ -1,13 +1,13 @@
 from datetime import date
-from django.contrib.auth import authenticate
 from rest_framework import serializers, generics, status
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
-from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework.exceptions import PermissionDenied
 
 from .models import User
+from .services.login import authenticate_login
+from .tokens import tokens_for_user
 from .serializers import UserSerializer, UserRoleUpdateSerializer, UserCreateSerializer, UserUpdateSerializer
 from providers.serializers import ProviderSerializer
 from .permissions import IsProviderAdmin, IsProviderMemberReadOnly, IsSameProviderOrSelf
@@ -29,7 +29,7 @@ class LoginView(APIView):
         email = serializer.validated_data["email"]
         password = serializer.validated_data["password"]
 
-        user = authenticate(request=request, email=email, password=password)
+        user = authenticate_login(request, email, password)
         if not user:
             return Response({"detail": "Invalid email or password."}, status=status.HTTP_401_UNAUTHORIZED)
 
@@ -40,7 +40,7 @@ class LoginView(APIView):
         if user.provider.status != "Active":
             return Response({"detail": "Provider is inactive."}, status=status.HTTP_403_FORBIDDEN)
 
-        refresh = RefreshToken.for_user(user)
+        refresh = tokens_for_user(user)
 
         return Response({
             "refresh": str(refresh),
@@ -0,0 +1,67 @@
+from datetime import datetime, time, timezone as dt_timezone
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from activitylog.models import ActivityLog
+from activitylog.partitions import (
+    add_months,
+    drop_partitions_before,
+    ensure_partitions,
+    is_partitioned,
+    list_partitions,
+    month_start,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Applies the activity log retention and creates upcoming month partitions. On PostgreSQL "
+        "whole months older than the retention window are dropped as partitions (no DELETE, no "
+        "vacuum debt). Run it from cron, e.g. daily."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--keep-months", type=int, default=settings.ACTIVITY_LOG_RETENTION_MONTHS,
+            help="Full months to keep before the current one (default: settings.ACTIVITY_LOG_RETENTION_MONTHS).",
+        )
+        parser.add_argument(
+            "--months-ahead", type=int, default=3,
+            help="Partitions to create ahead of the current month.",
+        )
+        parser.add_argument("--dry-run", action="store_true", help="Only report what would be dropped.")
+
+    def handle(self, *args, **options):
+        keep = options["keep_months"]
+        if keep < 1:
+            raise CommandError("--keep-months must be at least 1.")
+
+        cutoff = add_months(month_start(datetime.now(dt_timezone.utc)), -keep)
+
+        if not is_partitioned():
+            # plain table (not PostgreSQL): fall back to a DELETE
+            qs = ActivityLog.objects.filter(
+                created_at__lt=datetime.combine(cutoff, time.min, tzinfo=dt_timezone.utc)
+            )
+            if options["dry_run"]:
+                self.stdout.write(f"Would delete {qs.count()} event(s) before {cutoff}.")
+                return
+            deleted, _ = qs.delete()
+            self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} event(s) before {cutoff}."))
+            return
+
+        if options["dry_run"]:
+            doomed = [name for name, month in list_partitions() if add_months(month, 1) <= cutoff]
+            self.stdout.write(f"Would drop {len(doomed)} partition(s) before {cutoff}: {', '.join(doomed) or '-'}")
+            return
+
+        dropped = drop_partitions_before(cutoff)
+        created = ensure_partitions(months_ahead=options["months_ahead"])
+        for name in created:
+            self.stdout.write(f"created {name}")
+        for name in dropped:
+            self.stdout.write(f"dropped {name}")
+        self.stdout.write(
+            self.style.SUCCESS(f"Created {len(created)} and dropped {len(dropped)} partition(s); kept events since {cutoff}.")
+        )
@@ -0,0 +1,70 @@
+import fcntl
+import os
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from activitylog.writer import load_entry, spool_dir, write_entries
+
+
+class Command(BaseCommand):
+    help = (
+        "Writes activity log events left in the spool directory by crashed workers or failed "
+        "flushes. Safe to run periodically (cron) next to the web workers."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dir", help="Spool directory (default: settings.ACTIVITY_LOG_SPOOL_DIR).")
+        parser.add_argument(
+            "--min-age", type=float, default=60.0,
+            help=(
+                "Only replay segments untouched for this many seconds. Segments a live writer is "
+                "still appending to or flushing are skipped regardless (it holds a lock on them)."
+            ),
+        )
+
+    def handle(self, *args, **options):
+        directory = Path(options["dir"]) if options["dir"] else spool_dir()
+        if not directory.is_dir():
+            self.stdout.write(f"No spool directory at {directory}.")
+            return
+
+        cutoff = time.time() - options["min_age"]
+        replayed = 0
+        files = 0
+        for path in sorted(directory.glob("*.jsonl")):
+            try:
+                if path.stat().st_mtime > cutoff:
+                    continue
+                segment = open(path, encoding="utf-8")
+            except FileNotFoundError:
+                continue  # flushed meanwhile
+
+            with segment:
+                try:
+                    fcntl.flock(segment, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    continue  # its writer is still flushing it
+                if os.fstat(segment.fileno()).st_nlink == 0:
+                    continue  # flushed and deleted between open() and the lock
+                lines = segment.read().splitlines()
+
+                entries = []
+                for n, line in enumerate(lines, start=1):
+                    if not line.strip():
+                        continue
+                    try:
+                        entries.append(load_entry(line))
+                    except ValueError:
+                        # torn last line of a crashed write
+                        self.stdout.write(self.style.WARNING(f"{path.name}:{n}: skipped unreadable line"))
+
+                with transaction.atomic():
+                    replayed += write_entries(entries)
+                # deleted while still locked, so no other replay run can pick it up again
+                path.unlink()
+            files += 1
+
+        self.stdout.write(self.style.SUCCESS(f"Replayed {replayed} event(s) from {files} segment(s)."))
@@ -0,0 +1,153 @@
+# Generated by Django 5.2.18 on 2026-10-17 03:10
+
+from datetime import date, datetime, timezone as dt_timezone
+
+from django.db import migrations, models
+
+# Frozen copies of the activitylog.partitions helpers this migration needs, so
+# later changes to that module can't change what the migration does.
+TABLE = "activitylog_activitylog"
+DEFAULT_PARTITION = f"{TABLE}_default"
+
+
+def month_start(value) -> date:
+    if isinstance(value, datetime):
+        value = value.astimezone(dt_timezone.utc).date()
+    return value.replace(day=1)
+
+
+def add_months(month: date, n: int) -> date:
+    index = month.year * 12 + (month.month - 1) + n
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _bound(month: date) -> str:
+    return f"{month.isoformat()} 00:00:00+00"
+
+
+def create_partition_sql(month: date) -> str:
+    name = f"{TABLE}_p{month.year:04d}_{month.month:02d}"
+    return (
+        f'CREATE TABLE IF NOT EXISTS "{name}" PARTITION OF "{TABLE}" '
+        f"FOR VALUES FROM ('{_bound(month)}') TO ('{_bound(add_months(month, 1))}')"
+    )
+
+
+LEGACY = f"{TABLE}_unpartitioned"
+SEQUENCE = f"{TABLE}_id_seq"
+COLUMNS = (
+    "id, actor_type, event_type, entity_type, entity_id, message, metadata, "
+    "created_at, actor_user_id, provider_id"
+)
+MONTHS_AHEAD = 3
+
+PROVIDER_CREATED_INDEX = models.Index(
+    fields=["provider", "-created_at", "-id"], name="alog_provider_created_idx"
+)
+
+
+def partition_table(apps, schema_editor):
+    """
+    PostgreSQL: rebuild the table as PARTITION BY RANGE (created_at), one
+    partition per month from the oldest row to MONTHS_AHEAD months from now,
+    plus a default partition. A partitioned table's primary key has to contain
+    the partition key, so it becomes (id, created_at); ids still come from a
+    single sequence and stay unique.
+
+    Other databases only get the (provider, created_at, id) index.
+    """
+    ActivityLog = apps.get_model("activitylog", "ActivityLog")
+    if schema_editor.connection.vendor != "postgresql":
+        schema_editor.add_index(ActivityLog, PROVIDER_CREATED_INDEX)
+        return
+
+    execute = schema_editor.execute
+    execute(f'ALTER TABLE "{TABLE}" RENAME TO "{LEGACY}"')
+    execute(f'ALTER TABLE "{LEGACY}" RENAME CONSTRAINT "{TABLE}_pkey" TO "{LEGACY}_pkey"')
+    execute(f'ALTER TABLE "{LEGACY}" ALTER COLUMN id DROP IDENTITY')
+
+    execute(f'CREATE SEQUENCE "{SEQUENCE}"')
+    execute(
+        f"""
+        CREATE TABLE "{TABLE}" (
+            id bigint NOT NULL DEFAULT nextval('"{SEQUENCE}"'),
+            actor_type varchar(20) NOT NULL,
+            event_type varchar(80) NOT NULL,
+            entity_type varchar(50) NOT NULL,
+            entity_id varchar(50) NOT NULL,
+            message text NOT NULL,
+            metadata jsonb NULL,
+            created_at timestamp with time zone NOT NULL,
+            actor_user_id varchar(20) NULL
+                CONSTRAINT alog_actor_user_fk REFERENCES accounts_user (id) DEFERRABLE INITIALLY DEFERRED,
+            provider_id varchar(10) NULL
+                CONSTRAINT alog_provider_fk REFERENCES providers_provider (id) DEFERRABLE INITIALLY DEFERRED,
+            CONSTRAINT "{TABLE}_pkey" PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+        """
+    )
+    execute(f'ALTER SEQUENCE "{SEQUENCE}" OWNED BY "{TABLE}".id')
+    execute(f'CREATE TABLE "{DEFAULT_PARTITION}" PARTITION OF "{TABLE}" DEFAULT')
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(f'SELECT min(created_at) FROM "{LEGACY}"')
+        oldest = cursor.fetchone()[0]
+    current = month_start(datetime.now(dt_timezone.utc))
+    month = month_start(oldest) if oldest and oldest < datetime.now(dt_timezone.utc) else current
+    while month <= add_months(current, MONTHS_AHEAD):
+        execute(create_partition_sql(month))
+        month = add_months(month, 1)
+
+    execute(f'INSERT INTO "{TABLE}" ({COLUMNS}) SELECT {COLUMNS} FROM "{LEGACY}"')
+    # run the deferred FK checks of the copy now; pending trigger events block CREATE INDEX
+    execute("SET CONSTRAINTS ALL IMMEDIATE")
+    execute(f"""SELECT setval('"{SEQUENCE}"', (SELECT coalesce(max(id), 0) + 1 FROM "{TABLE}"), false)""")
+    execute(f'DROP TABLE "{LEGACY}"')
+
+    # created on the parent, so every partition (current and future) gets them
+    schema_editor.add_index(ActivityLog, PROVIDER_CREATED_INDEX)
+    execute(f'CREATE INDEX alog_actor_user_idx ON "{TABLE}" (actor_user_id)')
+
+
+def unpartition_table(apps, schema_editor):
+    ActivityLog = apps.get_model("activitylog", "ActivityLog")
+    if schema_editor.connection.vendor != "postgresql":
+        schema_editor.remove_index(ActivityLog, PROVIDER_CREATED_INDEX)
+        return
+
+    execute = schema_editor.execute
+    partitioned = f"{TABLE}_partitioned"
+    execute(f'ALTER TABLE "{TABLE}" RENAME TO "{partitioned}"')
+    execute(f'ALTER TABLE "{partitioned}" RENAME CONSTRAINT "{TABLE}_pkey" TO "{partitioned}_pkey"')
+    execute(f'ALTER SEQUENCE "{SEQUENCE}" RENAME TO "{partitioned}_id_seq"')
+
+    # the model state before this migration: plain table, identity id
+    schema_editor.create_model(ActivityLog)
+    execute(f'INSERT INTO "{TABLE}" ({COLUMNS}) OVERRIDING SYSTEM VALUE SELECT {COLUMNS} FROM "{partitioned}"')
+    execute("SET CONSTRAINTS ALL IMMEDIATE")
+    execute(
+        f"SELECT setval(pg_get_serial_sequence('\"{TABLE}\"', 'id'), "
+        f'(SELECT coalesce(max(id), 0) + 1 FROM "{TABLE}"), false)'
+    )
+    execute(f'DROP TABLE "{partitioned}" CASCADE')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('activitylog', '0002_activitylog_created_at_default'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(
+                    model_name='activitylog',
+                    index=PROVIDER_CREATED_INDEX,
+                ),
+            ],
+            database_operations=[
+                migrations.RunPython(partition_table, unpartition_table),
+            ],
+        ),
+    ]
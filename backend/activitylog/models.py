@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils import timezone
 from django.conf import settings
 
 class ActivityLog(models.Model):
@@ -33,10 +34,16 @@ class ActivityLog(models.Model):
     message = models.TextField(blank=True, default="")
     metadata = models.JSONField(blank=True, null=True)
 
-    created_at = models.DateTimeField(auto_now_add=True)
+    # set when the event happens, not when the buffered writer inserts it
+    created_at = models.DateTimeField(default=timezone.now)
 
     class Meta:
         ordering = ["-created_at"]
+        # On PostgreSQL the table is range-partitioned by month on created_at
+        # (migration 0003, activitylog.partitions).
+        indexes = [
+            models.Index(fields=["provider", "-created_at", "-id"], name="alog_provider_created_idx"),
+        ]
 
     def __str__(self):
         return f"{self.event_type} [{self.entity_type}:{self.entity_id}]"
@@ -0,0 +1,17 @@
+from rest_framework.pagination import CursorPagination
+
+
+class ActivityLogCursorPagination(CursorPagination):
+    """
+    Keyset pagination for the activity log, newest first:
+      GET /api/activity-logs/?event_type=USER_CREATED&date_from=2026-10-01
+      -> { next, previous, results: [...] }
+
+    Matches the (provider, created_at DESC, id DESC) index, so every page is an
+    index range scan no matter how deep the client pages.
+    """
+
+    ordering = ("-created_at", "-id")
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 200
@@ -0,0 +1,162 @@
+"""
+Monthly range partitions of the activity log table (PostgreSQL only).
+
+Migration 0003 turns activitylog_activitylog into a table partitioned by
+RANGE (created_at) with one partition per calendar month (UTC):
+
+  activitylog_activitylog_p2026_10   [2026-10-01, 2026-11-01)
+  activitylog_activitylog_default    rows no month partition covers yet
+
+Upcoming months are created ahead of time by `manage.py prune_activity_logs`,
+which also drops whole months past the retention window (a catalog change
+instead of a DELETE). On other databases, or before the migration ran, the
+table is a plain table and these helpers report nothing to do.
+"""
+from __future__ import annotations
+
+import re
+from datetime import date, datetime, timezone as dt_timezone
+from typing import List, Optional, Tuple
+
+from django.db import connection as default_connection, transaction
+
+TABLE = "activitylog_activitylog"
+DEFAULT_PARTITION = f"{TABLE}_default"
+_PARTITION_RE = re.compile(rf"^{TABLE}_p(\d{{4}})_(\d{{2}})$")
+
+
+def month_start(value) -> date:
+    """First day of the (UTC) month containing a date or aware datetime."""
+    if isinstance(value, datetime):
+        value = value.astimezone(dt_timezone.utc).date()
+    return value.replace(day=1)
+
+
+def add_months(month: date, n: int) -> date:
+    index = month.year * 12 + (month.month - 1) + n
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"{TABLE}_p{month.year:04d}_{month.month:02d}"
+
+
+def _bound(month: date) -> str:
+    return f"{month.isoformat()} 00:00:00+00"
+
+
+def is_partitioned(connection=None) -> bool:
+    connection = connection or default_connection
+    if connection.vendor != "postgresql":
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_partitioned_table pt JOIN pg_class c ON c.oid = pt.partrelid "
+            "WHERE c.relname = %s AND c.relnamespace = 'public'::regnamespace",
+            [TABLE],
+        )
+        return cursor.fetchone() is not None
+
+
+def list_partitions(connection=None) -> List[Tuple[str, date]]:
+    """(name, month) of the existing month partitions, oldest first."""
+    connection = connection or default_connection
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = %s::regclass",
+            [TABLE],
+        )
+        names = [row[0] for row in cursor.fetchall()]
+
+    out = []
+    for name in names:
+        m = _PARTITION_RE.match(name)
+        if m:
+            out.append((name, date(int(m.group(1)), int(m.group(2)), 1)))
+    return sorted(out, key=lambda item: item[1])
+
+
+def create_partition_sql(month: date) -> str:
+    """CREATE ... PARTITION OF for one month (only valid while the default partition has no rows for it)."""
+    return (
+        f'CREATE TABLE IF NOT EXISTS "{partition_name(month)}" PARTITION OF "{TABLE}" '
+        f"FOR VALUES FROM ('{_bound(month)}') TO ('{_bound(add_months(month, 1))}')"
+    )
+
+
+def create_month_partition(month: date, connection=None) -> None:
+    """
+    Add the partition for `month`. Rows that already landed in the default
+    partition for that month are moved into it, so this is safe to run late.
+    """
+    connection = connection or default_connection
+    name = partition_name(month)
+    lower, upper = _bound(month), _bound(add_months(month, 1))
+    with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+        cursor.execute(f'CREATE TABLE "{name}" (LIKE "{TABLE}" INCLUDING DEFAULTS)')
+        cursor.execute(
+            f'WITH moved AS (DELETE FROM "{DEFAULT_PARTITION}" '
+            f"WHERE created_at >= %s AND created_at < %s RETURNING *) "
+            f'INSERT INTO "{name}" SELECT * FROM moved',
+            [lower, upper],
+        )
+        cursor.execute(
+            f'ALTER TABLE "{TABLE}" ATTACH PARTITION "{name}" '
+            f"FOR VALUES FROM ('{lower}') TO ('{upper}')"
+        )
+
+
+def _months_in_default(connection) -> List[date]:
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT DISTINCT date_trunc('month', created_at AT TIME ZONE 'UTC')::date "
+            f'FROM "{DEFAULT_PARTITION}"'
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+
+def ensure_partitions(*, months_ahead: int = 3, today: Optional[date] = None, connection=None) -> List[str]:
+    """
+    Create the partitions for the current month and `months_ahead` after it,
+    plus any month that has rows sitting in the default partition (events
+    dated before the partitioning, late replays). Returns the new ones.
+    """
+    connection = connection or default_connection
+    if not is_partitioned(connection):
+        return []
+
+    existing = {month for _, month in list_partitions(connection)}
+    current = month_start(today or datetime.now(dt_timezone.utc))
+    wanted = {add_months(current, n) for n in range(months_ahead + 1)}
+    wanted.update(_months_in_default(connection))
+
+    created = []
+    for month in sorted(wanted - existing):
+        create_month_partition(month, connection)
+        created.append(partition_name(month))
+    return created
+
+
+def drop_partitions_before(cutoff: date, *, connection=None) -> List[str]:
+    """
+    Drop every month partition that lies entirely before `cutoff` (first of a
+    month). Stragglers in the default partition are deleted as well.
+    """
+    connection = connection or default_connection
+    if not is_partitioned(connection):
+        return []
+
+    dropped = []
+    for name, month in list_partitions(connection):
+        if add_months(month, 1) > cutoff:
+            break
+        with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+            cursor.execute(f'ALTER TABLE "{TABLE}" DETACH PARTITION "{name}"')
+            cursor.execute(f'DROP TABLE "{name}"')
+        dropped.append(name)
+
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM "{DEFAULT_PARTITION}" WHERE created_at < %s', [_bound(cutoff)])
+    return dropped
@@ -1,3 +1,215 @@
-from django.test import TestCase
+import fcntl
+import os
+import tempfile
+import threading
+import time
+import unittest
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from io import StringIO
+from pathlib import Path
+from unittest import mock
 
-# Create your tests here.
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from providers.models import Provider
+
+from . import partitions
+from .models import ActivityLog
+from .utils import log_activity
+from .writer import ActivityLogWriter, dump_entry
+
+
+class ActivityLogListTests(TestCase):
+    """GET /api/activity-logs/: cursor pages, filters, one query per page."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.provider = Provider.objects.create(
+            id="P910", name="Provider", contact_name="c", contact_email="c@example.com",
+            contact_phone="1", address="a", created_at=date.today(),
+        )
+        cls.admin = User.objects.create_user(
+            email="alog-admin@example.com", password="pw", id="U910", name="Admin",
+            role="Provider Admin", provider=cls.provider, created_at=date.today(),
+        )
+        now = timezone.now()
+        ActivityLog.objects.bulk_create(
+            [
+                ActivityLog(
+                    provider=cls.provider, actor_user=cls.admin, event_type="A" if n % 2 else "B",
+                    entity_type="User", entity_id=f"U{n % 3}", created_at=now - timedelta(hours=n),
+                )
+                for n in range(30)
+            ]
+        )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def test_pages_without_per_row_queries(self):
+        with self.assertNumQueries(1):
+            resp = self.client.get("/api/activity-logs/?page_size=10")
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(len(resp.data["results"]), 10)
+        self.assertEqual(resp.data["results"][0]["actorUserName"], "Admin")
+
+        first = {row["id"] for row in resp.data["results"]}
+        second = {row["id"] for row in self.client.get(resp.data["next"]).data["results"]}
+        self.assertEqual(len(second), 10)
+        self.assertFalse(first & second)
+
+    def test_filters(self):
+        resp = self.client.get("/api/activity-logs/?event_type=A&entity_id=U0&page_size=200")
+        self.assertEqual(resp.status_code, 200)
+        self.assertTrue(resp.data["results"])
+        self.assertEqual({(r["event_type"], r["entity_id"]) for r in resp.data["results"]}, {("A", "U0")})
+
+        since = (timezone.now() - timedelta(hours=4, minutes=30)).isoformat()
+        resp = self.client.get("/api/activity-logs/", {"date_from": since})
+        self.assertEqual(len(resp.data["results"]), 5)
+
+        self.assertEqual(self.client.get("/api/activity-logs/?date_to=soon").status_code, 400)
+
+
+@unittest.skipUnless(connection.vendor == "postgresql", "monthly partitions are PostgreSQL only")
+class ActivityLogPartitionTests(TestCase):
+    def test_rows_are_routed_and_old_months_dropped(self):
+        self.assertTrue(partitions.is_partitioned())
+
+        old = ActivityLog.objects.create(
+            event_type="OLD", entity_type="X", entity_id="1", created_at=datetime(2020, 3, 5, tzinfo=dt_timezone.utc)
+        )
+        recent = ActivityLog.objects.create(event_type="NEW", entity_type="X", entity_id="2")
+
+        # a month without its own partition lands in the default one until ensure_partitions carves it out
+        self.assertIn("activitylog_activitylog_p2020_03", partitions.ensure_partitions())
+        with connection.cursor() as cursor:
+            cursor.execute(f'SELECT count(*) FROM "{partitions.DEFAULT_PARTITION}"')
+            self.assertEqual(cursor.fetchone()[0], 0)
+
+        cutoff = partitions.add_months(partitions.month_start(timezone.now()), -12)
+        self.assertEqual(partitions.drop_partitions_before(cutoff), ["activitylog_activitylog_p2020_03"])
+        self.assertFalse(ActivityLog.objects.filter(pk=old.pk).exists())
+        self.assertTrue(ActivityLog.objects.filter(pk=recent.pk).exists())
+
+
+def _entry(n: int) -> dict:
+    return {
+        "provider_id": None, "actor_type": "SYSTEM", "actor_user_id": None, "event_type": "E",
+        "entity_type": "X", "entity_id": str(n), "message": "", "metadata": None, "created_at": timezone.now(),
+    }
+
+
+class ActivityLogWriterTests(TestCase):
+    """The background writer; the INSERT itself (write_entries) is replaced by a recorder."""
+
+    def setUp(self):
+        self.directory = Path(self.enterContext(tempfile.TemporaryDirectory()))
+        self.batches = []
+        self.written = threading.Event()
+        self.failing = False
+        self.enterContext(mock.patch("activitylog.writer.write_entries", side_effect=self._write_entries))
+        # the writer thread would otherwise open its own DB connection
+        self.enterContext(mock.patch("activitylog.writer.close_old_connections"))
+        self.enterContext(mock.patch("activitylog.writer.connection"))
+
+    def _write_entries(self, entries):
+        try:
+            if self.failing:
+                raise RuntimeError("database is down")
+            self.batches.append(list(entries))
+            return len(entries)
+        finally:
+            self.written.set()
+
+    def _segments(self):
+        return sorted(self.directory.glob("*.jsonl"))
+
+    def _wait_for_segments_deleted(self):
+        # the writer thread deletes the segment right after write_entries returns
+        deadline = time.monotonic() + 5
+        while self._segments() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(self._segments(), [])
+
+    def test_flush_on_batch_size(self):
+        writer = ActivityLogWriter(batch_size=3, flush_interval=60, directory=self.directory)
+        writer.submit([_entry(1), _entry(2)])
+        self.assertFalse(self.written.wait(0.2))
+        self.assertEqual(len(self._segments()), 1)
+
+        writer.submit([_entry(3)])
+        self.assertTrue(self.written.wait(5))
+        self.assertEqual([[e["entity_id"] for e in b] for b in self.batches], [["1", "2", "3"]])
+        self._wait_for_segments_deleted()
+
+    def test_flush_on_interval(self):
+        writer = ActivityLogWriter(batch_size=1000, flush_interval=0.05, directory=self.directory)
+        writer.submit([_entry(1)])
+        self.assertTrue(self.written.wait(5))
+        self.assertEqual(len(self.batches[0]), 1)
+        self._wait_for_segments_deleted()
+
+    def test_failed_flush_keeps_the_segment(self):
+        self.failing = True
+        writer = ActivityLogWriter(batch_size=1000, flush_interval=60, directory=self.directory)
+        writer.submit([_entry(1), _entry(2)])
+        with self.assertLogs("activitylog.writer", "ERROR"):
+            writer.flush()
+
+        segments = self._segments()
+        self.assertEqual(len(segments), 1)
+        self.assertEqual(len(segments[0].read_text().splitlines()), 2)
+        # and it is no longer locked, so replay can take it
+        with open(segments[0]) as f:
+            fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+
+class ReplayActivitySpoolTests(TestCase):
+    def setUp(self):
+        self.directory = Path(self.enterContext(tempfile.TemporaryDirectory()))
+
+    def _segment(self, name: str, content: str) -> Path:
+        path = self.directory / name
+        path.write_text(content)
+        old = time.time() - 3600
+        os.utime(path, (old, old))
+        return path
+
+    def _replay(self) -> str:
+        out = StringIO()
+        call_command("replay_activity_spool", dir=str(self.directory), stdout=out)
+        return out.getvalue()
+
+    def test_inserts_leftovers_and_skips_torn_lines(self):
+        torn = dump_entry(_entry(3))[:20]
+        path = self._segment("w-1-0.jsonl", f"{dump_entry(_entry(1))}\n{dump_entry(_entry(2))}\n{torn}")
+
+        out = self._replay()
+        self.assertIn("w-1-0.jsonl:3: skipped unreadable line", out)
+        self.assertEqual(sorted(ActivityLog.objects.values_list("entity_id", flat=True)), ["1", "2"])
+        self.assertFalse(path.exists())
+
+    def test_skips_segments_a_live_writer_holds(self):
+        path = self._segment("w-1-0.jsonl", dump_entry(_entry(1)) + "\n")
+        with open(path, "a") as live:
+            fcntl.flock(live, fcntl.LOCK_EX)
+            self._replay()
+        self.assertTrue(path.exists())
+        self.assertFalse(ActivityLog.objects.exists())
+
+
+class LogActivityTests(TestCase):
+    @override_settings(ACTIVITY_LOG_ASYNC=False)
+    def test_sync_mode_writes_inline(self):
+        with mock.patch("activitylog.utils.get_writer") as get_writer:
+            with self.captureOnCommitCallbacks(execute=True):
+                log_activity(provider_id=None, actor_type="SYSTEM", event_type="E", entity_type="X", entity_id=7)
+        get_writer.assert_not_called()
+        self.assertEqual(list(ActivityLog.objects.values_list("entity_id", flat=True)), ["7"])
@@ -1,4 +1,45 @@
-from .models import ActivityLog
+import json
+from functools import partial
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.utils import timezone
+
+from .writer import get_writer, write_entries
+
+
+def _entry(
+    *,
+    provider_id: str | None,
+    actor_type: str,
+    actor_user=None,
+    event_type: str,
+    entity_type: str,
+    entity_id: str,
+    message: str = "",
+    metadata: dict | None = None,
+) -> dict:
+    return {
+        "provider_id": provider_id,
+        "actor_type": actor_type,
+        "actor_user_id": getattr(actor_user, "pk", None),
+        "event_type": event_type,
+        "entity_type": entity_type,
+        "entity_id": str(entity_id),
+        "message": message,
+        # JSON-normalized now (Decimal, dates ...) so one bad value can't fail a whole batch
+        "metadata": json.loads(json.dumps(metadata, cls=DjangoJSONEncoder)) if metadata else None,
+        "created_at": timezone.now(),
+    }
+
+
+def _submit(entries: list[dict]):
+    if settings.ACTIVITY_LOG_ASYNC:
+        get_writer().submit(entries)
+    else:
+        write_entries(entries)
+
 
 def log_activity(
     *,
@@ -11,13 +52,24 @@ def log_activity(
     message: str = "",
     metadata: dict | None = None,
 ):
-    ActivityLog.objects.create(
+    """
+    Record an activity event once the current transaction commits (right away
+    outside one). Written in batches by activitylog.writer.
+    """
+    entry = _entry(
         provider_id=provider_id,
         actor_type=actor_type,
         actor_user=actor_user,
         event_type=event_type,
         entity_type=entity_type,
-        entity_id=str(entity_id),
+        entity_id=entity_id,
         message=message,
-        metadata=metadata or None,
+        metadata=metadata,
     )
+    transaction.on_commit(partial(_submit, [entry]))
+
+
+def log_activities(entries: list[dict]):
+    """log_activity() for many entries (same keyword arguments each)."""
+    if entries:
+        transaction.on_commit(partial(_submit, [_entry(**e) for e in entries]))
@@ -1,12 +1,79 @@
+from datetime import datetime, time, timedelta
+
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
 from rest_framework import generics
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated
 from .models import ActivityLog
+from .pagination import ActivityLogCursorPagination
 from .serializers import ActivityLogSerializer
 from .permissions import IsProviderAdmin
 
+
+def _parse_bound(params, name: str, *, end: bool = False):
+    """
+    (datetime, lookup) for an ISO datetime or a plain date, or None. A plain
+    date_to covers that whole day: (start of the next day, "lt").
+    """
+    raw = str(params.get(name) or "").strip()
+    if not raw:
+        return None
+    lookup = "lte" if end else "gte"
+    try:
+        d = parse_date(raw)
+        if d is not None:
+            if end:
+                d, lookup = d + timedelta(days=1), "lt"
+            dt = datetime.combine(d, time.min)
+        else:
+            dt = parse_datetime(raw)
+    except ValueError:
+        dt = None
+    if dt is None:
+        raise ValidationError({name: "Must be a date (YYYY-MM-DD) or an ISO 8601 datetime."})
+    if timezone.is_naive(dt):
+        dt = timezone.make_aware(dt)
+    return dt, lookup
+
+
+def _filter_activity_logs(qs, params):
+    """
+    Narrowing for the activity log:
+      event_type, actor_type   exact match (comma-separated for several)
+      entity_type, entity_id   exact match
+      date_from, date_to       created_at window; a created_at range also lets
+                               PostgreSQL skip the month partitions outside it
+    """
+    for param, field in [("event_type", "event_type"), ("actor_type", "actor_type")]:
+        raw = str(params.get(param) or "").strip()
+        if raw:
+            qs = qs.filter(**{f"{field}__in": [v.strip() for v in raw.split(",") if v.strip()]})
+
+    for param in ("entity_type", "entity_id"):
+        raw = str(params.get(param) or "").strip()
+        if raw:
+            qs = qs.filter(**{param: raw})
+
+    for param, end in (("date_from", False), ("date_to", True)):
+        bound = _parse_bound(params, param, end=end)
+        if bound:
+            dt, lookup = bound
+            qs = qs.filter(**{f"created_at__{lookup}": dt})
+
+    return qs
+
+
 class ActivityLogListView(generics.ListAPIView):
+    """
+    GET /api/activity-logs/
+      cursor-paginated, newest first; filters see _filter_activity_logs
+    """
+
     permission_classes = [IsAuthenticated, IsProviderAdmin]
     serializer_class = ActivityLogSerializer
+    pagination_class = ActivityLogCursorPagination
 
     def get_queryset(self):
-        return ActivityLog.objects.filter(provider_id=self.request.user.provider_id)
+        qs = ActivityLog.objects.filter(provider_id=self.request.user.provider_id).select_related("actor_user")
+        return _filter_activity_logs(qs, self.request.query_params)
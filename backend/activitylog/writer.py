@@ -0,0 +1,180 @@
+"""
+Buffered ActivityLog writer.
+
+log_activity() no longer INSERTs on the request path. After the caller's
+transaction commits, events are appended to a local spool file (a write(),
+no DB round trip) and queued in memory; a background thread writes them with
+one bulk_create every ACTIVITY_LOG_BATCH_SIZE events or ACTIVITY_LOG_FLUSH_MS
+milliseconds, whichever comes first.
+
+Durability: the spool segment of a batch is deleted only after its INSERT
+committed. Segments left behind by a crashed worker or a failed flush are
+written by `manage.py replay_activity_spool` (at-least-once: a crash between
+the INSERT and the delete can replay a batch twice).
+
+The writer holds an exclusive flock on its segment from the first append until
+the segment is deleted (or its flush failed), however long the INSERT takes;
+replay skips locked segments. The kernel drops the lock when the process dies.
+"""
+from __future__ import annotations
+
+import atexit
+import fcntl
+import json
+import logging
+import os
+import socket
+import threading
+from itertools import count
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import close_old_connections, connection
+from django.utils.dateparse import parse_datetime
+
+from .models import ActivityLog
+
+logger = logging.getLogger(__name__)
+
+ENTRY_FIELDS = (
+    "provider_id", "actor_type", "actor_user_id", "event_type",
+    "entity_type", "entity_id", "message", "metadata", "created_at",
+)
+
+
+def write_entries(entries: Iterable[Dict[str, Any]]) -> int:
+    rows = [ActivityLog(**{f: e.get(f) for f in ENTRY_FIELDS}) for e in entries]
+    ActivityLog.objects.bulk_create(rows)
+    return len(rows)
+
+
+def dump_entry(entry: Dict[str, Any]) -> str:
+    return json.dumps(entry, cls=DjangoJSONEncoder, separators=(",", ":"))
+
+
+def load_entry(line: str) -> Dict[str, Any]:
+    entry = json.loads(line)
+    entry["created_at"] = parse_datetime(entry["created_at"]) if entry.get("created_at") else None
+    return entry
+
+
+def spool_dir() -> Path:
+    return Path(settings.ACTIVITY_LOG_SPOOL_DIR)
+
+
+class ActivityLogWriter:
+    def __init__(self, batch_size: int, flush_interval: float, directory: Path):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.directory = directory
+
+        self._lock = threading.Lock()
+        self._ready = threading.Condition(self._lock)
+        self._pending: List[Dict[str, Any]] = []
+        self._segment = None
+        self._segments = count()
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+
+    # ---- producer side (request threads)
+    def submit(self, entries: List[Dict[str, Any]]) -> None:
+        if not entries:
+            return
+        with self._lock:
+            self._ensure_started()
+            self._spool(entries)
+            self._pending.extend(entries)
+            if len(self._pending) >= self.batch_size:
+                self._ready.notify()
+
+    def _ensure_started(self) -> None:
+        # (re)start lazily, also in a child forked after the first event
+        if self._thread is not None and self._pid == os.getpid():
+            return
+        self._pid = os.getpid()
+        self._pending = []
+        self._segment = None
+        self._thread = threading.Thread(target=self._run, name="activity-log-writer", daemon=True)
+        self._thread.start()
+
+    def _spool(self, entries: List[Dict[str, Any]]) -> None:
+        try:
+            if self._segment is None:
+                self.directory.mkdir(parents=True, exist_ok=True)
+                name = f"{socket.gethostname()}-{self._pid}-{next(self._segments)}.jsonl"
+                self._segment = open(self.directory / name, "a", encoding="utf-8")
+                fcntl.flock(self._segment, fcntl.LOCK_EX)
+            self._segment.write("".join(dump_entry(e) + "\n" for e in entries))
+            self._segment.flush()
+        except OSError:
+            # still written from memory; only crash-safety is lost
+            logger.exception("Activity log spool unavailable (%s)", self.directory)
+
+    def _take_batch(self):
+        # the segment stays open (and locked) until _write is done with it
+        batch, self._pending = self._pending, []
+        segment, self._segment = self._segment, None
+        return batch, segment
+
+    # ---- consumer side (writer thread)
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                self._ready.wait_for(lambda: len(self._pending) >= self.batch_size, timeout=self.flush_interval)
+                batch, segment = self._take_batch()
+            if batch:
+                self._write(batch, segment)
+            elif segment is not None:
+                segment.close()
+
+    def _write(self, batch: List[Dict[str, Any]], segment) -> None:
+        close_old_connections()
+        try:
+            write_entries(batch)
+        except Exception:
+            # the segment stays on disk (unlocked once closed) for replay_activity_spool
+            logger.exception(
+                "Activity log flush of %s event(s) failed; kept in %s",
+                len(batch), segment.name if segment is not None else None,
+            )
+            connection.close()
+        else:
+            if segment is not None:
+                try:
+                    os.unlink(segment.name)
+                except FileNotFoundError:
+                    pass
+        finally:
+            if segment is not None:
+                segment.close()
+
+    def flush(self) -> None:
+        """Write everything queued in this process now (exit hooks, management commands)."""
+        with self._lock:
+            if self._pid != os.getpid():
+                return
+            batch, segment = self._take_batch()
+        if batch:
+            self._write(batch, segment)
+        elif segment is not None:
+            segment.close()
+
+
+_writer: Optional[ActivityLogWriter] = None
+_writer_lock = threading.Lock()
+
+
+def get_writer() -> ActivityLogWriter:
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = ActivityLogWriter(
+                    batch_size=settings.ACTIVITY_LOG_BATCH_SIZE,
+                    flush_interval=settings.ACTIVITY_LOG_FLUSH_MS / 1000.0,
+                    directory=spool_dir(),
+                )
+                atexit.register(_writer.flush)
+    return _writer
@@ -36,6 +36,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
 
     # Third-party
     "corsheaders",
@@ -48,6 +49,7 @@ INSTALLED_APPS = [
     "procurement",
     "activitylog",
     "contracts",
+    "integrations",
 ]
 
 # ------------------------------------------------------------
@@ -102,12 +104,44 @@ DATABASES = {
     }
 }
 print("Database settings:", DATABASES["default"])
+
+# ------------------------------------------------------------
+# Cache
+# ------------------------------------------------------------
+# Local memory by default; point CACHE_BACKEND/CACHE_LOCATION at a shared cache
+# (e.g. django.core.cache.backends.redis.RedisCache + redis://...) when running
+# several processes, so invalidations (incl. token revocation) reach every
+# worker at once.
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv("CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"),
+        "LOCATION": os.getenv("CACHE_LOCATION", ""),
+    }
+}
 # ------------------------------------------------------------
 # Auth
 # ------------------------------------------------------------
 AUTH_USER_MODEL = "accounts.User"
 AUTH_PASSWORD_VALIDATORS = []
 
+# Hasher for new/updated passwords: pbkdf2 (Django default) | argon2 | bcrypt.
+# argon2 needs `argon2-cffi`, bcrypt needs `bcrypt`. The others stay enabled
+# for verification, and existing hashes are upgraded on the next login.
+_PASSWORD_HASHERS = {
+    "pbkdf2": "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+    "argon2": "django.contrib.auth.hashers.Argon2PasswordHasher",
+    "bcrypt": "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+}
+PASSWORD_HASHER = os.getenv("PASSWORD_HASHER", "pbkdf2").strip().lower()
+if PASSWORD_HASHER not in _PASSWORD_HASHERS:
+    raise ValueError(f"PASSWORD_HASHER must be one of {', '.join(_PASSWORD_HASHERS)}")
+PASSWORD_HASHERS = [_PASSWORD_HASHERS[PASSWORD_HASHER]] + [
+    h for name, h in _PASSWORD_HASHERS.items() if name != PASSWORD_HASHER
+] + [
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.ScryptPasswordHasher",
+]
+
 # ------------------------------------------------------------
 # Internationalization
 # ------------------------------------------------------------
@@ -128,13 +162,29 @@ STATIC_ROOT = BASE_DIR / "staticfiles"
 # ------------------------------------------------------------
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "accounts.authentication.ClaimsJWTAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": (
         "rest_framework.permissions.IsAuthenticated",
     ),
 }
 
+# Authenticated users are resolved from token claims + this per-process cache
+# (seconds). Role/status changes revoke outstanding tokens via token_version:
+# immediately on every worker with a shared CACHES backend, otherwise (LocMem)
+# within this many seconds on the other workers.
+AUTH_USER_CACHE_TTL_SECONDS = int(os.getenv("AUTH_USER_CACHE_TTL_SECONDS", "30"))
+
+# Activity log: buffered writer (activitylog.writer). Events are spooled to
+# ACTIVITY_LOG_SPOOL_DIR until their batch is written; replay leftovers with
+# `manage.py replay_activity_spool`. ACTIVITY_LOG_ASYNC=false writes inline.
+ACTIVITY_LOG_ASYNC = os.getenv("ACTIVITY_LOG_ASYNC", "true").lower() == "true"
+ACTIVITY_LOG_BATCH_SIZE = int(os.getenv("ACTIVITY_LOG_BATCH_SIZE", "200"))
+ACTIVITY_LOG_FLUSH_MS = int(os.getenv("ACTIVITY_LOG_FLUSH_MS", "250"))
+ACTIVITY_LOG_SPOOL_DIR = os.getenv("ACTIVITY_LOG_SPOOL_DIR", str(BASE_DIR / "var" / "activitylog-spool"))
+# Full months kept by `manage.py prune_activity_logs` (drops older month partitions).
+ACTIVITY_LOG_RETENTION_MONTHS = int(os.getenv("ACTIVITY_LOG_RETENTION_MONTHS", "24"))
+
 # ------------------------------------------------------------
 # CORS (frontend is a different service)
 # ------------------------------------------------------------
@@ -214,6 +264,21 @@ GROUP2_CONTRACT_OFFER_URL_TEMPLATE = "http://127.0.0.1:8001/api/public/contracts
 # Existing (you already use something like this in Group2ApiKeyAuthentication)
 GROUP2_API_KEY = "uni-project-2026-secret"
 
+# ------------------------------------------------------------
+# --- Outbound HTTP client (integrations.http_client) ---
+# ------------------------------------------------------------
+# One pooled keep-alive Session per partner host.
+INTEGRATION_HTTP_POOL_CONNECTIONS = int(os.getenv("INTEGRATION_HTTP_POOL_CONNECTIONS", "4"))
+INTEGRATION_HTTP_POOL_MAXSIZE = int(os.getenv("INTEGRATION_HTTP_POOL_MAXSIZE", "20"))
+INTEGRATION_HTTP_CONNECT_TIMEOUT = float(os.getenv("INTEGRATION_HTTP_CONNECT_TIMEOUT", "5"))
+INTEGRATION_HTTP_READ_TIMEOUT = float(os.getenv("INTEGRATION_HTTP_READ_TIMEOUT", "20"))
+# urllib3 retries: connection errors for every method, 502/503/504 for idempotent methods only
+INTEGRATION_HTTP_RETRIES = int(os.getenv("INTEGRATION_HTTP_RETRIES", "2"))
+INTEGRATION_HTTP_BACKOFF_FACTOR = float(os.getenv("INTEGRATION_HTTP_BACKOFF_FACTOR", "0.5"))
+# Circuit breaker: open after N consecutive failures, probe again after M seconds
+INTEGRATION_HTTP_BREAKER_THRESHOLD = int(os.getenv("INTEGRATION_HTTP_BREAKER_THRESHOLD", "5"))
+INTEGRATION_HTTP_BREAKER_RESET_SECONDS = float(os.getenv("INTEGRATION_HTTP_BREAKER_RESET_SECONDS", "30"))
+
 # ------------------------------------------------------------
 # Logging
 # ------------------------------------------------------------
@@ -22,6 +22,7 @@ urlpatterns = [
     path("api/", include("procurement.urls")),
     path("api/", include("activitylog.urls")),
     path("api/", include("contracts.urls")),
+    path("api/", include("integrations.urls")),
 ]
 
 # Catch-all route for React (must be LAST)
@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class ContractsConfig(AppConfig):
     name = 'contracts'
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.18 on 2026-10-16 22:42
+
+import hashlib
+import json
+
+from django.db import migrations, models
+
+
+def backfill_snapshot_hash(apps, schema_editor):
+    # Same hashing as contracts.services.contract_sync.snapshot_hash, so the
+    # first incremental sync after deploy doesn't rewrite every contract.
+    Contract = apps.get_model("contracts", "Contract")
+    for contract in Contract.objects.exclude(external_snapshot=None).only("id", "external_snapshot").iterator():
+        raw = json.dumps(contract.external_snapshot, sort_keys=True, separators=(",", ":"), default=str)
+        contract.external_snapshot_hash = hashlib.sha256(raw.encode("utf-8")).hexdigest()
+        contract.save(update_fields=["external_snapshot_hash"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contracts', '0006_rename_offer_deadline_contract_offer_deadline_at_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ContractSyncState',
+            fields=[
+                ('source', models.CharField(max_length=50, primary_key=True, serialize=False)),
+                ('etag', models.CharField(blank=True, default='', max_length=255)),
+                ('last_modified', models.CharField(blank=True, default='', max_length=64)),
+                ('last_synced_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='contract',
+            name='external_snapshot_hash',
+            field=models.CharField(blank=True, default='', max_length=64),
+        ),
+        migrations.RunPython(backfill_snapshot_hash, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-16 22:49
+
+import hashlib
+import json
+
+from django.db import migrations, models
+
+
+def backfill_config_hash(apps, schema_editor):
+    # Same hashing as contracts.models.config_hash
+    Contract = apps.get_model("contracts", "Contract")
+    for contract in Contract.objects.exclude(config=None).only("id", "config").iterator():
+        raw = json.dumps(contract.config, sort_keys=True, separators=(",", ":"), default=str)
+        contract.config_hash = hashlib.sha256(raw.encode("utf-8")).hexdigest()
+        contract.save(update_fields=["config_hash"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contracts', '0007_contract_sync_watermark'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contract',
+            name='config_hash',
+            field=models.CharField(blank=True, default='', max_length=64),
+        ),
+        migrations.RunPython(backfill_config_hash, migrations.RunPython.noop),
+    ]
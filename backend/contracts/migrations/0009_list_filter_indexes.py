@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contracts', '0008_contract_config_hash'),
+        ('providers', '0002_providermetrics'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contractproviderstatus',
+            index=models.Index(fields=['provider', 'status', 'contract'], name='cps_provider_status_idx'),
+        ),
+    ]
@@ -1,7 +1,35 @@
+import hashlib
+import json
+
 from django.db import models
 from providers.models import Provider
 
 
+def config_hash(config) -> str:
+    """sha256 of a contract config (key order independent); "" when there is none."""
+    if config is None:
+        return ""
+    raw = json.dumps(config, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class ContractQuerySet(models.QuerySet):
+    """Bulk writes of `config` keep config_hash in step, like Contract.save()."""
+
+    def update(self, **kwargs):
+        if "config" in kwargs and not hasattr(kwargs["config"], "resolve_expression"):
+            kwargs["config_hash"] = config_hash(kwargs["config"])
+        return super().update(**kwargs)
+
+    def bulk_update(self, objs, fields, *args, **kwargs):
+        if "config" in fields:
+            objs = list(objs)
+            for obj in objs:
+                obj.config_hash = config_hash(obj.config)
+            fields = [*fields, "config_hash"]
+        return super().bulk_update(objs, fields, *args, **kwargs)
+
+
 class Contract(models.Model):
     """
     Contract snapshot from Group2.
@@ -41,18 +69,52 @@ class Contract(models.Model):
 
     # Canonical validation config (based on Group2.allowedConfiguration)
     config = models.JSONField(null=True, blank=True)
+    # Version of `config`, kept in sync by save(), QuerySet.update(config=...) and
+    # bulk_update (ContractQuerySet); compiled pricing/validation structures are
+    # cached under (id, config_hash). Raw SQL writing config must set it too.
+    config_hash = models.CharField(max_length=64, blank=True, default="")
 
     # Raw full payload from Group2 (audit/debug)
     external_snapshot = models.JSONField(null=True, blank=True)
+    # sha256 of external_snapshot; the Group2 sync skips rows whose hash is unchanged
+    external_snapshot_hash = models.CharField(max_length=64, blank=True, default="")
 
     versions_and_documents = models.JSONField(null=True, blank=True)
 
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = ContractQuerySet.as_manager()
+
+    def save(self, *args, **kwargs):
+        self.config_hash = config_hash(self.config)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "config" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "config_hash"}
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f"{self.id} - {self.title}"
 
 
+class ContractSyncState(models.Model):
+    """
+    Watermark for incremental pulls from an upstream contract source (e.g. "group2").
+
+    - etag / last_modified are replayed as If-None-Match / If-Modified-Since
+    - last_synced_at is the time of the last successful pull
+    """
+
+    source = models.CharField(primary_key=True, max_length=50)
+    etag = models.CharField(max_length=255, blank=True, default="")
+    last_modified = models.CharField(max_length=64, blank=True, default="")
+    last_synced_at = models.DateTimeField(null=True, blank=True)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.source} @ {self.last_synced_at}"
+
+
 class ContractProviderStatus(models.Model):
     """
     Multi-provider link with per-provider status.
@@ -78,6 +140,10 @@ class ContractProviderStatus(models.Model):
 
     class Meta:
         unique_together = ("contract", "provider")
+        indexes = [
+            # entitlements: contracts a provider is ACTIVE on (index-only)
+            models.Index(fields=["provider", "status", "contract"], name="cps_provider_status_idx"),
+        ]
 
     def __str__(self):
         return f"{self.contract_id} - {self.provider_id} ({self.status})"
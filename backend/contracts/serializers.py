@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from .models import Contract, ContractOffer, ContractProviderStatus
+from .services.entitlements import is_active_for_contract
 
 
 class ContractSerializer(serializers.ModelSerializer):
@@ -37,17 +38,35 @@ class ContractSerializer(serializers.ModelSerializer):
             "myProviderStatus",
         ]
 
+    def _my_provider_status(self, obj: Contract):
+        """
+        The caller's ContractProviderStatus for this contract (or None).
+
+        Views prefetch it into `obj.my_provider_statuses` (see
+        with_my_provider_status) so a page of contracts costs one query;
+        otherwise fall back to a single lookup.
+        """
+        req = self.context.get("request")
+        provider_id = getattr(getattr(req, "user", None), "provider_id", None)
+        if not provider_id:
+            return None
+
+        prefetched = getattr(obj, "my_provider_statuses", None)
+        if prefetched is not None:
+            return prefetched[0] if prefetched else None
+
+        cps = ContractProviderStatus.objects.filter(contract=obj, provider_id=provider_id).first()
+        obj.my_provider_statuses = [cps] if cps else []
+        return cps
+
     def get_isAwardedToMyProvider(self, obj: Contract):
         req = self.context.get("request")
-        if not req or not getattr(req.user, "provider_id", None):
+        if not getattr(getattr(req, "user", None), "provider_id", None):
             return False
-        return ContractProviderStatus.objects.filter(contract=obj, provider_id=req.user.provider_id, status="ACTIVE").exists()
+        return is_active_for_contract(req, obj.id)
 
     def get_myProviderStatus(self, obj: Contract):
-        req = self.context.get("request")
-        if not req or not getattr(req.user, "provider_id", None):
-            return None
-        cps = ContractProviderStatus.objects.filter(contract=obj, provider_id=req.user.provider_id).first()
+        cps = self._my_provider_status(obj)
         if not cps:
             return None
         return {
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Tuple
+
+from contracts.models import config_hash
+
+
+class CompiledConfigCache:
+    """
+    In-process LRU of structures compiled from Contract.config.
+
+    Keyed on (contract id, config_hash): a changed config is simply a new key,
+    so a stale entry can never be served. The stored hash is read, not
+    recomputed, so a lookup stays O(1) however big the config is;
+    Contract.save() and ContractQuerySet keep it current. `evict` lets the
+    contract sync drop superseded versions right away instead of waiting for
+    LRU pressure.
+    """
+
+    def __init__(self, build: Callable[[Dict[str, Any]], Any], maxsize: int = 256):
+        self._build = build
+        self._maxsize = maxsize
+        self._entries: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, contract) -> Any:
+        # config_hash(...) only for unsaved contracts; "" is also the hash of no config
+        version = contract.config_hash or config_hash(contract.config)
+        key = (contract.id, version)
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+
+        compiled = self._build(contract.config if isinstance(contract.config, dict) else {})
+
+        with self._lock:
+            self._entries[key] = compiled
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+        return compiled
+
+    def evict(self, contract_ids: Iterable[str]) -> None:
+        ids = set(contract_ids)
+        with self._lock:
+            for key in [k for k in self._entries if k[0] in ids]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
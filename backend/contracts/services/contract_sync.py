@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Dict, Iterable
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from contracts.models import Contract, ContractSyncState
+from contracts.services.contract_validation import evict_contract_rules
+from contracts.services.pricing import evict_rate_indexes
+from integrations import http_client
+
+
+GROUP2_SOURCE = "group2"
+
+
+class Group2SyncError(RuntimeError):
+    pass
+
+
+def snapshot_hash(item: Dict[str, Any]) -> str:
+    """Stable sha256 of a Group2 contract payload (key order independent)."""
+    raw = json.dumps(item, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def map_group2_contract(item: dict) -> Dict[str, Any]:
+    """Maps a Group2 contract payload -> Contract defaults (everything but id)."""
+    kind = (item.get("kind") or "").upper()
+    publishing_date = parse_date(item.get("publishingDate")) if item.get("publishingDate") else None
+    offer_deadline_at = parse_datetime(item.get("offerDeadlineAt")) if item.get("offerDeadlineAt") else None
+
+    return {
+        "title": item.get("title") or "",
+        "kind": kind or "SERVICE",
+        "status": (item.get("status") or "DRAFT").upper(),
+        "publishing_date": publishing_date,
+        "offer_deadline_at": offer_deadline_at,
+        "stakeholders": item.get("stakeholders"),
+        "scope_of_work": item.get("scopeOfWork") or "",
+        "terms_and_conditions": item.get("termsAndConditions") or "",
+        "weighting": item.get("weighting"),
+        "config": item.get("allowedConfiguration"),
+        "versions_and_documents": item.get("versionsAndDocuments"),
+        "external_snapshot": item,
+        "external_snapshot_hash": snapshot_hash(item),
+    }
+
+
+@dataclass
+class ContractSyncResult:
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    skipped: int = 0
+    not_modified: bool = False
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "inserted": self.inserted,
+            "updated": self.updated,
+            "unchanged": self.unchanged,
+            "skipped": self.skipped,
+            "notModified": self.not_modified,
+            # kept for older clients
+            "upserted": self.inserted + self.updated,
+        }
+
+
+def apply_group2_contracts(items: Iterable[Any]) -> ContractSyncResult:
+    """
+    Upsert Group2 contracts, touching only the ones whose snapshot changed.
+
+    Stored hashes for all incoming ids are loaded in ONE query; unchanged
+    contracts cost nothing, so a sync is ~1 + (changed contracts) queries.
+    """
+    result = ContractSyncResult()
+
+    incoming: Dict[str, Dict[str, Any]] = {}
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+
+        if (item.get("kind") or "").upper() == "HARDWARE":
+            result.skipped += 1
+            continue
+
+        cid = item.get("contractId") or item.get("id")
+        if not cid:
+            continue
+        incoming[str(cid)] = item
+
+    if not incoming:
+        return result
+
+    stored_hashes = dict(
+        Contract.objects.filter(id__in=list(incoming.keys())).values_list("id", "external_snapshot_hash")
+    )
+
+    changed_ids = []
+    with transaction.atomic():
+        for cid, item in incoming.items():
+            defaults = map_group2_contract(item)
+            if cid in stored_hashes and stored_hashes[cid] == defaults["external_snapshot_hash"]:
+                result.unchanged += 1
+                continue
+
+            Contract.objects.update_or_create(id=cid, defaults=defaults)
+            changed_ids.append(cid)
+            if cid in stored_hashes:
+                result.updated += 1
+            else:
+                result.inserted += 1
+
+        if changed_ids:
+            # drop superseded compiled rules/rate indexes in this process
+            transaction.on_commit(partial(evict_compiled_contract_config, changed_ids))
+
+    return result
+
+
+def evict_compiled_contract_config(contract_ids) -> None:
+    evict_contract_rules(contract_ids)
+    evict_rate_indexes(contract_ids)
+
+
+def _conditional_headers(state: ContractSyncState) -> Dict[str, str]:
+    headers = {}
+    if state.etag:
+        headers["If-None-Match"] = state.etag
+    if state.last_modified:
+        headers["If-Modified-Since"] = state.last_modified
+    return headers
+
+
+def sync_group2_contracts(*, force: bool = False) -> ContractSyncResult:
+    """
+    Incremental pull from settings.GROUP2_CONTRACTS_URL.
+
+    The ETag / Last-Modified of the previous pull are sent back; a 304 ends
+    the sync without touching the database. `force=True` drops the watermark
+    (full re-check; per-contract hashes still skip unchanged rows).
+    """
+    state, _ = ContractSyncState.objects.get_or_create(source=GROUP2_SOURCE)
+    headers = {} if force else _conditional_headers(state)
+
+    resp = http_client.get(settings.GROUP2_CONTRACTS_URL, headers=headers)
+
+    if resp.status_code == 304:
+        state.last_synced_at = timezone.now()
+        state.save(update_fields=["last_synced_at", "updated_at"])
+        return ContractSyncResult(not_modified=True)
+
+    if resp.status_code >= 400:
+        raise Group2SyncError(f"Group2 returned {resp.status_code}")
+
+    data = resp.json()
+    if not isinstance(data, list):
+        raise Group2SyncError("Invalid payload from Group2 (expected list).")
+
+    result = apply_group2_contracts(data)
+
+    # Only advance the watermark once the rows are written.
+    state.etag = resp.headers.get("ETag", "")
+    state.last_modified = resp.headers.get("Last-Modified", "")
+    state.last_synced_at = timezone.now()
+    state.save(update_fields=["etag", "last_modified", "last_synced_at", "updated_at"])
+    return result
+
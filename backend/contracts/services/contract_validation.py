@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Tuple
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from .compiled_cache import CompiledConfigCache
 
 
 class ContractValidationError(ValueError):
@@ -79,6 +82,109 @@ def get_accepted_types(cfg: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
     return out
 
 
+@dataclass(frozen=True)
+class AcceptedType:
+    is_accepted: bool
+    bidding_deadline_days: int
+    offer_cycles: int
+
+
+@dataclass(frozen=True)
+class ContractRules:
+    """
+    Contract.config (Group2.allowedConfiguration) compiled for validation:
+    allowed values as frozensets and accepted SR types as a dict.
+
+    Built once per (contract, config_hash) - see get_contract_rules().
+    An empty allowed set means "not restricted by the contract".
+    """
+
+    accepted_types: Dict[str, AcceptedType]
+    domains: FrozenSet[str]
+    roles: FrozenSet[str]
+    experience_levels: FrozenSet[str]
+    technology_levels: FrozenSet[str]
+
+    @classmethod
+    def compile(cls, config: Dict[str, Any]) -> "ContractRules":
+        accepted: Dict[str, AcceptedType] = {}
+        for t, item in get_accepted_types(config).items():
+            try:
+                deadline_days = int(item.get("biddingDeadlineDays") or 0)
+            except (TypeError, ValueError):
+                deadline_days = 0
+            try:
+                cycles = int(item.get("offerCycles") or 1)
+            except (TypeError, ValueError):
+                cycles = 1
+            accepted[t] = AcceptedType(
+                is_accepted=bool(item.get("isAccepted", True)),
+                bidding_deadline_days=max(deadline_days, 0),
+                offer_cycles=cycles if cycles in (1, 2) else 1,
+            )
+
+        return cls(
+            accepted_types=accepted,
+            domains=frozenset(_list_str(config.get("domains"))),
+            roles=frozenset(_list_str(config.get("roles"))),
+            experience_levels=frozenset(normalize_experience(x) for x in _list_str(config.get("experienceLevels"))),
+            technology_levels=frozenset(_list_str(config.get("technologyLevels"))),
+        )
+
+    def validate_service_request(
+        self,
+        *,
+        sr_type: str,
+        roles: List[Dict[str, Any]],
+        must_have: List[Any],
+        nice_to_have: List[Any],
+    ) -> Tuple[int, int]:
+        """
+        Returns (biddingDeadlineDays, offerCycles).
+        """
+        sr_type = normalize_sr_type(sr_type)
+        accepted = self.accepted_types.get(sr_type)
+        if accepted is None or not accepted.is_accepted:
+            raise ContractValidationError(f"Service request type '{sr_type}' is not accepted by the contract.")
+
+        # Limits
+        if len(must_have) > 3:
+            raise ContractValidationError("Must-have criteria cannot exceed 3.")
+        if len(nice_to_have) > 5:
+            raise ContractValidationError("Nice-to-have criteria cannot exceed 5.")
+
+        # Domain/role/experience checks using roles[]
+        for r in roles or []:
+            if not isinstance(r, dict):
+                continue
+            dom = _norm(r.get("domain"))
+            role_name = _norm(r.get("roleName"))
+            exp = normalize_experience(r.get("experienceLevel"))
+
+            if self.domains and dom and dom not in self.domains:
+                raise ContractValidationError(f"Domain '{dom}' not allowed by contract.")
+            if self.roles and role_name and role_name not in self.roles:
+                raise ContractValidationError(f"Role '{role_name}' not allowed by contract.")
+            if self.experience_levels and exp and exp not in self.experience_levels:
+                raise ContractValidationError(f"Experience level '{exp}' not allowed by contract.")
+
+        return accepted.bidding_deadline_days, accepted.offer_cycles
+
+
+_contract_rules = CompiledConfigCache(ContractRules.compile)
+
+
+def get_contract_rules(contract) -> ContractRules:
+    """Compiled once per (contract, config version), then served from memory."""
+    if not isinstance(contract.config, dict):
+        raise ContractValidationError("Contract allowedConfiguration is missing.")
+    return _contract_rules.get(contract)
+
+
+def evict_contract_rules(contract_ids) -> None:
+    _contract_rules.evict(contract_ids)
+
+
 def validate_sr_against_contract(
     *,
     contract_config: Optional[Dict[str, Any]],
@@ -89,51 +195,18 @@ def validate_sr_against_contract(
 ) -> Tuple[int, int]:
     """
     Returns (biddingDeadlineDays, offerCycles).
+    One-off validation against a raw config; callers holding a Contract should
+    use get_contract_rules(contract).validate_service_request(...).
     """
     if not isinstance(contract_config, dict):
         raise ContractValidationError("Contract allowedConfiguration is missing.")
 
-    accepted_map = get_accepted_types(contract_config)
-    sr_type = normalize_sr_type(sr_type)
-
-    if sr_type not in accepted_map or not bool(accepted_map[sr_type].get("isAccepted", True)):
-        raise ContractValidationError(f"Service request type '{sr_type}' is not accepted by the contract.")
-
-    # Limits
-    if len(must_have) > 3:
-        raise ContractValidationError("Must-have criteria cannot exceed 3.")
-    if len(nice_to_have) > 5:
-        raise ContractValidationError("Nice-to-have criteria cannot exceed 5.")
-
-    # Optional domain/role checks using roles[]
-    allowed_domains = _list_str(contract_config.get("domains"))
-    allowed_roles = _list_str(contract_config.get("roles"))
-    allowed_exps = _list_str(contract_config.get("experienceLevels"))
-    allowed_tech = _list_str(contract_config.get("technologyLevels"))
-
-    for r in roles or []:
-        if not isinstance(r, dict):
-            continue
-        dom = _norm(r.get("domain"))
-        role_name = _norm(r.get("roleName"))
-        exp = normalize_experience(r.get("experienceLevel"))
-        tech = _norm(r.get("technology"))
-
-        '''
-        if allowed_domains and dom and dom not in allowed_domains:
-            raise ContractValidationError(f"Domain '{dom}' not allowed by contract.")
-        if allowed_roles and role_name and role_name not in allowed_roles:
-            raise ContractValidationError(f"Role '{role_name}' not allowed by contract.")
-        if allowed_exps and exp and exp not in allowed_exps:
-            raise ContractValidationError(f"Experience level '{exp}' not allowed by contract.")
-        '''
-
-    deadline_days = int(accepted_map[sr_type].get("biddingDeadlineDays") or 0)
-    cycles = int(accepted_map[sr_type].get("offerCycles") or 1)
-    if cycles not in (1, 2):
-        cycles = 1
-
-    return max(deadline_days, 0), cycles
+    return ContractRules.compile(contract_config).validate_service_request(
+        sr_type=sr_type,
+        roles=roles,
+        must_have=must_have,
+        nice_to_have=nice_to_have,
+    )
 
 
 def find_max_daily_rate(
@@ -143,23 +216,11 @@ def find_max_daily_rate(
     experience_level: str,
     technology_level: str,
 ) -> Optional[float]:
-    pr = contract_config.get("pricingRules") or {}
-    if not isinstance(pr, dict):
-        return None
-    matrix = pr.get("maxDailyRates") or []
-    if not isinstance(matrix, list):
-        return None
-
-    role = _norm(role)
-    experience_level = normalize_experience(experience_level)
-    technology_level = _norm(technology_level)
-
-    for row in matrix:
-        if not isinstance(row, dict):
-            continue
-        if _norm(row.get("role")) == role and normalize_experience(row.get("experienceLevel")) == experience_level and _norm(row.get("technologyLevel")) == technology_level:
-            try:
-                return float(row.get("maxDailyRate"))
-            except Exception:
-                return None
-    return None
+    """
+    One-off lookup on a raw config. Callers holding a Contract should use
+    contracts.services.pricing.get_rate_index(contract), which is compiled once.
+    """
+    from .pricing import RateIndex
+
+    cap = RateIndex.compile(contract_config).max_daily_rate(role, experience_level, technology_level)
+    return float(cap) if cap is not None else None
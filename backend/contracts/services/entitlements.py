@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from typing import FrozenSet, Optional
+
+from django.core.cache import cache
+
+from contracts.models import ContractProviderStatus
+
+
+# Shared cache entry per provider; bounded staleness even if an invalidation is lost.
+CACHE_TTL_SECONDS = 300
+_REQUEST_ATTR = "_active_contract_ids"
+
+
+def _cache_key(provider_id: str) -> str:
+    return f"entitlements:active-contracts:v1:{provider_id}"
+
+
+def provider_active_contract_ids(provider_id: Optional[str]) -> FrozenSet[str]:
+    """
+    Ids of contracts the provider is ACTIVE for (ContractProviderStatus.status=ACTIVE).
+    Backed by the shared cache; invalidated by contracts.signals on every write.
+    """
+    if not provider_id:
+        return frozenset()
+
+    key = _cache_key(provider_id)
+    ids = cache.get(key)
+    if ids is None:
+        ids = list(
+            ContractProviderStatus.objects.filter(provider_id=provider_id, status="ACTIVE")
+            .values_list("contract_id", flat=True)
+        )
+        cache.set(key, ids, CACHE_TTL_SECONDS)
+    return frozenset(ids)
+
+
+def active_contract_ids_for(request) -> FrozenSet[str]:
+    """
+    Same as provider_active_contract_ids for request.user's provider, memoized
+    on the request so one request never asks twice.
+    """
+    ids = getattr(request, _REQUEST_ATTR, None)
+    if ids is None:
+        ids = provider_active_contract_ids(getattr(request.user, "provider_id", None))
+        setattr(request, _REQUEST_ATTR, ids)
+    return ids
+
+
+def is_active_for_contract(request, contract_id: Optional[str]) -> bool:
+    return bool(contract_id) and contract_id in active_contract_ids_for(request)
+
+
+def invalidate_provider_entitlements(provider_id: Optional[str]) -> None:
+    if provider_id:
+        cache.delete(_cache_key(provider_id))
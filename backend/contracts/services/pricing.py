@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from decimal import Decimal
+from itertools import product
+from typing import Any, Dict, List, Optional, Tuple
+
+from .compiled_cache import CompiledConfigCache
+from .contract_validation import ContractValidationError, normalize_experience
+
+
+WILDCARD = "*"
+
+RateKey = Tuple[str, str, str]
+
+
+def _key_part(value: Any) -> str:
+    v = str(value or "").strip()
+    return WILDCARD if v == WILDCARD else v.casefold()
+
+
+def rate_key(role: Any, experience_level: Any, technology_level: Any) -> RateKey:
+    return (_key_part(role), _key_part(normalize_experience(experience_level)), _key_part(technology_level))
+
+
+# Lookup order for a (role, experience, technology) key: exact first, then
+# progressively more "*" (technology generalizes first, role last).
+_PROBES = sorted(product((False, True), repeat=3), key=lambda m: (sum(m), m[0], m[1]))
+
+
+class RateIndex:
+    """
+    pricingRules.maxDailyRates compiled into a dict:
+      (role, experienceLevel, technologyLevel) -> max daily rate
+    Rows may use "*" for any part. A lookup is at most 8 dict probes,
+    independent of the size of the matrix.
+    """
+
+    def __init__(self, rates: Dict[RateKey, Decimal], currency: str = ""):
+        self.rates = rates
+        self.currency = currency
+
+    @classmethod
+    def compile(cls, config: Dict[str, Any]) -> "RateIndex":
+        pr = config.get("pricingRules") or {}
+        if not isinstance(pr, dict):
+            return cls({})
+        matrix = pr.get("maxDailyRates") or []
+        if not isinstance(matrix, list):
+            matrix = []
+
+        rates: Dict[RateKey, Decimal] = {}
+        for row in matrix:
+            if not isinstance(row, dict):
+                continue
+            try:
+                cap = Decimal(str(row.get("maxDailyRate")))
+            except Exception:
+                continue
+            key = rate_key(row.get("role"), row.get("experienceLevel"), row.get("technologyLevel"))
+            # first row wins, like the old linear scan
+            rates.setdefault(key, cap)
+        return cls(rates, str(pr.get("currency") or ""))
+
+    def max_daily_rate(self, role: Any, experience_level: Any, technology_level: Any) -> Optional[Decimal]:
+        if not self.rates:
+            return None
+        key = rate_key(role, experience_level, technology_level)
+        for mask in _PROBES:
+            probe = tuple(WILDCARD if wild else part for wild, part in zip(mask, key))
+            cap = self.rates.get(probe)
+            if cap is not None:
+                return cap
+        return None
+
+
+_rate_indexes = CompiledConfigCache(RateIndex.compile)
+
+
+def get_rate_index(contract) -> RateIndex:
+    """Compiled once per (contract, config version), then served from memory."""
+    return _rate_indexes.get(contract)
+
+
+def evict_rate_indexes(contract_ids) -> None:
+    _rate_indexes.evict(contract_ids)
+
+
+# ------------------------------------------------------------------
+# Offer pricing
+# ------------------------------------------------------------------
+@dataclass
+class PricedLine:
+    user_id: str
+    role_index: int
+    daily_rate: Decimal
+    travelling_cost: Decimal
+    man_days: Decimal
+    onsite_days: Decimal
+    specialist_cost: Decimal
+    max_daily_rate: Optional[Decimal]
+
+
+def _decimal(v: Any) -> Decimal:
+    try:
+        return Decimal(str(v or 0))
+    except Exception:
+        return Decimal("0")
+
+
+def default_role_indexes(sr_type: str, roles: List[Any], lines: List[Dict[str, Any]]) -> List[int]:
+    """
+    roleIndex for every line: explicit values are kept; missing ones default to
+    role 0 (SINGLE/MULTI) or the first role not yet covered (TEAM).
+    """
+    explicit = [l.get("roleIndex") for l in lines]
+    if str(sr_type).upper() != "TEAM" or not roles:
+        return [0 if i is None else int(i) for i in explicit]
+
+    used = {int(i) for i in explicit if i is not None}
+    out = []
+    for i in explicit:
+        if i is None:
+            i = next((r for r in range(len(roles)) if r not in used), 0)
+            used.add(i)
+        out.append(int(i))
+    return out
+
+
+def price_offer_lines(contract, sr, lines: List[Dict[str, Any]]) -> Tuple[List[PricedLine], Decimal]:
+    """
+    Price every specialist against the SR role it fills (roleIndex) and
+    enforce the contract's max daily rate for that role.
+
+    lines: validated specialist input ({userId, dailyRate, travellingCost,
+    specialistCost?, roleIndex?}). O(len(lines)) lookups, whatever the size
+    of the pricing matrix. Raises ContractValidationError on a cap breach or
+    an invalid roleIndex.
+    """
+    roles = sr.roles if isinstance(sr.roles, list) else []
+    roles = [r if isinstance(r, dict) else {} for r in roles]
+    index = get_rate_index(contract)
+
+    role_indexes = default_role_indexes(sr.type, roles, lines)
+    if str(sr.type).upper() == "MULTI" and len(set(role_indexes)) > 1:
+        raise ContractValidationError("MULTI request: all selected specialists must be the same role.")
+
+    priced: List[PricedLine] = []
+    total = Decimal("0")
+    for line, role_index in zip(lines, role_indexes):
+        if roles and not (0 <= role_index < len(roles)):
+            raise ContractValidationError(f"roleIndex {role_index} is out of range for this request.")
+        role = roles[role_index] if roles else {}
+
+        daily = _decimal(line.get("dailyRate"))
+        travel = _decimal(line.get("travellingCost"))
+        man_days = _decimal(role.get("manDays"))
+        onsite_days = _decimal(role.get("onsiteDays"))
+
+        cap = index.max_daily_rate(role.get("roleName"), role.get("experienceLevel"), role.get("technology"))
+        if cap is not None and daily > cap:
+            raise ContractValidationError(
+                f"Daily rate {daily} for '{role.get('roleName') or 'role'}' exceeds the contract maximum of "
+                f"{cap}{' ' + index.currency if index.currency else ''}."
+            )
+
+        sc = line.get("specialistCost")
+        specialist_cost = _decimal(sc) if sc is not None else (daily * man_days) + (travel * onsite_days)
+        total += specialist_cost
+
+        priced.append(
+            PricedLine(
+                user_id=line["userId"],
+                role_index=role_index,
+                daily_rate=daily,
+                travelling_cost=travel,
+                man_days=man_days,
+                onsite_days=onsite_days,
+                specialist_cost=specialist_cost,
+                max_daily_rate=cap,
+            )
+        )
+    return priced, total
@@ -0,0 +1,24 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from contracts.models import ContractProviderStatus
+from contracts.services.entitlements import invalidate_provider_entitlements
+
+
+def _schedule_invalidation(provider_id):
+    # after commit: a concurrent read before commit would re-cache the old set
+    transaction.on_commit(partial(invalidate_provider_entitlements, provider_id))
+
+
+@receiver(post_save, sender=ContractProviderStatus)
+def contract_provider_status_saved(sender, instance, **kwargs):
+    # Group2SetProviderStatusView, the offer-decision webhook, seeds, admin ...
+    _schedule_invalidation(instance.provider_id)
+
+
+@receiver(post_delete, sender=ContractProviderStatus)
+def contract_provider_status_deleted(sender, instance, **kwargs):
+    _schedule_invalidation(instance.provider_id)
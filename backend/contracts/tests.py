@@ -1,3 +1,33 @@
+from unittest import mock
+
 from django.test import TestCase
 
-# Create your tests here.
+from .models import Contract, config_hash
+from .services.compiled_cache import CompiledConfigCache
+
+
+class CompiledConfigCacheTests(TestCase):
+    def test_lookup_uses_the_stored_hash(self):
+        contract = Contract.objects.create(id="C970", title="Contract", config={"rate": 1})
+        cache = CompiledConfigCache(lambda config: config["rate"])
+        self.assertEqual(cache.get(contract), 1)
+
+        with mock.patch("contracts.services.compiled_cache.config_hash") as rehash:
+            self.assertEqual(cache.get(contract), 1)
+        rehash.assert_not_called()
+
+    def test_bulk_config_writes_keep_the_hash_current(self):
+        contract = Contract.objects.create(id="C971", title="Contract", config={"rate": 1})
+        cache = CompiledConfigCache(lambda config: config["rate"])
+        self.assertEqual(cache.get(contract), 1)
+
+        Contract.objects.filter(pk=contract.pk).update(config={"rate": 2})
+        contract.refresh_from_db()
+        self.assertEqual(contract.config_hash, config_hash({"rate": 2}))
+        self.assertEqual(cache.get(contract), 2)
+
+        contract.config = {"rate": 3}
+        Contract.objects.bulk_update([contract], ["config"])
+        contract.refresh_from_db()
+        self.assertEqual(contract.config_hash, config_hash({"rate": 3}))
+        self.assertEqual(cache.get(contract), 3)
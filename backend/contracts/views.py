@@ -1,8 +1,8 @@
 import requests
 from django.conf import settings
 from django.db import transaction
+from django.db.models import Prefetch
 from django.utils import timezone
-from django.utils.dateparse import parse_date, parse_datetime
 
 from rest_framework import generics, status
 from rest_framework.permissions import IsAuthenticated, AllowAny
@@ -18,7 +18,9 @@ from .serializers import (
     Group2ProviderStatusSerializer,
 )
 from .auth import Group2ApiKeyAuthentication
+from .services.contract_sync import Group2SyncError, sync_group2_contracts
 from activitylog.utils import log_activity
+from integrations import http_client
 
 
 def _can_view_contract(user, contract: Contract) -> bool:
@@ -34,12 +36,28 @@ def _group2_offer_url(contract_id: str) -> str:
     return tpl.format(contract_id=contract_id)
 
 
+def with_my_provider_status(qs, provider_id):
+    """
+    Prefetch only the caller's ContractProviderStatus row per contract into
+    `contract.my_provider_statuses` (used by ContractSerializer), so listing
+    N contracts costs one extra query instead of 2N.
+    """
+    return qs.prefetch_related(
+        Prefetch(
+            "provider_statuses",
+            queryset=ContractProviderStatus.objects.filter(provider_id=provider_id),
+            to_attr="my_provider_statuses",
+        )
+    )
+
+
 class ContractListView(generics.ListAPIView):
     serializer_class = ContractSerializer
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
-        return Contract.objects.exclude(status="DRAFT").order_by("-publishing_date", "-created_at")
+        qs = Contract.objects.exclude(status="DRAFT").order_by("-publishing_date", "-created_at")
+        return with_my_provider_status(qs, self.request.user.provider_id)
 
 
 class ContractDetailView(generics.RetrieveAPIView):
@@ -48,7 +66,8 @@ class ContractDetailView(generics.RetrieveAPIView):
     lookup_field = "id"
 
     def get_queryset(self):
-        return Contract.objects.exclude(status="DRAFT")
+        qs = Contract.objects.exclude(status="DRAFT")
+        return with_my_provider_status(qs, self.request.user.provider_id)
 
 
 class ContractOfferListCreateView(generics.ListCreateAPIView):
@@ -145,7 +164,7 @@ class ContractOfferListCreateView(generics.ListCreateAPIView):
             headers["GROUP2-API-KEY"] = api_key
 
         try:
-            resp = requests.post(url, json=outbound_payload, headers=headers, timeout=20)
+            resp = http_client.post(url, json=outbound_payload, headers=headers)
         except Exception as e:
             raise ValidationError(f"Failed to reach Group2 offer endpoint: {e}")
 
@@ -183,6 +202,9 @@ class Group2SyncContractsView(APIView):
     """
     Manual pull-sync contracts from Group2.
     Uses settings.GROUP2_CONTRACTS_URL.
+
+    Incremental: conditional request against the stored watermark, and only
+    contracts whose snapshot hash changed are written. ?force=1 ignores the watermark.
     """
     permission_classes = [IsAuthenticated]
 
@@ -190,66 +212,26 @@ class Group2SyncContractsView(APIView):
         if request.user.role not in ["Provider Admin", "Contract Coordinator"]:
             raise PermissionDenied("Not allowed.")
 
-        url = settings.GROUP2_CONTRACTS_URL
-        resp = requests.get(url, timeout=20)
-        print(resp.status_code, resp.text)
-        if resp.status_code >= 400:
-            return Response({"detail": f"Group2 returned {resp.status_code}"}, status=502)
-
-        data = resp.json()
-        if not isinstance(data, list):
-            return Response({"detail": "Invalid payload from Group2 (expected list)."}, status=502)
-
-        upserted = 0
-        skipped = 0
-
-        for item in data:
-            if not isinstance(item, dict):
-                continue
-
-            kind = (item.get("kind") or "").upper()
-            if kind == "HARDWARE":
-                skipped += 1
-                continue
-
-            cid = item.get("contractId") or item.get("id")
-            if not cid:
-                continue
-
-            publishing_date = parse_date(item.get("publishingDate")) if item.get("publishingDate") else None
-            offer_deadline_at = parse_datetime(item.get("offerDeadlineAt")) if item.get("offerDeadlineAt") else None
-
-            print("Upserting contract", cid)
-            Contract.objects.update_or_create(
-                id=str(cid),
-                defaults={
-                    "title": item.get("title") or "",
-                    "kind": kind or "SERVICE",
-                    "status": (item.get("status") or "DRAFT").upper(),
-                    "publishing_date": publishing_date,
-                    "offer_deadline_at": offer_deadline_at,
-                    "stakeholders": item.get("stakeholders"),
-                    "scope_of_work": item.get("scopeOfWork") or "",
-                    "terms_and_conditions": item.get("termsAndConditions") or "",
-                    "weighting": item.get("weighting"),
-                    "config": item.get("allowedConfiguration"),
-                    "versions_and_documents": item.get("versionsAndDocuments"),
-                    "external_snapshot": item,
-                },
+        force = str(request.query_params.get("force", "")).lower() in ("1", "true", "yes")
+        try:
+            result = sync_group2_contracts(force=force)
+        except (Group2SyncError, requests.RequestException) as e:
+            return Response({"detail": str(e)}, status=502)
+
+        if not result.not_modified:
+            log_activity(
+                provider_id=request.user.provider_id,
+                actor_type="USER",
+                actor_user=request.user,
+                event_type="GROUP2_SYNC_CONTRACTS",
+                entity_type="Contract",
+                entity_id="*",
+                message=(
+                    f"Synced contracts from Group2: inserted={result.inserted}, updated={result.updated}, "
+                    f"unchanged={result.unchanged}, skipped={result.skipped}"
+                ),
             )
-            upserted += 1
-
-        log_activity(
-            provider_id=request.user.provider_id,
-            actor_type="USER",
-            actor_user=request.user,
-            event_type="GROUP2_SYNC_CONTRACTS",
-            entity_type="Contract",
-            entity_id="*",
-            message=f"Synced contracts from Group2: upserted={upserted}, skipped={skipped}",
-        )
-        print("Synced contracts from Group2: upserted=", upserted, "skipped=", skipped)
-        return Response({"upserted": upserted, "skipped": skipped})
+        return Response(result.as_dict())
 
 
 class Group2SetProviderStatusView(APIView):
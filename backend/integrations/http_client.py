@@ -0,0 +1,156 @@
+"""
+Shared HTTP client for partner integrations (Group2, Group3).
+
+- one keep-alive `requests.Session` per host (scheme://host:port), so repeated
+  bids / change requests reuse the TCP+TLS connection
+- pool sizes, (connect, read) timeouts and urllib3 retries from settings
+  (INTEGRATION_HTTP_*)
+- a per-host circuit breaker: after N consecutive failures calls fail fast
+  with CircuitOpenError until the reset window passes, then exactly one probe
+  is let through (half-open) while concurrent calls keep failing fast; its
+  outcome closes or re-opens the circuit
+
+CircuitOpenError subclasses requests.ConnectionError, so existing
+`except requests.RequestException` handlers keep working.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+class CircuitOpenError(requests.ConnectionError):
+    pass
+
+
+class CircuitBreaker:
+    def __init__(self, threshold: int, reset_seconds: float):
+        self.threshold = threshold
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.probing = False
+        self._lock = threading.Lock()
+
+    def before_call(self, host: str) -> bool:
+        """Raise CircuitOpenError, or return whether this call is the half-open probe."""
+        with self._lock:
+            if self.opened_at is None:
+                return False
+            if self.probing or time.monotonic() - self.opened_at < self.reset_seconds:
+                raise CircuitOpenError(f"Circuit open for {host}; failing fast.")
+            # half-open: this call is the single probe; the circuit stays open for everyone else
+            self.probing = True
+            return True
+
+    def record_success(self, probe: bool = False) -> None:
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            if probe:
+                self.probing = False
+
+    def record_failure(self, probe: bool = False) -> None:
+        with self._lock:
+            self.failures += 1
+            if probe or self.failures >= self.threshold:
+                self.opened_at = time.monotonic()
+            if probe:
+                self.probing = False
+
+    def release_probe(self) -> None:
+        """The probe ended without an HTTP outcome (e.g. a bug in the caller); let the next call probe."""
+        with self._lock:
+            self.probing = False
+
+
+_sessions: Dict[str, requests.Session] = {}
+_breakers: Dict[str, CircuitBreaker] = {}
+_lock = threading.Lock()
+
+
+def _host_key(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}".lower()
+
+
+def _build_session() -> requests.Session:
+    retry = Retry(
+        total=settings.INTEGRATION_HTTP_RETRIES,
+        connect=settings.INTEGRATION_HTTP_RETRIES,
+        read=0,
+        status=settings.INTEGRATION_HTTP_RETRIES,
+        status_forcelist=(502, 503, 504),
+        backoff_factor=settings.INTEGRATION_HTTP_BACKOFF_FACTOR,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=settings.INTEGRATION_HTTP_POOL_CONNECTIONS,
+        pool_maxsize=settings.INTEGRATION_HTTP_POOL_MAXSIZE,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _for_host(url: str) -> tuple[requests.Session, CircuitBreaker, str]:
+    key = _host_key(url)
+    with _lock:
+        session = _sessions.get(key)
+        if session is None:
+            session = _sessions[key] = _build_session()
+            _breakers[key] = CircuitBreaker(
+                settings.INTEGRATION_HTTP_BREAKER_THRESHOLD,
+                settings.INTEGRATION_HTTP_BREAKER_RESET_SECONDS,
+            )
+        return session, _breakers[key], key
+
+
+def default_timeout() -> tuple[float, float]:
+    return (settings.INTEGRATION_HTTP_CONNECT_TIMEOUT, settings.INTEGRATION_HTTP_READ_TIMEOUT)
+
+
+def request(method: str, url: str, *, timeout=None, **kwargs) -> requests.Response:
+    session, breaker, host = _for_host(url)
+    probe = breaker.before_call(host)
+    try:
+        resp = session.request(method, url, timeout=timeout or default_timeout(), **kwargs)
+    except requests.RequestException:
+        breaker.record_failure(probe)
+        raise
+    except BaseException:
+        if probe:
+            breaker.release_probe()
+        raise
+
+    if resp.status_code >= 500:
+        breaker.record_failure(probe)
+    else:
+        breaker.record_success(probe)
+    return resp
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    return request("GET", url, **kwargs)
+
+
+def post(url: str, **kwargs) -> requests.Response:
+    return request("POST", url, **kwargs)
+
+
+def reset() -> None:
+    """Drop pooled sessions and breaker state (tests, settings changes)."""
+    with _lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+        _breakers.clear()
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import logging
+import os
+import socket
+from datetime import timedelta
+from typing import Any, Callable, Dict, Optional
+
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from .models import SyncJob
+
+logger = logging.getLogger(__name__)
+
+
+# kind -> dotted path of handler(job, report) -> result dict
+# (dotted paths so this module does not import every app)
+JOB_HANDLERS: Dict[str, str] = {
+    "GROUP3_SYNC_SERVICE_REQUESTS": "procurement.services.service_request_sync.run_group3_sync_job",
+}
+
+ACTIVE_STATUSES = ["QUEUED", "RUNNING"]
+
+
+def worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def enqueue_job(kind: str, *, provider_id=None, requested_by=None, params: dict | None = None) -> tuple[SyncJob, bool]:
+    """
+    Queue a job unless the same kind is already QUEUED/RUNNING for this provider.
+    Returns (job, created).
+
+    The syncjob_one_active_per_kind constraint decides races between two
+    requests: the loser's INSERT fails and it returns the winner's job.
+    """
+    if kind not in JOB_HANDLERS:
+        raise ValueError(f"Unknown job kind: {kind}")
+
+    active = SyncJob.objects.filter(kind=kind, provider_id=provider_id, status__in=ACTIVE_STATUSES)
+    existing = active.order_by("created_at").first()
+    if existing:
+        return existing, False
+
+    try:
+        with transaction.atomic():
+            job = SyncJob.objects.create(
+                kind=kind,
+                provider_id=provider_id,
+                requested_by=requested_by,
+                params=params or {},
+            )
+    except IntegrityError:
+        existing = active.order_by("created_at").first()
+        if existing is None:
+            raise
+        return existing, False
+    return job, True
+
+
+def claim_next_job(worker: str) -> Optional[SyncJob]:
+    """
+    Atomically move the oldest QUEUED job to RUNNING.
+    SKIP LOCKED lets concurrent workers claim different rows without blocking.
+    """
+    with transaction.atomic():
+        job = (
+            SyncJob.objects.select_for_update(skip_locked=True)
+            .filter(status="QUEUED")
+            .order_by("created_at", "id")
+            .first()
+        )
+        if not job:
+            return None
+
+        now = timezone.now()
+        job.status = "RUNNING"
+        job.locked_by = worker
+        job.attempts += 1
+        job.started_at = now
+        job.heartbeat_at = now
+        job.save(update_fields=["status", "locked_by", "attempts", "started_at", "heartbeat_at"])
+        return job
+
+
+def requeue_stale_jobs(stale_after: timedelta, max_attempts: int = 3) -> int:
+    """
+    RUNNING jobs without a heartbeat for `stale_after` belong to a dead worker:
+    put them back in the queue (or fail them after max_attempts).
+    """
+    cutoff = timezone.now() - stale_after
+    stale = SyncJob.objects.filter(status="RUNNING", heartbeat_at__lt=cutoff)
+
+    failed = stale.filter(attempts__gte=max_attempts).update(
+        status="FAILED",
+        error="Worker stopped responding (max attempts reached).",
+        finished_at=timezone.now(),
+    )
+    requeued = stale.filter(attempts__lt=max_attempts).update(status="QUEUED", locked_by="")
+    return failed + requeued
+
+
+def _progress_reporter(job: SyncJob) -> Callable[[Dict[str, Any]], None]:
+    def report(progress: Dict[str, Any]) -> None:
+        job.progress = {**(job.progress or {}), **progress}
+        job.heartbeat_at = timezone.now()
+        SyncJob.objects.filter(id=job.id).update(progress=job.progress, heartbeat_at=job.heartbeat_at)
+
+    return report
+
+
+def run_job(job: SyncJob) -> SyncJob:
+    """
+    Execute a claimed job and persist its outcome.
+    Handler exceptions mark the job FAILED (never propagate to the worker loop).
+    """
+    try:
+        handler = import_string(JOB_HANDLERS[job.kind])
+        result = handler(job, _progress_reporter(job))
+    except Exception as e:
+        logger.exception("Job %s (%s) failed", job.id, job.kind)
+        job.status = "FAILED"
+        # the traceback goes to the log only; `error` is shown to API clients
+        job.error = str(e)[:5000] or e.__class__.__name__
+    else:
+        job.status = "SUCCEEDED"
+        job.result = result or {}
+        job.error = ""
+
+    job.finished_at = timezone.now()
+    job.save(update_fields=["status", "result", "error", "finished_at"])
+    return job
@@ -0,0 +1,68 @@
+import signal
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections, connections
+
+from integrations.jobs import worker_id
+from integrations.outbox import claim_due_messages, deliver
+
+
+class Command(BaseCommand):
+    help = "Outbox dispatcher: delivers PENDING OutboundMessages with retries/backoff. Run as a separate process."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true", help="Deliver everything currently due and exit.")
+        parser.add_argument("--poll-interval", type=float, default=1.0, help="Seconds to sleep when nothing is due.")
+        parser.add_argument("--batch-size", type=int, default=20, help="Messages leased per claim.")
+        parser.add_argument(
+            "--concurrency", type=int, default=1,
+            help="Deliveries of a leased batch running in parallel (threads, one DB connection each).",
+        )
+
+    def handle(self, *args, **options):
+        worker = worker_id()
+        poll_interval = options["poll_interval"]
+        batch_size = options["batch_size"]
+        concurrency = max(1, options["concurrency"])
+        pool = ThreadPoolExecutor(max_workers=concurrency) if concurrency > 1 else None
+
+        self._stop = False
+        signal.signal(signal.SIGTERM, self._request_stop)
+        signal.signal(signal.SIGINT, self._request_stop)
+
+        self.stdout.write(self.style.WARNING(f"Outbox dispatcher {worker} started."))
+
+        while not self._stop:
+            close_old_connections()
+
+            messages = claim_due_messages(worker, limit=batch_size, concurrency=concurrency)
+            if not messages:
+                if options["once"]:
+                    break
+                time.sleep(poll_interval)
+                continue
+
+            delivered = pool.map(_deliver_in_thread, messages) if pool else map(deliver, messages)
+            for message in delivered:
+                style = self.style.SUCCESS if message.status == "DELIVERED" else self.style.WARNING
+                self.stdout.write(
+                    style(f"Outbound #{message.id} {message.kind}: {message.status} (HTTP {message.last_status}, attempt {message.attempts})")
+                )
+
+        if pool:
+            pool.shutdown(wait=True)
+        self.stdout.write(self.style.SUCCESS(f"Outbox dispatcher {worker} stopped."))
+
+    def _request_stop(self, signum, frame):
+        # finish the current batch, then exit
+        self._stop = True
+
+
+def _deliver_in_thread(message):
+    try:
+        return deliver(message)
+    finally:
+        # Django connections are per thread; don't leak one per pool thread
+        connections.close_all()
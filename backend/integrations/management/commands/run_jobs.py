@@ -0,0 +1,53 @@
+import signal
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from integrations.jobs import claim_next_job, requeue_stale_jobs, run_job, worker_id
+
+
+class Command(BaseCommand):
+    help = "Background worker: claims queued SyncJobs (FOR UPDATE SKIP LOCKED) and runs them. Run as a separate process."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true", help="Drain the queue once and exit.")
+        parser.add_argument("--poll-interval", type=float, default=2.0, help="Seconds to sleep when the queue is empty.")
+        parser.add_argument("--stale-after", type=int, default=600, help="Requeue RUNNING jobs without heartbeat for N seconds.")
+
+    def handle(self, *args, **options):
+        worker = worker_id()
+        poll_interval = options["poll_interval"]
+        stale_after = timedelta(seconds=options["stale_after"])
+
+        self._stop = False
+        signal.signal(signal.SIGTERM, self._request_stop)
+        signal.signal(signal.SIGINT, self._request_stop)
+
+        self.stdout.write(self.style.WARNING(f"Job worker {worker} started."))
+
+        while not self._stop:
+            close_old_connections()
+
+            requeued = requeue_stale_jobs(stale_after)
+            if requeued:
+                self.stdout.write(self.style.WARNING(f"Requeued/failed {requeued} stale job(s)."))
+
+            job = claim_next_job(worker)
+            if job is None:
+                if options["once"]:
+                    break
+                time.sleep(poll_interval)
+                continue
+
+            self.stdout.write(f"Running job #{job.id} {job.kind} ...")
+            job = run_job(job)
+            style = self.style.SUCCESS if job.status == "SUCCEEDED" else self.style.ERROR
+            self.stdout.write(style(f"Job #{job.id} {job.status}"))
+
+        self.stdout.write(self.style.SUCCESS(f"Job worker {worker} stopped."))
+
+    def _request_stop(self, signum, frame):
+        # finish the current job, then exit
+        self._stop = True
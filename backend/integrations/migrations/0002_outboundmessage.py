@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-16 22:43
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('integrations', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutboundMessage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(max_length=50)),
+                ('status', models.CharField(choices=[('PENDING', 'PENDING'), ('DELIVERED', 'DELIVERED'), ('FAILED', 'FAILED')], default='PENDING', max_length=20)),
+                ('url', models.URLField(max_length=500)),
+                ('payload', models.JSONField(blank=True, default=dict)),
+                ('idempotency_key', models.CharField(max_length=100, unique=True)),
+                ('target_model', models.CharField(blank=True, default='', max_length=100)),
+                ('target_id', models.CharField(blank=True, default='', max_length=50)),
+                ('attempts', models.IntegerField(default=0)),
+                ('max_attempts', models.IntegerField(default=8)),
+                ('next_attempt_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('locked_by', models.CharField(blank=True, default='', max_length=100)),
+                ('last_status', models.IntegerField(blank=True, null=True)),
+                ('last_response', models.JSONField(blank=True, null=True)),
+                ('last_error', models.TextField(blank=True, default='')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('delivered_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['status', 'next_attempt_at'], name='outbound_status_due_idx'), models.Index(fields=['target_model', 'target_id'], name='outbound_target_idx')],
+            },
+        ),
+    ]
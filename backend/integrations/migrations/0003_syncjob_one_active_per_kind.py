@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-17 04:05
+
+from django.conf import settings
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def fail_duplicate_active_jobs(apps, schema_editor):
+    # Keep the oldest QUEUED/RUNNING job per (kind, provider); the constraint rejects the rest.
+    SyncJob = apps.get_model("integrations", "SyncJob")
+    seen = set()
+    duplicates = []
+    for job in SyncJob.objects.filter(status__in=["QUEUED", "RUNNING"]).order_by("created_at", "id"):
+        key = (job.kind, job.provider_id)
+        if key in seen:
+            duplicates.append(job.id)
+        seen.add(key)
+    SyncJob.objects.filter(id__in=duplicates).update(
+        status="FAILED",
+        error="Duplicate of an earlier queued job.",
+        finished_at=timezone.now(),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('integrations', '0002_outboundmessage'),
+        ('providers', '0002_providermetrics'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(fail_duplicate_active_jobs, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='syncjob',
+            constraint=models.UniqueConstraint(condition=models.Q(('status__in', ['QUEUED', 'RUNNING'])), fields=('kind', 'provider'), name='syncjob_one_active_per_kind', nulls_distinct=False),
+        ),
+    ]
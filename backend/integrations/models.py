@@ -0,0 +1,134 @@
+from django.db import models
+from django.conf import settings
+from django.utils import timezone
+
+
+class SyncJob(models.Model):
+    """
+    Background job executed by the `run_jobs` worker (separate process).
+
+    Web requests only enqueue a row and return its id; the worker claims
+    QUEUED rows with SELECT ... FOR UPDATE SKIP LOCKED, so several workers
+    can run side by side without picking the same job.
+
+    Lifecycle:
+      QUEUED -> RUNNING -> SUCCEEDED / FAILED
+    """
+
+    KIND_CHOICES = [
+        ("GROUP3_SYNC_SERVICE_REQUESTS", "GROUP3_SYNC_SERVICE_REQUESTS"),
+    ]
+    STATUS_CHOICES = [
+        ("QUEUED", "QUEUED"),
+        ("RUNNING", "RUNNING"),
+        ("SUCCEEDED", "SUCCEEDED"),
+        ("FAILED", "FAILED"),
+    ]
+
+    kind = models.CharField(max_length=50, choices=KIND_CHOICES)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="QUEUED")
+
+    provider = models.ForeignKey(
+        "providers.Provider",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="sync_jobs",
+    )
+    requested_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="sync_jobs",
+    )
+
+    params = models.JSONField(default=dict, blank=True)
+    # handler-reported progress while RUNNING, e.g. {"stage": "upserting", "received": 10000}
+    progress = models.JSONField(default=dict, blank=True)
+    # final counts on SUCCEEDED
+    result = models.JSONField(null=True, blank=True)
+    error = models.TextField(blank=True, default="")
+
+    attempts = models.IntegerField(default=0)
+    locked_by = models.CharField(max_length=100, blank=True, default="")
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    heartbeat_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # worker claim: oldest QUEUED first
+            models.Index(fields=["status", "created_at"], name="syncjob_status_created_idx"),
+        ]
+        constraints = [
+            # at most one QUEUED/RUNNING job per (kind, provider); enqueue_job relies on it
+            models.UniqueConstraint(
+                fields=["kind", "provider"],
+                condition=models.Q(status__in=["QUEUED", "RUNNING"]),
+                nulls_distinct=False,
+                name="syncjob_one_active_per_kind",
+            ),
+        ]
+
+    def __str__(self):
+        return f"Job#{self.id} {self.kind} ({self.status})"
+
+
+class OutboundMessage(models.Model):
+    """
+    Transactional outbox for calls to partner systems (Group3 bids, ...).
+
+    Rows are written in the SAME transaction as the business change (e.g. the
+    ServiceOffer), so a message exists iff the change committed. The
+    `dispatch_outbound` process delivers them with retries + exponential
+    backoff and sends `idempotency_key` as the Idempotency-Key header, so a
+    retry after a lost response is safe on the receiving side.
+
+    After every attempt the HTTP status/body is copied to the target row's
+    group3_last_status / group3_last_response (target_model = "app_label.Model").
+
+    Lifecycle:
+      PENDING -> DELIVERED
+      PENDING -> (retry ...) -> FAILED   (non-retryable 4xx or max_attempts reached)
+    """
+
+    STATUS_CHOICES = [
+        ("PENDING", "PENDING"),
+        ("DELIVERED", "DELIVERED"),
+        ("FAILED", "FAILED"),
+    ]
+
+    kind = models.CharField(max_length=50)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="PENDING")
+
+    url = models.URLField(max_length=500)
+    payload = models.JSONField(default=dict, blank=True)
+    idempotency_key = models.CharField(max_length=100, unique=True)
+
+    target_model = models.CharField(max_length=100, blank=True, default="")
+    target_id = models.CharField(max_length=50, blank=True, default="")
+
+    attempts = models.IntegerField(default=0)
+    max_attempts = models.IntegerField(default=8)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    locked_by = models.CharField(max_length=100, blank=True, default="")
+
+    last_status = models.IntegerField(null=True, blank=True)
+    last_response = models.JSONField(null=True, blank=True)
+    last_error = models.TextField(blank=True, default="")
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    delivered_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # dispatcher claim: due PENDING messages first
+            models.Index(fields=["status", "next_attempt_at"], name="outbound_status_due_idx"),
+            models.Index(fields=["target_model", "target_id"], name="outbound_target_idx"),
+        ]
+
+    def __str__(self):
+        return f"Outbound#{self.id} {self.kind} ({self.status})"
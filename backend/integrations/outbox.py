@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import logging
+import math
+import random
+import uuid
+from datetime import timedelta
+from typing import Any, Dict, Iterable, List, Optional
+
+import requests
+from django.apps import apps
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from . import http_client
+from .models import OutboundMessage
+
+logger = logging.getLogger(__name__)
+
+
+# kind -> dotted path of a callable returning the HTTP headers for that partner.
+# Secrets are resolved at delivery time and never stored in the outbox row.
+OUTBOUND_HEADERS: Dict[str, str] = {
+    "GROUP3_BID": "procurement.services.group3.group3_headers",
+}
+
+# Statuses worth retrying; any other 4xx is a permanent rejection.
+RETRYABLE_STATUSES = {408, 425, 429}
+
+BACKOFF_BASE_SECONDS = 5
+BACKOFF_MAX_SECONDS = 60 * 60
+# added to every lease on top of the worst-case HTTP time
+LEASE_MARGIN_SECONDS = 30
+
+
+def _build_message(
+    kind: str,
+    url: str,
+    payload: Dict[str, Any],
+    *,
+    target=None,
+    idempotency_key: Optional[str] = None,
+) -> OutboundMessage:
+    if kind not in OUTBOUND_HEADERS:
+        raise ValueError(f"Unknown outbound kind: {kind}")
+
+    target_model = ""
+    target_id = ""
+    if target is not None:
+        target_model = target._meta.label
+        target_id = str(target.pk)
+
+    return OutboundMessage(
+        kind=kind,
+        url=url,
+        payload=payload,
+        idempotency_key=idempotency_key or uuid.uuid4().hex,
+        target_model=target_model,
+        target_id=target_id,
+    )
+
+
+def enqueue_message(
+    kind: str,
+    url: str,
+    payload: Dict[str, Any],
+    *,
+    target=None,
+    idempotency_key: Optional[str] = None,
+) -> OutboundMessage:
+    """
+    Write an outbound message. Call inside the transaction that makes the
+    business change; nothing is sent until that transaction commits.
+    """
+    message = _build_message(kind, url, payload, target=target, idempotency_key=idempotency_key)
+    message.save()
+    return message
+
+
+def enqueue_messages(messages: Iterable[Dict[str, Any]]) -> List[OutboundMessage]:
+    """
+    enqueue_message() for many messages in one INSERT. Each item holds the
+    keyword arguments of enqueue_message (kind, url, payload, target,
+    idempotency_key). Same transaction rule applies.
+    """
+    rows = [_build_message(**m) for m in messages]
+    if not rows:
+        return []
+    return OutboundMessage.objects.bulk_create(rows)
+
+
+def backoff_delay(attempts: int) -> timedelta:
+    """Exponential backoff with full jitter: up to base * 2^(attempts-1), capped."""
+    ceiling = min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * (2 ** max(attempts - 1, 0)))
+    return timedelta(seconds=random.uniform(ceiling / 2, ceiling))
+
+
+def delivery_seconds() -> float:
+    """Worst case of one delivery: every urllib3 attempt runs into both timeouts, plus backoff."""
+    attempts = settings.INTEGRATION_HTTP_RETRIES + 1
+    per_attempt = settings.INTEGRATION_HTTP_CONNECT_TIMEOUT + settings.INTEGRATION_HTTP_READ_TIMEOUT
+    backoff = sum(settings.INTEGRATION_HTTP_BACKOFF_FACTOR * 2 ** n for n in range(attempts - 1))
+    return attempts * per_attempt + backoff
+
+
+def lease_seconds(batch_size: int, concurrency: int = 1) -> float:
+    """How long a claimed batch stays hidden: long enough for all of it to be sent."""
+    rounds = math.ceil(max(batch_size, 1) / max(concurrency, 1))
+    return rounds * delivery_seconds() + LEASE_MARGIN_SECONDS
+
+
+def claim_due_messages(worker: str, limit: int = 20, *, concurrency: int = 1) -> List[OutboundMessage]:
+    """
+    Lease up to `limit` due PENDING messages.
+
+    The row locks (SKIP LOCKED) only live for this short transaction; the
+    lease (next_attempt_at pushed past the worst-case time to send the whole
+    batch) keeps other dispatchers away while the HTTP calls run outside any
+    transaction. deliver() renews it right before each send.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        messages = list(
+            OutboundMessage.objects.select_for_update(skip_locked=True)
+            .filter(status="PENDING", next_attempt_at__lte=now)
+            .order_by("next_attempt_at", "id")[:limit]
+        )
+        if messages:
+            lease_until = now + timedelta(seconds=lease_seconds(len(messages), concurrency))
+            OutboundMessage.objects.filter(id__in=[m.id for m in messages]).update(
+                locked_by=worker,
+                next_attempt_at=lease_until,
+            )
+            for m in messages:
+                m.locked_by = worker
+                m.next_attempt_at = lease_until
+    return messages
+
+
+def renew_lease(message: OutboundMessage) -> bool:
+    """
+    Extend the lease of one claimed message just before it is sent. False if
+    the lease is gone (another dispatcher re-claimed it, or it was resolved).
+    """
+    if not message.locked_by:
+        return True
+    lease_until = timezone.now() + timedelta(seconds=delivery_seconds() + LEASE_MARGIN_SECONDS)
+    renewed = OutboundMessage.objects.filter(
+        id=message.id, status="PENDING", locked_by=message.locked_by
+    ).update(next_attempt_at=lease_until)
+    return renewed == 1
+
+
+def _response_body(resp: requests.Response) -> Any:
+    try:
+        return resp.json()
+    except Exception:
+        return {"raw": resp.text[:2000]}
+
+
+def _record_on_target(message: OutboundMessage) -> None:
+    if not message.target_model or not message.target_id:
+        return
+    try:
+        model = apps.get_model(message.target_model)
+    except LookupError:
+        return
+    model.objects.filter(pk=message.target_id).update(
+        group3_last_status=message.last_status,
+        group3_last_response=message.last_response,
+    )
+
+
+def deliver(message: OutboundMessage) -> OutboundMessage:
+    """
+    Attempt one delivery and persist the outcome (never raises for HTTP/network errors).
+    A message whose lease was lost is left alone and returned unchanged.
+    """
+    if not renew_lease(message):
+        logger.warning("Outbound #%s: lease lost before sending, skipped.", message.id)
+        return message
+
+    headers = {
+        **import_string(OUTBOUND_HEADERS[message.kind])(),
+        "Idempotency-Key": message.idempotency_key,
+    }
+
+    message.attempts += 1
+    retry = False
+    try:
+        resp = http_client.post(message.url, json=message.payload, headers=headers)
+    except requests.RequestException as e:
+        message.last_status = None
+        message.last_response = None
+        message.last_error = str(e)[:2000]
+        retry = True
+    else:
+        message.last_status = resp.status_code
+        message.last_response = _response_body(resp)
+        message.last_error = ""
+        if resp.status_code < 400:
+            message.status = "DELIVERED"
+            message.delivered_at = timezone.now()
+        elif resp.status_code >= 500 or resp.status_code in RETRYABLE_STATUSES:
+            retry = True
+        else:
+            message.status = "FAILED"
+
+    if retry:
+        if message.attempts >= message.max_attempts:
+            message.status = "FAILED"
+        else:
+            message.next_attempt_at = timezone.now() + backoff_delay(message.attempts)
+
+    if message.status == "FAILED":
+        logger.warning(
+            "Outbound #%s (%s) failed after %s attempt(s): %s %s",
+            message.id, message.kind, message.attempts, message.last_status, message.last_error,
+        )
+
+    message.locked_by = ""
+    with transaction.atomic():
+        message.save(
+            update_fields=[
+                "status", "attempts", "next_attempt_at", "locked_by",
+                "last_status", "last_response", "last_error", "delivered_at",
+            ]
+        )
+        if message.last_status is not None:
+            _record_on_target(message)
+    return message
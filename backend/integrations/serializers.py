@@ -0,0 +1,25 @@
+from rest_framework import serializers
+
+from .models import SyncJob
+
+
+class SyncJobSerializer(serializers.ModelSerializer):
+    providerId = serializers.CharField(source="provider_id", allow_null=True, read_only=True)
+    requestedByUserId = serializers.CharField(source="requested_by_id", allow_null=True, read_only=True)
+
+    class Meta:
+        model = SyncJob
+        fields = [
+            "id",
+            "kind",
+            "status",
+            "providerId",
+            "requestedByUserId",
+            "progress",
+            "result",
+            "error",
+            "attempts",
+            "created_at",
+            "started_at",
+            "finished_at",
+        ]
@@ -0,0 +1,129 @@
+import threading
+from datetime import timedelta
+from unittest import mock
+
+from django.db import IntegrityError, transaction
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+
+from . import http_client, jobs, outbox
+from .models import OutboundMessage, SyncJob
+
+
+@override_settings(
+    INTEGRATION_HTTP_CONNECT_TIMEOUT=5,
+    INTEGRATION_HTTP_READ_TIMEOUT=20,
+    INTEGRATION_HTTP_RETRIES=2,
+    INTEGRATION_HTTP_BACKOFF_FACTOR=0.5,
+)
+class OutboxLeaseTests(TestCase):
+    """A claimed batch stays hidden until every message in it could have been sent."""
+
+    def setUp(self):
+        self.messages = outbox.enqueue_messages(
+            [{"kind": "GROUP3_BID", "url": f"https://group3.example.com/bids/{n}", "payload": {}} for n in range(3)]
+        )
+
+    def test_lease_covers_the_whole_batch(self):
+        # 3 attempts * (5 + 20) s + 0.5 + 1 s of backoff
+        self.assertEqual(outbox.delivery_seconds(), 76.5)
+        self.assertGreaterEqual(outbox.lease_seconds(20), 20 * 76.5)
+        self.assertGreaterEqual(outbox.lease_seconds(20, concurrency=4), 5 * 76.5)
+
+        claimed = outbox.claim_due_messages("w1", limit=20)
+        self.assertEqual(len(claimed), 3)
+        self.assertEqual({m.locked_by for m in claimed}, {"w1"})
+        lease_until = OutboundMessage.objects.get(pk=claimed[0].pk).next_attempt_at
+        self.assertGreaterEqual(lease_until, timezone.now() + timedelta(seconds=3 * 76.5))
+
+        self.assertEqual(outbox.claim_due_messages("w2", limit=20), [])
+
+    def test_message_with_a_lost_lease_is_not_sent(self):
+        claimed = outbox.claim_due_messages("w1", limit=1)
+        # the lease ran out and another dispatcher took the message over
+        OutboundMessage.objects.filter(pk=claimed[0].pk).update(locked_by="w2")
+
+        with mock.patch("integrations.outbox.http_client.post") as post:
+            outbox.deliver(claimed[0])
+        post.assert_not_called()
+        self.assertEqual(OutboundMessage.objects.get(pk=claimed[0].pk).attempts, 0)
+
+
+class SyncJobTests(TestCase):
+    KIND = "GROUP3_SYNC_SERVICE_REQUESTS"
+
+    def test_enqueue_returns_the_active_job(self):
+        job, created = jobs.enqueue_job(self.KIND)
+        self.assertTrue(created)
+        self.assertEqual(jobs.enqueue_job(self.KIND), (job, False))
+
+        # what a request that lost the race would run into
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            SyncJob.objects.create(kind=self.KIND)
+
+        SyncJob.objects.filter(pk=job.pk).update(status="SUCCEEDED")
+        self.assertTrue(jobs.enqueue_job(self.KIND)[1])
+
+    def test_enqueue_after_losing_the_race(self):
+        winner = SyncJob.objects.create(kind=self.KIND)
+        # the existence check ran before the winner's row was committed
+        with mock.patch.object(SyncJob.objects, "filter") as filter_:
+            filter_.return_value.order_by.return_value.first.side_effect = [None, winner]
+            self.assertEqual(jobs.enqueue_job(self.KIND), (winner, False))
+
+    def test_failed_job_error_has_no_traceback(self):
+        job, _ = jobs.enqueue_job(self.KIND)
+        with mock.patch(
+            "procurement.services.service_request_sync.run_group3_sync_job",
+            side_effect=RuntimeError("Group3 said no"),
+        ), self.assertLogs("integrations.jobs", "ERROR") as logs:
+            jobs.run_job(job)
+        job.refresh_from_db()
+        self.assertEqual(job.status, "FAILED")
+        self.assertEqual(job.error, "Group3 said no")
+        self.assertIn("Traceback", logs.output[0])
+
+
+class CircuitBreakerTests(SimpleTestCase):
+    def test_half_open_lets_one_probe_through(self):
+        breaker = http_client.CircuitBreaker(threshold=2, reset_seconds=30)
+        breaker.record_failure()
+        breaker.record_failure()
+        with self.assertRaises(http_client.CircuitOpenError):
+            breaker.before_call("h")
+
+        breaker.opened_at -= 30  # reset window passed
+        self.assertTrue(breaker.before_call("h"))
+        # the probe is still in flight: everyone else keeps failing fast
+        with self.assertRaises(http_client.CircuitOpenError):
+            breaker.before_call("h")
+
+        breaker.record_failure(probe=True)
+        with self.assertRaises(http_client.CircuitOpenError):
+            breaker.before_call("h")
+
+        breaker.opened_at -= 30
+        self.assertTrue(breaker.before_call("h"))
+        breaker.record_success(probe=True)
+        self.assertFalse(breaker.before_call("h"))
+        self.assertFalse(breaker.before_call("h"))
+
+    def test_concurrent_calls_during_half_open(self):
+        breaker = http_client.CircuitBreaker(threshold=1, reset_seconds=0)
+        breaker.record_failure()
+        outcomes = []
+        barrier = threading.Barrier(8)
+
+        def call():
+            barrier.wait()
+            try:
+                outcomes.append(breaker.before_call("h"))
+            except http_client.CircuitOpenError:
+                outcomes.append("open")
+
+        threads = [threading.Thread(target=call) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(sorted(map(str, outcomes)), ["True"] + ["open"] * 7)
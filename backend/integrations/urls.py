@@ -0,0 +1,6 @@
+from django.urls import path
+from .views import SyncJobDetailView
+
+urlpatterns = [
+    path("jobs/<int:id>/", SyncJobDetailView.as_view(), name="sync-job-detail"),
+]
@@ -0,0 +1,18 @@
+from rest_framework import generics
+from rest_framework.permissions import IsAuthenticated
+
+from .models import SyncJob
+from .serializers import SyncJobSerializer
+
+
+class SyncJobDetailView(generics.RetrieveAPIView):
+    """
+    GET /api/jobs/<id>/
+    Poll a background job (status, progress, final counts).
+    """
+    permission_classes = [IsAuthenticated]
+    serializer_class = SyncJobSerializer
+    lookup_field = "id"
+
+    def get_queryset(self):
+        return SyncJob.objects.filter(provider_id=self.request.user.provider_id)
@@ -9,6 +9,7 @@ from django.db import transaction
 from django.utils import timezone
 
 from providers.models import Provider
+from providers.services.metrics import refresh_all_provider_metrics
 from accounts.models import User
 from contracts.models import Contract, ContractOffer
 from procurement.models import ServiceRequest, ServiceOffer, ServiceOrder
@@ -575,6 +576,9 @@ class Command(BaseCommand):
         for p in providers.values():
             _update_specialist_counters(p)
 
+        # QuerySet.update() / bulk writes above bypass the metrics signals
+        refresh_all_provider_metrics()
+
         self.stdout.write(self.style.SUCCESS("✅ Demo seed completed successfully."))
         self.stdout.write(
             self.style.SUCCESS(
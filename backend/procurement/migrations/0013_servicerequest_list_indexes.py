@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-16 22:37
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('procurement', '0012_serviceorderassignment_end_date_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='servicerequest',
+            index=models.Index(fields=['contract_id', '-created_at', '-id'], name='sr_contract_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='servicerequest',
+            index=models.Index(fields=['contract_id', 'status', 'type', 'bidding_active'], name='sr_contract_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='servicerequest',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.search.SearchVector('title', 'task_description', 'project_name', config='english'), name='sr_search_gin'),
+        ),
+    ]
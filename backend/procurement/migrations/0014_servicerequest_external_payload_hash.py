@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('procurement', '0013_servicerequest_list_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='servicerequest',
+            name='external_payload_hash',
+            field=models.CharField(blank=True, default='', max_length=64),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:40
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('procurement', '0014_servicerequest_external_payload_hash'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='serviceorderassignment',
+            index=models.Index(fields=['specialist', 'order'], name='soa_specialist_order_idx'),
+        ),
+    ]
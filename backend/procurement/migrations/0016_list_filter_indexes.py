@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:05
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('procurement', '0015_serviceorderassignment_specialist_order_idx'),
+        ('providers', '0002_providermetrics'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='serviceoffer',
+            index=models.Index(fields=['provider', '-created_at'], name='offer_provider_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='serviceorder',
+            index=models.Index(fields=['provider', '-created_at', '-id'], name='order_provider_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='serviceorderchangerequest',
+            index=models.Index(fields=['provider', '-created_at'], name='cr_provider_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='servicerequest',
+            index=models.Index(condition=models.Q(('bidding_active', True), ('status', 'APPROVED_FOR_BIDDING')), fields=['contract_id', '-created_at', '-id'], name='sr_open_bidding_idx'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:40
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('procurement', '0016_list_filter_indexes'),
+        ('providers', '0002_providermetrics'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='serviceorderchangerequest',
+            name='cr_provider_created_idx',
+        ),
+        migrations.AddIndex(
+            model_name='serviceorderchangerequest',
+            index=models.Index(fields=['provider', '-created_at', '-id'], name='cr_provider_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='serviceorderchangerequest',
+            index=models.Index(condition=models.Q(('status', 'Requested')), fields=['provider', '-created_at', '-id'], name='cr_provider_pending_idx'),
+        ),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.18 on 2026-10-17 05:10
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+
+def backfill_roles_text(apps, schema_editor):
+    # Same text as procurement.models.role_search_text at the time of writing
+    ServiceRequest = apps.get_model("procurement", "ServiceRequest")
+    batch = []
+    for sr in ServiceRequest.objects.only("id", "roles").iterator(chunk_size=2000):
+        words = []
+        for role in sr.roles if isinstance(sr.roles, list) else []:
+            if isinstance(role, dict):
+                words += [str(role[k]) for k in ("roleName", "role", "technology") if role.get(k)]
+        sr.roles_text = " ".join(words)
+        batch.append(sr)
+        if len(batch) >= 2000:
+            ServiceRequest.objects.bulk_update(batch, ["roles_text"])
+            batch = []
+    ServiceRequest.objects.bulk_update(batch, ["roles_text"])
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('procurement', '0017_change_request_feed_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='servicerequest',
+            name='sr_search_gin',
+        ),
+        migrations.AddField(
+            model_name='servicerequest',
+            name='roles_text',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.RunPython(backfill_roles_text, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='servicerequest',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.search.SearchVector('title', 'task_description', 'project_name', 'roles_text', config='english'), name='sr_search_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='servicerequest',
+            index=models.Index(django.contrib.postgres.indexes.OpClass('id', name='varchar_pattern_ops'), name='sr_id_prefix_idx'),
+        ),
+    ]
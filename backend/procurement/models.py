@@ -1,7 +1,29 @@
 from django.db import models
+from django.db.models import Q
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVector
 from decimal import Decimal
 
+
+def service_request_search_vector() -> SearchVector:
+    """
+    Full-text document behind ?q= on the service request list.
+    Keep it identical to the GIN index expression on ServiceRequest,
+    otherwise Postgres cannot use the index.
+    """
+    return SearchVector("title", "task_description", "project_name", "roles_text", config="english")
+
+
+def role_search_text(roles) -> str:
+    """Role names and technologies of ServiceRequest.roles, as searchable text."""
+    words = []
+    for role in roles if isinstance(roles, list) else []:
+        if isinstance(role, dict):
+            words += [str(role[k]) for k in ("roleName", "role", "technology") if role.get(k)]
+    return " ".join(words)
+
+
 class ServiceRequest(models.Model):
     """
     Pulled from Group3.
@@ -45,6 +67,8 @@ class ServiceRequest(models.Model):
     further_information = models.TextField(blank=True, default="")
 
     roles = models.JSONField(default=list, blank=True)
+    # role_search_text(roles), kept in sync by save() and the Group3 sync; part of the ?q= document
+    roles_text = models.TextField(blank=True, default="", editable=False)
 
     bidding_cycle_days = models.IntegerField(null=True, blank=True)
     bidding_start_at = models.DateTimeField(null=True, blank=True)
@@ -52,8 +76,34 @@ class ServiceRequest(models.Model):
     bidding_active = models.BooleanField(null=True, blank=True)
 
     external_payload = models.JSONField(null=True, blank=True)
+    # sha256 of external_payload; lets the Group3 sync skip unchanged requests
+    external_payload_hash = models.CharField(max_length=64, blank=True, default="")
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # list view: contract visibility + keyset ordering
+            models.Index(fields=["contract_id", "-created_at", "-id"], name="sr_contract_created_idx"),
+            # list filters: ?status= / ?type= / ?bidding_active=
+            models.Index(fields=["contract_id", "status", "type", "bidding_active"], name="sr_contract_status_idx"),
+            # list filter: ?q= (words), plus request number prefixes
+            GinIndex(service_request_search_vector(), name="sr_search_gin"),
+            models.Index(OpClass("id", name="varchar_pattern_ops"), name="sr_id_prefix_idx"),
+            # open for bidding (?status=APPROVED_FOR_BIDDING&bidding_active=true): only the small live set
+            models.Index(
+                fields=["contract_id", "-created_at", "-id"],
+                name="sr_open_bidding_idx",
+                condition=Q(bidding_active=True, status="APPROVED_FOR_BIDDING"),
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        self.roles_text = role_search_text(self.roles)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "roles" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "roles_text"}
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f"{self.id} - {self.title}"
 
@@ -99,6 +149,12 @@ class ServiceOffer(models.Model):
     group3_last_status = models.IntegerField(null=True, blank=True)
     group3_last_response = models.JSONField(null=True, blank=True)
 
+    class Meta:
+        indexes = [
+            # offer list: provider's offers, newest first
+            models.Index(fields=["provider", "-created_at"], name="offer_provider_created_idx"),
+        ]
+
     def __str__(self):
         return f"Offer {self.id} for {self.service_request_id}"
 
@@ -128,6 +184,12 @@ class ServiceOrder(models.Model):
     status = models.CharField(max_length=10, choices=STATUS_CHOICES, default="ACTIVE")
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # order list: provider's orders in cursor order
+            models.Index(fields=["provider", "-created_at", "-id"], name="order_provider_created_idx"),
+        ]
+
     def __str__(self):
         return f"Order {self.id} ({self.provider_id})"
 
@@ -160,6 +222,10 @@ class ServiceOrderAssignment(models.Model):
 
     class Meta:
         unique_together = ("order", "specialist")
+        indexes = [
+            # specialist visibility: EXISTS (specialist, order) probes
+            models.Index(fields=["specialist", "order"], name="soa_specialist_order_idx"),
+        ]
 
     def __str__(self):
         return f"Assignment Order={self.order_id} Specialist={self.specialist_id}"
@@ -222,5 +288,17 @@ class ServiceOrderChangeRequest(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     decided_at = models.DateTimeField(null=True, blank=True)
 
+    class Meta:
+        indexes = [
+            # change request feed: provider's CRs in cursor order
+            models.Index(fields=["provider", "-created_at", "-id"], name="cr_provider_created_idx"),
+            # "pending decisions" inbox (?status=Requested): stays small however long the history grows
+            models.Index(
+                fields=["provider", "-created_at", "-id"],
+                name="cr_provider_pending_idx",
+                condition=Q(status="Requested"),
+            ),
+        ]
+
     def __str__(self):
         return f"CR#{self.id} {self.type} ({self.status}) Order={self.service_order_id}"
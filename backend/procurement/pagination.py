@@ -0,0 +1,59 @@
+from rest_framework.filters import OrderingFilter
+from rest_framework.pagination import CursorPagination
+
+
+class TiebreakOrderingFilter(OrderingFilter):
+    """
+    ?ordering= with `id` appended (in the direction of the last field), so
+    sorting on a non-unique field such as title is still a total order, as
+    CursorPagination requires:
+      ?ordering=title  ->  ("title", "id")
+    """
+
+    def get_ordering(self, request, queryset, view):
+        ordering = super().get_ordering(request, queryset, view)
+        if not ordering or any(f.lstrip("-") in ("id", "pk") for f in ordering):
+            return ordering
+        return (*ordering, "-id" if ordering[-1].startswith("-") else "id")
+
+
+class ServiceRequestCursorPagination(CursorPagination):
+    """
+    Keyset pagination for service request listings.
+
+    Ordered by (created_at, id) so the cursor stays stable while Group3 syncs
+    add new rows. Clients follow `next` / `previous` links:
+      GET /api/service-requests/?page_size=50
+      -> { next, previous, results: [...] }
+    """
+
+    ordering = ("-created_at", "-id")
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 200
+
+
+class ServiceOrderCursorPagination(CursorPagination):
+    """
+    Keyset pagination for service order listings, newest first:
+      GET /api/service-orders/?page_size=50&since=2026-01-01
+      -> { next, previous, results: [...] }
+    """
+
+    ordering = ("-created_at", "-id")
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 200
+
+
+class ChangeRequestCursorPagination(CursorPagination):
+    """
+    Keyset pagination for the change request feed, newest first:
+      GET /api/service-order-change-requests/?status=Requested
+      -> { next, previous, results: [...] }
+    """
+
+    ordering = ("-created_at", "-id")
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 200
@@ -1,17 +1,20 @@
 from decimal import Decimal
-from django.utils.dateparse import parse_date, parse_datetime
+from django.utils.dateparse import parse_date
 from django.utils import timezone
 from rest_framework import serializers
 
 from accounts.models import User
-from contracts.models import Contract, ContractProviderStatus
+from contracts.models import Contract
 from contracts.services.contract_validation import (
     ContractValidationError,
-    validate_sr_against_contract,
+    get_contract_rules,
     normalize_sr_type,
 )
+from contracts.services.entitlements import is_active_for_contract
+from contracts.services.pricing import price_offer_lines
 
 from .models import ServiceRequest, ServiceOffer, ServiceOrder, ServiceOrderAssignment, ServiceOrderChangeRequest
+from .services.service_request_sync import map_group3_service_request
 
 
 class ServiceRequestSerializer(serializers.ModelSerializer):
@@ -64,11 +67,96 @@ class ServiceRequestSerializer(serializers.ModelSerializer):
         ]
 
 
+class ServiceRequestSummarySerializer(ServiceRequestSerializer):
+    """
+    Compact list projection (?view=summary).
+    Leaves out the text + JSON blobs (roles, criteria, descriptions);
+    the detail endpoint still returns the full payload. The roles only go out
+    as the roleSummary totals the list table shows.
+    """
+
+    roleSummary = serializers.SerializerMethodField()
+
+    # model columns loaded via .only() for this projection
+    ONLY_FIELDS = [
+        "id",
+        "external_id",
+        "request_number",
+        "title",
+        "type",
+        "status",
+        "contract_id",
+        "contract_supplier",
+        "project_id",
+        "project_name",
+        "requested_by_username",
+        "requested_by_role",
+        "start_date",
+        "end_date",
+        "performance_location",
+        "max_offers",
+        "max_accepted_offers",
+        "bidding_cycle_days",
+        "bidding_start_at",
+        "bidding_end_at",
+        "bidding_active",
+        "roles",
+        "created_at",
+    ]
+
+    class Meta(ServiceRequestSerializer.Meta):
+        fields = [
+            "id",
+            "external_id",
+            "requestNumber",
+            "title",
+            "type",
+            "status",
+            "contractId",
+            "contractSupplier",
+            "projectId",
+            "projectName",
+            "requestedByUsername",
+            "requestedByRole",
+            "start_date",
+            "end_date",
+            "performance_location",
+            "max_offers",
+            "max_accepted_offers",
+            "biddingCycleDays",
+            "biddingStartAt",
+            "biddingEndAt",
+            "biddingActive",
+            "roleSummary",
+            "created_at",
+        ]
+
+    def get_roleSummary(self, obj):
+        roles = [r for r in (obj.roles or []) if isinstance(r, dict)]
+        first = roles[0] if roles else {}
+        return {
+            "primaryRole": first.get("roleName") or first.get("role") or "",
+            "technology": first.get("technology") or "",
+            "count": len(roles),
+            "manDays": sum(_number_or_zero(r.get("manDays")) for r in roles),
+            "onsiteDays": sum(_number_or_zero(r.get("onsiteDays")) for r in roles),
+        }
+
+
+def _number_or_zero(value) -> float:
+    try:
+        return float(value or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
 # procurement/serializers.py
 class ServiceOfferSpecialistInputSerializer(serializers.Serializer):
     userId = serializers.CharField()
     dailyRate = serializers.DecimalField(max_digits=12, decimal_places=2)
     travellingCost = serializers.DecimalField(max_digits=12, decimal_places=2, required=False, default=Decimal("0"))
+    # index into ServiceRequest.roles this specialist is offered for (defaults: see pricing.default_role_indexes)
+    roleIndex = serializers.IntegerField(required=False, allow_null=True, min_value=0)
 
     # FIX: no default, allow null, so backend computes when not provided
     specialistCost = serializers.DecimalField(
@@ -159,18 +247,18 @@ class ServiceOfferCreateSerializer(serializers.Serializer):
         req = self.context["request"]
         sr_id = attrs["serviceRequestId"]
 
-        try:
-            sr = ServiceRequest.objects.get(id=sr_id)
-        except ServiceRequest.DoesNotExist:
+        # bulk submission preloads SRs / contracts / specialists for all items (OfferPreload)
+        preload = self.context.get("preload")
+
+        if preload is not None:
+            sr = preload.service_requests.get(sr_id)
+        else:
+            sr = ServiceRequest.objects.filter(id=sr_id).first()
+        if sr is None:
             raise serializers.ValidationError({"serviceRequestId": "Service request not found."})
 
         # Must be visible: provider must be ACTIVE for this contract
-        ok = ContractProviderStatus.objects.filter(
-            contract_id=sr.contract_id,
-            provider_id=req.user.provider_id,
-            status="ACTIVE",
-        ).exists()
-        if not ok:
+        if not is_active_for_contract(req, sr.contract_id):
             raise serializers.ValidationError("Not allowed: your provider is not ACTIVE for this contract.")
 
         # SR must be in bidding state
@@ -181,14 +269,16 @@ class ServiceOfferCreateSerializer(serializers.Serializer):
             raise serializers.ValidationError("Bidding deadline has passed.")
 
         # Contract must exist for validation
-        contract = Contract.objects.filter(id=sr.contract_id).first()
+        if preload is not None:
+            contract = preload.contracts.get(sr.contract_id)
+        else:
+            contract = Contract.objects.filter(id=sr.contract_id).first()
         if not contract or not isinstance(contract.config, dict):
             raise serializers.ValidationError("Linked contract config missing; cannot validate offer.")
 
-        # Contract allows SR type / roles
+        # Contract allows SR type / roles (rules compiled once per contract config version)
         try:
-            validate_sr_against_contract(
-                contract_config=contract.config,
+            get_contract_rules(contract).validate_service_request(
                 sr_type=normalize_sr_type(sr.type),
                 roles=sr.roles or [],
                 must_have=sr.must_have_criteria or [],
@@ -208,53 +298,49 @@ class ServiceOfferCreateSerializer(serializers.Serializer):
 
         # Ensure specialists are from same provider and role=Specialist and active
         user_ids = [s["userId"] for s in specs]
-        found = list(User.objects.filter(id__in=user_ids, provider_id=req.user.provider_id, role="Specialist", is_active=True))
+        if preload is not None:
+            found = {uid: preload.specialists[uid] for uid in user_ids if uid in preload.specialists}
+        else:
+            found = User.objects.filter(
+                id__in=user_ids, provider_id=req.user.provider_id, role="Specialist", is_active=True
+            ).in_bulk()
         if len(found) != len(user_ids):
             raise serializers.ValidationError("One or more selected specialists are invalid for your provider.")
 
+        # Price each specialist for the SR role it fills; enforce contract max daily rates
+        try:
+            priced, total_cost = price_offer_lines(contract, sr, specs)
+        except ContractValidationError as e:
+            raise serializers.ValidationError(str(e))
+
         attrs["_sr"] = sr
+        attrs["_users"] = found
+        attrs["_priced"] = priced
+        attrs["_total_cost"] = total_cost
         return attrs
 
-    def create(self, validated_data):
+    def build_offer(self, validated_data) -> ServiceOffer:
+        """Unsaved ServiceOffer for validated input (create() saves it, bulk submission bulk_creates it)."""
         req = self.context["request"]
         sr: ServiceRequest = validated_data["_sr"]
 
-        # Build specialists list (enriched)
+        # Build specialists list (enriched); priced per SR role in validate()
         input_specs = validated_data.get("specialists") or []
-        users = {u.id: u for u in User.objects.filter(id__in=[s["userId"] for s in input_specs])}
+        users = validated_data["_users"]
+        total_cost = validated_data["_total_cost"]
 
         specialists_payload = []
-        total_cost = Decimal("0")
-
-        # Compute per-specialist cost (simple deterministic)
-        # If SR.roles has manDays/onsiteDays, use role[0] days for all (good enough for now).
-        roles = sr.roles if isinstance(sr.roles, list) else []
-        role0 = roles[0] if roles else {}
-        man_days = Decimal(str(role0.get("manDays") or 0))
-        onsite_days = Decimal(str(role0.get("onsiteDays") or 0))
-
-        for s in input_specs:
-            u = users.get(s["userId"])
-            daily = Decimal(str(s["dailyRate"]))
-            travel = Decimal(str(s.get("travellingCost") or 0))
-
-            # specialistCost: if FE sends it, accept; else compute
-            sc = s.get("specialistCost")
-            if sc is not None:
-                specialist_cost = Decimal(str(sc))
-            else:
-                specialist_cost = (daily * man_days) + (travel * onsite_days)
-
-            total_cost += specialist_cost
-
+        for s, line in zip(input_specs, validated_data["_priced"]):
+            u = users[line.user_id]
             specialists_payload.append(
                 {
                     "userId": u.id,
                     "name": u.name,
                     "materialNumber": getattr(u, "material_number", "") or getattr(u, "materialNumber", "") or "",
-                    "dailyRate": float(daily),
-                    "travellingCost": float(travel),
-                    "specialistCost": float(specialist_cost),
+                    "roleIndex": line.role_index,
+                    "dailyRate": float(line.daily_rate),
+                    "travellingCost": float(line.travelling_cost),
+                    "specialistCost": float(line.specialist_cost),
                     "matchMustHaveCriteria": bool(s.get("matchMustHaveCriteria", True)),
                     "matchNiceToHaveCriteria": bool(s.get("matchNiceToHaveCriteria", True)),
                     "matchLanguageSkills": bool(s.get("matchLanguageSkills", True)),
@@ -272,19 +358,20 @@ class ServiceOfferCreateSerializer(serializers.Serializer):
 
         snapshot = sr.external_payload or {}
 
-        offer = ServiceOffer.objects.create(
+        status = validated_data.get("offerStatus", "DRAFT")
+        return ServiceOffer(
             service_request=sr,
             provider=req.user.provider,
             created_by=req.user,
             request_snapshot=snapshot,
             response=response,
-            status=validated_data.get("offerStatus", "DRAFT"),
+            status=status,
+            submitted_at=timezone.now() if status == "SUBMITTED" else None,
         )
 
-        if offer.status == "SUBMITTED":
-            offer.submitted_at = timezone.now()
-            offer.save(update_fields=["submitted_at"])
-
+    def create(self, validated_data):
+        offer = self.build_offer(validated_data)
+        offer.save()
         return offer
 
 
@@ -348,58 +435,12 @@ class ServiceOrderSerializer(serializers.ModelSerializer):
 
 def upsert_group3_service_request(item: dict) -> ServiceRequest:
     """
-    Maps Group3 payload -> our ServiceRequest model.
-    Hardcode contract_id=C003 for now (your requirement).
+    Single-item upsert of a Group3 payload.
+    Bulk syncs should use procurement.services.service_request_sync instead.
     """
-    request_number = item.get("requestNumber") or ""
-    if not request_number:
-        raise ValueError("Missing requestNumber")
-
-    sr_type = (item.get("type") or "SINGLE").upper()
-
-    # TEMP: until Group3 fixes / until Group2 integration is connected
-    contract_id = "C003"
-
-    roles = item.get("roles") if isinstance(item.get("roles"), list) else []
-
-    start_date = parse_date(item.get("startDate")) if item.get("startDate") else None
-    end_date = parse_date(item.get("endDate")) if item.get("endDate") else None
-
-    bidding_start_at = parse_datetime(item.get("biddingStartAt")) if item.get("biddingStartAt") else None
-    bidding_end_at = parse_datetime(item.get("biddingEndAt")) if item.get("biddingEndAt") else None
-
-    sr, _ = ServiceRequest.objects.update_or_create(
-        id=request_number,
-        defaults={
-            "external_id": item.get("id"),
-            "request_number": request_number,
-            "title": item.get("title") or "",
-            "type": sr_type,
-            "status": item.get("status") or "DRAFT",
-            "contract_id": contract_id,
-            "contract_supplier": item.get("contractSupplier") or "",
-            "start_date": start_date,
-            "end_date": end_date,
-            "performance_location": (item.get("performanceLocation") or "").strip() or "Onsite",
-            "max_offers": item.get("maxOffers"),
-            "max_accepted_offers": item.get("maxAcceptedOffers"),
-            "required_languages": item.get("requiredLanguages") or [],
-            "must_have_criteria": item.get("mustHaveCriteria") or [],
-            "nice_to_have_criteria": item.get("niceToHaveCriteria") or [],
-            "task_description": item.get("taskDescription") or "",
-            "further_information": item.get("furtherInformation") or "",
-            "roles": roles,
-            "project_id": item.get("projectId") or "",
-            "project_name": item.get("projectName") or "",
-            "requested_by_username": item.get("requestedByUsername") or "",
-            "requested_by_role": item.get("requestedByRole") or "",
-            "bidding_cycle_days": item.get("biddingCycleDays"),
-            "bidding_start_at": bidding_start_at,
-            "bidding_end_at": bidding_end_at,
-            "bidding_active": item.get("biddingActive"),
-            "external_payload": item,
-        },
-    )
+    defaults = map_group3_service_request(item)
+    sr_id = defaults.pop("id")
+    sr, _ = ServiceRequest.objects.update_or_create(id=sr_id, defaults=defaults)
     return sr
 
 
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from typing import Iterable, List
+
+from django.conf import settings
+
+from integrations.models import OutboundMessage
+from integrations.outbox import enqueue_message, enqueue_messages
+from procurement.models import ServiceOffer
+
+
+def group3_headers() -> dict:
+    header_name = getattr(settings, "GROUP3_API_KEY_HEADER", "ServiceRequestbids3a")
+    api_key = getattr(settings, "GROUP3_CONNECTION_API_KEY", "")
+    return {"Content-Type": "application/json", header_name: api_key}
+
+
+def group3_bids_url() -> str:
+    url = getattr(settings, "GROUP3_BIDS_URL", "").strip()
+    if not url:
+        raise RuntimeError("GROUP3_BIDS_URL is not configured")
+    return url
+
+
+def map_offer_to_group3_payload(offer: ServiceOffer) -> dict:
+    """
+    Payload sent to Group3.
+    - No deltas
+    - specialists[] list
+    - one totalCost for entire request
+    """
+    sr = offer.service_request
+    resp = offer.response if isinstance(offer.response, dict) else {}
+
+    # Group3 sample structure includes serviceRequest nested.
+    service_request_payload = {
+        "id": sr.external_id or 0,
+        "requestNumber": sr.request_number or sr.id,
+        "title": sr.title,
+        "type": sr.type,
+        "requestedByUsername": sr.requested_by_username,
+        "requestedByRole": sr.requested_by_role,
+        "projectId": sr.project_id,
+        "projectName": sr.project_name,
+        "contractId": sr.contract_id,
+        "contractSupplier": sr.contract_supplier,
+        "startDate": str(sr.start_date) if sr.start_date else None,
+        "endDate": str(sr.end_date) if sr.end_date else None,
+        "performanceLocation": sr.performance_location,
+        "maxOffers": sr.max_offers or 0,
+        "maxAcceptedOffers": sr.max_accepted_offers or 0,
+        "requiredLanguages": sr.required_languages or [],
+        "mustHaveCriteria": sr.must_have_criteria or [],
+        "niceToHaveCriteria": sr.nice_to_have_criteria or [],
+        "taskDescription": sr.task_description or "",
+        "furtherInformation": sr.further_information or "",
+        "status": sr.status,
+        "roles": sr.roles or [],
+        "biddingCycleDays": sr.bidding_cycle_days or 0,
+        "biddingStartAt": sr.bidding_start_at.isoformat() if sr.bidding_start_at else None,
+        "biddingEndAt": sr.bidding_end_at.isoformat() if sr.bidding_end_at else None,
+        "biddingActive": bool(sr.bidding_active) if sr.bidding_active is not None else None,
+    }
+
+    payload = {
+        "id": offer.id,
+        "serviceRequest": service_request_payload,
+        "specialists": resp.get("specialists", []),
+        "totalCost": resp.get("totalCost", 0),
+        "contractualRelationship": resp.get("contractualRelationship", ""),
+        "subcontractorCompany": resp.get("subcontractorCompany", ""),
+        "supplierName": resp.get("supplierName", offer.provider.name),
+        "supplierRepresentative": resp.get("supplierRepresentative", offer.created_by.name if offer.created_by else ""),
+        "offerStatus": offer.status,
+        "providerId": offer.provider_id,
+        "providerName": offer.provider.name,
+    }
+    return payload
+
+
+def enqueue_offer_for_group3(offer: ServiceOffer) -> OutboundMessage:
+    """
+    Queue the bid (POST /api/public/bids) for Group3.
+
+    Must run inside the transaction that saves the offer. The `dispatch_outbound`
+    process delivers it and records the result on offer.group3_last_status /
+    group3_last_response. The idempotency key is stable per offer, so a bid is
+    queued at most once.
+    """
+    return enqueue_message(
+        "GROUP3_BID",
+        group3_bids_url(),
+        map_offer_to_group3_payload(offer),
+        target=offer,
+        idempotency_key=f"group3-bid-{offer.id}",
+    )
+
+
+def enqueue_offers_for_group3(offers: Iterable[ServiceOffer]) -> List[OutboundMessage]:
+    """enqueue_offer_for_group3() for many saved offers, written with one INSERT."""
+    url = group3_bids_url()
+    return enqueue_messages(
+        {
+            "kind": "GROUP3_BID",
+            "url": url,
+            "payload": map_offer_to_group3_payload(offer),
+            "target": offer,
+            "idempotency_key": f"group3-bid-{offer.id}",
+        }
+        for offer in offers
+    )
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Any, List
+
+from django.db.models import Exists, OuterRef, Prefetch
+
+from accounts.models import User
+from procurement.models import ServiceOrder, ServiceOrderAssignment
+
+
+def _decimal(value: Any) -> Decimal:
+    return Decimal(str(value or 0))
+
+
+def create_order_assignments(order: ServiceOrder, specialists: Any) -> List[ServiceOrderAssignment]:
+    """
+    Materialize the specialists of the accepted offer (offer.response["specialists"])
+    as assignments of `order`: one in_bulk user lookup + one bulk_create,
+    whatever the team size. Unknown / non-Specialist users are skipped.
+    """
+    if not isinstance(specialists, list):
+        return []
+
+    lines = []
+    for s in specialists:
+        if not isinstance(s, dict):
+            continue
+        uid = str(s.get("userId") or "").strip()
+        if uid:
+            lines.append((uid, s))
+    if not lines:
+        return []
+
+    users = User.objects.filter(role="Specialist").in_bulk({uid for uid, _ in lines})
+
+    assignments = [
+        # Keep same values as offer (core business logic)
+        ServiceOrderAssignment(
+            order=order,
+            specialist=users[uid],
+            daily_rate=_decimal(s.get("dailyRate")),
+            travelling_cost=_decimal(s.get("travellingCost")),
+            specialist_cost=_decimal(s.get("specialistCost")),
+            match_must_have_criteria=bool(s.get("matchMustHaveCriteria", True)),
+            match_nice_to_have_criteria=bool(s.get("matchNiceToHaveCriteria", True)),
+            match_language_skills=bool(s.get("matchLanguageSkills", True)),
+        )
+        for uid, s in lines
+        if uid in users
+    ]
+    return ServiceOrderAssignment.objects.bulk_create(assignments)
+
+
+def assignments_prefetch() -> Prefetch:
+    """
+    order.assignments with their specialist in one query, loading only the
+    columns ServiceOrderAssignmentSerializer reads.
+    """
+    return Prefetch(
+        "assignments",
+        queryset=(
+            ServiceOrderAssignment.objects.select_related("specialist")
+            .only(
+                "id", "order_id", "specialist_id",
+                "daily_rate", "travelling_cost", "specialist_cost",
+                "match_must_have_criteria", "match_nice_to_have_criteria", "match_language_skills",
+                "specialist__id", "specialist__name", "specialist__material_number",
+            )
+            .order_by("id")
+        ),
+    )
+
+
+def assigned_to_specialist(specialist_id: str, order_ref: str = "pk") -> Exists:
+    """
+    EXISTS (assignment of `specialist_id` on the outer order) for specialist
+    visibility filters; `order_ref` names the order id on the outer queryset
+    ("pk" for orders, "service_order_id" for change requests). Unlike a join +
+    DISTINCT it is answered from the (specialist, order) index.
+    """
+    return Exists(
+        ServiceOrderAssignment.objects.filter(specialist_id=specialist_id, order_id=OuterRef(order_ref))
+    )
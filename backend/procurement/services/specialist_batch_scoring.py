@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, Sequence
+
+import numpy as np
+
+from .specialist_matching import (
+    AVAILABILITY_SCORE,
+    EXPERIENCE_ORDINAL,
+    TECH_LEVEL_ORDINAL,
+    WEIGHTS,
+    SkillIndex,
+    _ordinal,
+    get_skill_index,
+)
+
+
+class SpecialistMatrix:
+    """
+    Column-oriented view of a provider's SkillIndex for vectorized scoring:
+
+      experience     int8   ordinal (Junior=0 .. Expert=3), -1 unknown
+      tech_level     int8   ordinal (Basic=0 .. Expert=3), -1 unknown
+      rate           float  average daily rate, NaN unknown
+      availability   float  1.0 Available / 0.5 Partially Booked / 0.0
+      skills         uint8  (specialists x skill phrases) bitset
+
+    A free-text criterion becomes a phrase mask column; one matmul of the
+    skill bitset against all columns answers "does specialist i match
+    criterion j" for every criterion of every requested SR at once.
+    """
+
+    def __init__(self, index: SkillIndex):
+        self.index = index
+        self.profiles = sorted(index.profiles.values(), key=lambda p: p.rank)
+        self.phrases = {phrase: col for col, phrase in enumerate(index.phrase_ids)}
+
+        n = len(self.profiles)
+        self.experience = np.array(
+            [_ord_or_minus_one(EXPERIENCE_ORDINAL, p.experience_level) for p in self.profiles], dtype=np.int8
+        ).reshape(n)
+        self.tech_level = np.array(
+            [_ord_or_minus_one(TECH_LEVEL_ORDINAL, p.technology_level) for p in self.profiles], dtype=np.int8
+        ).reshape(n)
+        self.rate = np.array(
+            [p.average_daily_rate if p.average_daily_rate is not None else np.nan for p in self.profiles],
+            dtype=np.float64,
+        ).reshape(n)
+        self.availability = np.array(
+            [AVAILABILITY_SCORE.get(p.availability, 0.0) for p in self.profiles], dtype=np.float64
+        ).reshape(n)
+
+        row_of = {p.id: i for i, p in enumerate(self.profiles)}
+        self.skills = np.zeros((n, len(self.phrases)), dtype=np.uint8)
+        for phrase, col in self.phrases.items():
+            rows = [row_of[uid] for uid in index.phrase_ids[phrase]]
+            self.skills[rows, col] = 1
+
+    def __len__(self) -> int:
+        return len(self.profiles)
+
+    def text_column(self, text: Any) -> np.ndarray:
+        col = np.zeros(len(self.phrases), dtype=np.uint8)
+        for phrase in self.index.phrases_matching_text(text):
+            col[self.phrases[phrase]] = 1
+        return col
+
+
+def _ord_or_minus_one(table, value) -> int:
+    v = _ordinal(table, value)
+    return -1 if v is None else v
+
+
+def _experience_fit(required: int, actual: np.ndarray) -> np.ndarray:
+    # same table as specialist_matching._experience_fit
+    return np.select(
+        [actual < 0, actual == required, actual > required, actual == required - 1],
+        [0.0, 1.0, 0.75, 0.25],
+        default=0.0,
+    )
+
+
+class _Columns:
+    """Collects text criteria of all SRs as columns of one phrase-mask matrix."""
+
+    def __init__(self, m: SpecialistMatrix):
+        self.m = m
+        self.cols: List[np.ndarray] = []
+
+    def add(self, text: Any) -> int:
+        self.cols.append(self.m.text_column(text))
+        return len(self.cols) - 1
+
+    def match_matrix(self) -> np.ndarray:
+        if not self.cols or not len(self.m):
+            return np.zeros((len(self.m), len(self.cols)), dtype=bool)
+        criteria = np.stack(self.cols, axis=1)  # phrases x criteria
+        return (self.m.skills.astype(np.int32) @ criteria.astype(np.int32)) > 0
+
+
+def _plan(sr, cols: _Columns) -> Dict[str, Any]:
+    roles = []
+    for r in sr.roles if isinstance(sr.roles, list) else []:
+        if not isinstance(r, dict):
+            continue
+        technology = r.get("technology")
+        tech_level = _ordinal(TECH_LEVEL_ORDINAL, technology)
+        roles.append(
+            {
+                "experience": _ordinal(EXPERIENCE_ORDINAL, r.get("experienceLevel")),
+                "tech_level": tech_level,
+                "tech_col": cols.add(technology) if technology and tech_level is None else None,
+                "role_col": cols.add(r.get("roleName")) if r.get("roleName") else None,
+            }
+        )
+
+    def criteria(values):
+        items = values if isinstance(values, list) else []
+        return [cols.add(c) for c in items if str(c or "").strip()]
+
+    return {
+        "roles": roles,
+        "mustHave": criteria(sr.must_have_criteria),
+        "niceToHave": criteria(sr.nice_to_have_criteria),
+        "languages": criteria(sr.required_languages),
+    }
+
+
+def _score_request(m: SpecialistMatrix, plan: Dict[str, Any], hits: np.ndarray, limit: int) -> List[Dict[str, Any]]:
+    n = len(m)
+    points = np.zeros(n)
+    weight = 0.0
+    flag_vectors: Dict[str, np.ndarray] = {}
+    flag_present: Dict[str, np.ndarray] = {}
+
+    # ---- roles: best role per specialist
+    best_role = np.full(n, -1, dtype=np.int32)
+    if plan["roles"]:
+        role_points, role_weights, role_flags = [], [], []
+        for role in plan["roles"]:
+            rp = np.zeros(n)
+            rw = 0.0
+            flags: Dict[str, np.ndarray] = {}
+            if role["experience"] is not None:
+                fit = _experience_fit(role["experience"], m.experience)
+                rp += WEIGHTS["experience"] * fit
+                rw += WEIGHTS["experience"]
+                flags["experience"] = fit >= 0.75
+            if role["tech_level"] is not None:
+                ok = m.tech_level >= role["tech_level"]
+                rp += WEIGHTS["technology"] * ok
+                rw += WEIGHTS["technology"]
+                flags["technology"] = ok
+            elif role["tech_col"] is not None:
+                ok = hits[:, role["tech_col"]]
+                rp += WEIGHTS["technology"] * ok
+                rw += WEIGHTS["technology"]
+                flags["technology"] = ok
+            if role["role_col"] is not None:
+                ok = hits[:, role["role_col"]]
+                rp += WEIGHTS["roleName"] * ok
+                rw += WEIGHTS["roleName"]
+                flags["roleName"] = ok
+            role_points.append(rp)
+            role_weights.append(rw)
+            role_flags.append(flags)
+
+        rp_matrix = np.stack(role_points)                      # roles x specialists
+        rw_vector = np.array(role_weights)[:, None]
+        ratios = np.divide(rp_matrix, rw_vector, out=np.zeros_like(rp_matrix), where=rw_vector > 0)
+        best_role = np.argmax(ratios, axis=0).astype(np.int32)  # first max wins, like the single-SR engine
+        cols = np.arange(n)
+        points += rp_matrix[best_role, cols]
+        weight_vec = np.array(role_weights)[best_role]
+
+        for key in ("experience", "technology", "roleName"):
+            stacked = np.stack([f.get(key, np.zeros(n, dtype=bool)) for f in role_flags])
+            present = np.array([key in f for f in role_flags])
+            flag_vectors[key] = stacked[best_role, cols]
+            flag_present[key] = present[best_role]
+    else:
+        weight_vec = np.zeros(n)
+
+    # ---- criteria lists
+    counts: Dict[str, np.ndarray] = {}
+    for key in ("mustHave", "niceToHave", "languages"):
+        idx = plan[key]
+        if not idx:
+            continue
+        matched = hits[:, idx].sum(axis=1)
+        points += WEIGHTS[key] * matched / len(idx)
+        weight += WEIGHTS[key]
+        counts[key] = matched
+
+    points += WEIGHTS["availability"] * m.availability
+    weight += WEIGHTS["availability"]
+
+    total_weight = weight_vec + weight
+    scores = np.round(100.0 * np.divide(points, total_weight, out=np.zeros(n), where=total_weight > 0), 1)
+
+    # top-k: score desc, then cheaper daily rate, then created_at order
+    # (profiles are sorted by rank)
+    k = min(max(limit, 0), n)
+    if k == 0:
+        return []
+    rate = np.where(np.isnan(m.rate), np.inf, m.rate)
+    order = np.lexsort((np.arange(n), rate, -scores))[:k]
+
+    out = []
+    for i in order:
+        p = m.profiles[i]
+        matches: Dict[str, Any] = {}
+        for key in ("experience", "technology", "roleName"):
+            if key in flag_present and flag_present[key][i]:
+                matches[key] = bool(flag_vectors[key][i])
+        for key, matched in counts.items():
+            matches[key] = {"matched": int(matched[i]), "total": len(plan[key])}
+        matches["available"] = bool(m.availability[i] == 1.0)
+        out.append(
+            {
+                **p.as_dict(),
+                "score": float(scores[i]),
+                "bestRoleIndex": int(best_role[i]) if plan["roles"] else None,
+                "matches": matches,
+            }
+        )
+    return out
+
+
+def rank_specialists_for_requests(service_requests: Sequence, provider_id: str, *, limit: int = 3) -> Dict[str, Any]:
+    """
+    Top `limit` specialists for each service request, scored in one pass.
+
+    Same scores/flags as rank_specialists_for_request, but specialist
+    attributes are loaded once into NumPy arrays and all text criteria of all
+    requests are matched with a single bitset matmul.
+    """
+    m = SpecialistMatrix(get_skill_index(provider_id))
+    cols = _Columns(m)
+    plans = [_plan(sr, cols) for sr in service_requests]
+    hits = cols.match_matrix()
+
+    return {
+        "results": [
+            {"serviceRequestId": sr.id, "specialists": _score_request(m, plan, hits, limit)}
+            for sr, plan in zip(service_requests, plans)
+        ],
+        "eligibleCount": len(m),
+    }
@@ -0,0 +1,319 @@
+from __future__ import annotations
+
+import heapq
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set
+
+from django.core.cache import cache
+
+from accounts.models import User
+
+
+# ------------------------------------------------------------------
+# Normalization
+# ------------------------------------------------------------------
+_WORD_RE = re.compile(r"[a-z0-9][a-z0-9+#.]*")
+
+EXPERIENCE_ORDINAL = {"junior": 0, "mid": 1, "intermediate": 1, "senior": 2, "expert": 3}
+TECH_LEVEL_ORDINAL = {"basic": 0, "intermediate": 1, "advanced": 2, "expert": 3}
+AVAILABILITY_SCORE = {"Available": 1.0, "Partially Booked": 0.5}
+
+# Relative weight of each criterion; criteria the SR doesn't use are left out
+# of the denominator, so scores stay comparable (0..100).
+WEIGHTS = {
+    "experience": 25,
+    "technology": 20,
+    "roleName": 5,
+    "mustHave": 25,
+    "niceToHave": 10,
+    "languages": 10,
+    "availability": 5,
+}
+
+
+def words(text: Any) -> FrozenSet[str]:
+    """Lower-cased word tokens ("Node.js, AWS" -> {"node.js", "aws"})."""
+    return frozenset(w.rstrip(".") for w in _WORD_RE.findall(str(text or "").lower()))
+
+
+def normalize_phrase(text: Any) -> str:
+    return " ".join(sorted(words(text)))
+
+
+def _ordinal(table: Dict[str, int], value: Any) -> Optional[int]:
+    return table.get(str(value or "").strip().lower())
+
+
+# ------------------------------------------------------------------
+# Per-provider skill index
+# ------------------------------------------------------------------
+@dataclass
+class SpecialistProfile:
+    id: str
+    name: str
+    material_number: str
+    experience_level: str
+    technology_level: str
+    average_daily_rate: Optional[float]
+    availability: str
+    skills: List[str]
+    rank: int  # position in created_at order (stable tie-break)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "materialNumber": self.material_number,
+            "experienceLevel": self.experience_level,
+            "technologyLevel": self.technology_level,
+            "averageDailyRate": self.average_daily_rate,
+            "availability": self.availability,
+            "skills": self.skills,
+        }
+
+
+@dataclass
+class SkillIndex:
+    """
+    Eligible specialists of one provider plus an inverted skill index:
+      phrase_ids:   normalized skill phrase -> specialist ids
+      word_phrases: word token -> skill phrases containing it
+    Matching a free-text criterion only touches the postings of its words,
+    independent of the number of specialists.
+    """
+
+    profiles: Dict[str, SpecialistProfile] = field(default_factory=dict)
+    phrase_ids: Dict[str, Set[str]] = field(default_factory=dict)
+    word_phrases: Dict[str, Set[str]] = field(default_factory=dict)
+
+    def add(self, profile: SpecialistProfile) -> None:
+        self.profiles[profile.id] = profile
+        for skill in profile.skills:
+            phrase = normalize_phrase(skill)
+            if not phrase:
+                continue
+            self.phrase_ids.setdefault(phrase, set()).add(profile.id)
+            for w in phrase.split(" "):
+                self.word_phrases.setdefault(w, set()).add(phrase)
+
+    def phrases_matching_text(self, text: Any) -> Set[str]:
+        """Known skill phrases whose words all occur in `text`."""
+        text_words = words(text)
+        candidates: Set[str] = set()
+        for w in text_words:
+            candidates |= self.word_phrases.get(w, set())
+        return {phrase for phrase in candidates if set(phrase.split(" ")) <= text_words}
+
+    def ids_matching_text(self, text: Any) -> Set[str]:
+        """Specialists having at least one skill whose words all occur in `text`."""
+        ids: Set[str] = set()
+        for phrase in self.phrases_matching_text(text):
+            ids |= self.phrase_ids[phrase]
+        return ids
+
+
+INDEX_CACHE_TTL_SECONDS = 600
+
+
+def _index_cache_key(provider_id: str) -> str:
+    return f"matching:skill-index:v1:{provider_id}"
+
+
+def eligible_specialists(provider_id: str):
+    return (
+        User.objects.filter(provider_id=provider_id, role="Specialist", is_active=True)
+        .exclude(availability="Fully Booked")
+    )
+
+
+def build_skill_index(provider_id: str) -> SkillIndex:
+    index = SkillIndex()
+    rows = (
+        eligible_specialists(provider_id)
+        .order_by("created_at", "id")
+        .values_list(
+            "id", "name", "material_number", "experience_level", "technology_level",
+            "average_daily_rate", "availability", "skills",
+        )
+    )
+    for rank, (uid, name, material, exp, tech, rate, availability, skills) in enumerate(rows):
+        index.add(
+            SpecialistProfile(
+                id=uid,
+                name=name,
+                material_number=material or "",
+                experience_level=exp or "",
+                technology_level=tech or "",
+                average_daily_rate=float(rate) if rate is not None else None,
+                availability=availability or "",
+                skills=[str(s) for s in skills] if isinstance(skills, list) else [],
+                rank=rank,
+            )
+        )
+    return index
+
+
+def get_skill_index(provider_id: str) -> SkillIndex:
+    """Cached per provider; dropped by procurement.signals when a specialist changes."""
+    key = _index_cache_key(provider_id)
+    index = cache.get(key)
+    if index is None:
+        index = build_skill_index(provider_id)
+        cache.set(key, index, INDEX_CACHE_TTL_SECONDS)
+    return index
+
+
+def invalidate_skill_index(provider_id: Optional[str]) -> None:
+    if provider_id:
+        cache.delete(_index_cache_key(provider_id))
+
+
+# ------------------------------------------------------------------
+# Scoring
+# ------------------------------------------------------------------
+def _experience_fit(required: Optional[int], actual: Optional[int]) -> float:
+    if required is None or actual is None:
+        return 0.0
+    if actual == required:
+        return 1.0
+    if actual > required:
+        return 0.75  # over-qualified: fits, but usually pricier
+    if actual == required - 1:
+        return 0.25
+    return 0.0
+
+
+@dataclass
+class _RoleTarget:
+    experience: Optional[int]
+    tech_level: Optional[int]
+    tech_ids: Optional[Set[str]]  # technology given as a skill name
+    role_name_ids: Optional[Set[str]]
+
+
+def _role_targets(roles: Iterable[Any], index: SkillIndex) -> List[_RoleTarget]:
+    targets = []
+    for r in roles:
+        if not isinstance(r, dict):
+            continue
+        technology = r.get("technology")
+        tech_level = _ordinal(TECH_LEVEL_ORDINAL, technology)
+        targets.append(
+            _RoleTarget(
+                experience=_ordinal(EXPERIENCE_ORDINAL, r.get("experienceLevel")),
+                tech_level=tech_level,
+                # "technology" is either a level (Advanced) or a skill (Node.js)
+                tech_ids=index.ids_matching_text(technology) if technology and tech_level is None else None,
+                role_name_ids=index.ids_matching_text(r.get("roleName")) if r.get("roleName") else None,
+            )
+        )
+    return targets
+
+
+def _role_fit(target: _RoleTarget, p: SpecialistProfile):
+    """(weighted points, applicable weight, flags) of one specialist for one SR role."""
+    points = 0.0
+    weight = 0.0
+    flags: Dict[str, bool] = {}
+
+    if target.experience is not None:
+        fit = _experience_fit(target.experience, _ordinal(EXPERIENCE_ORDINAL, p.experience_level))
+        points += WEIGHTS["experience"] * fit
+        weight += WEIGHTS["experience"]
+        flags["experience"] = fit >= 0.75
+
+    if target.tech_level is not None:
+        actual = _ordinal(TECH_LEVEL_ORDINAL, p.technology_level)
+        ok = actual is not None and actual >= target.tech_level
+        points += WEIGHTS["technology"] * ok
+        weight += WEIGHTS["technology"]
+        flags["technology"] = ok
+    elif target.tech_ids is not None:
+        ok = p.id in target.tech_ids
+        points += WEIGHTS["technology"] * ok
+        weight += WEIGHTS["technology"]
+        flags["technology"] = ok
+
+    if target.role_name_ids is not None:
+        ok = p.id in target.role_name_ids
+        points += WEIGHTS["roleName"] * ok
+        weight += WEIGHTS["roleName"]
+        flags["roleName"] = ok
+
+    return points, weight, flags
+
+
+def _criteria_ids(index: SkillIndex, criteria: Any) -> List[Set[str]]:
+    items = criteria if isinstance(criteria, list) else []
+    return [index.ids_matching_text(c) for c in items if str(c or "").strip()]
+
+
+def rank_specialists_for_request(sr, provider_id: str, *, limit: int = 10) -> Dict[str, Any]:
+    """
+    Score every eligible specialist of the provider against ALL roles and
+    criteria of the service request in one pass and return the top `limit`:
+
+      {
+        "specialists": [ {...profile, score, bestRoleIndex, matches: {...}} ],
+        "eligibleCount": N,
+      }
+
+    Per-criterion sets of matching specialists are computed once from the
+    skill index; the per-specialist loop is only set lookups.
+    """
+    index = get_skill_index(provider_id)
+
+    roles = sr.roles if isinstance(sr.roles, list) else []
+    role_targets = _role_targets(roles, index)
+    must_sets = _criteria_ids(index, sr.must_have_criteria)
+    nice_sets = _criteria_ids(index, sr.nice_to_have_criteria)
+    lang_sets = _criteria_ids(index, sr.required_languages)
+
+    scored = []
+    for p in index.profiles.values():
+        points = 0.0
+        weight = 0.0
+        matches: Dict[str, Any] = {}
+
+        # best-fitting role for this specialist
+        best_role = None
+        best = None
+        for i, target in enumerate(role_targets):
+            r_points, r_weight, r_flags = _role_fit(target, p)
+            ratio = r_points / r_weight if r_weight else 0.0
+            if best is None or ratio > best[0]:
+                best = (ratio, r_points, r_weight, r_flags)
+                best_role = i
+        if best is not None:
+            points += best[1]
+            weight += best[2]
+            matches.update(best[3])
+
+        for key, sets in (("mustHave", must_sets), ("niceToHave", nice_sets), ("languages", lang_sets)):
+            if not sets:
+                continue
+            hit = sum(1 for s in sets if p.id in s)
+            points += WEIGHTS[key] * hit / len(sets)
+            weight += WEIGHTS[key]
+            matches[key] = {"matched": hit, "total": len(sets)}
+
+        availability = AVAILABILITY_SCORE.get(p.availability, 0.0)
+        points += WEIGHTS["availability"] * availability
+        weight += WEIGHTS["availability"]
+        matches["available"] = availability == 1.0
+
+        score = round(100.0 * points / weight, 1) if weight else 0.0
+        rate = p.average_daily_rate if p.average_daily_rate is not None else float("inf")
+        scored.append((score, -rate, -p.rank, p, best_role, matches))
+
+    # score desc, then cheaper daily rate, then created_at order
+    top = heapq.nlargest(max(limit, 0), scored, key=lambda t: (t[0], t[1], t[2]))
+
+    return {
+        "specialists": [
+            {**p.as_dict(), "score": score, "bestRoleIndex": best_role, "matches": matches}
+            for score, _, _, p, best_role, matches in top
+        ],
+        "eligibleCount": len(index.profiles),
+    }
@@ -0,0 +1,53 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from accounts.models import User
+from procurement.services.specialist_matching import invalidate_skill_index
+
+
+# User columns that feed the specialist skill index
+MATCHING_FIELDS = {
+    "name",
+    "role",
+    "provider",
+    "is_active",
+    "material_number",
+    "experience_level",
+    "technology_level",
+    "average_daily_rate",
+    "availability",
+    "skills",
+}
+
+
+@receiver(pre_save, sender=User)
+def specialist_pre_save(sender, instance, raw=False, update_fields=None, **kwargs):
+    # a specialist moved to another provider must drop out of the old index too
+    instance._skill_index_old_provider_id = None
+    if raw or instance._state.adding:
+        return
+    if update_fields is not None and not ({"provider", "provider_id"} & set(update_fields)):
+        return
+    old = sender.objects.filter(pk=instance.pk).values_list("provider_id", flat=True).first()
+    if old != instance.provider_id:
+        instance._skill_index_old_provider_id = old
+
+
+@receiver(post_save, sender=User)
+def specialist_saved(sender, instance, created, update_fields=None, **kwargs):
+    old_provider_id = getattr(instance, "_skill_index_old_provider_id", None)
+    instance._skill_index_old_provider_id = None
+    if old_provider_id:
+        transaction.on_commit(partial(invalidate_skill_index, old_provider_id))
+    # login only touches last_login -> skip
+    if update_fields is not None and not (MATCHING_FIELDS & set(update_fields)):
+        return
+    transaction.on_commit(partial(invalidate_skill_index, instance.provider_id))
+
+
+@receiver(post_delete, sender=User)
+def specialist_deleted(sender, instance, **kwargs):
+    transaction.on_commit(partial(invalidate_skill_index, instance.provider_id))
@@ -1,3 +1,475 @@
+import re
+import unittest
+from datetime import date, timedelta
+from decimal import Decimal
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from contracts.models import Contract, ContractProviderStatus
+from providers.models import Provider
+
+from .models import (
+    ServiceOffer,
+    ServiceOrder,
+    ServiceOrderAssignment,
+    ServiceOrderChangeRequest,
+    ServiceRequest,
+)
+
+
+class ServiceOrderListQueryCountTests(TestCase):
+    """GET /api/service-orders/ must not issue queries per order or per assignment."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.provider = Provider.objects.create(
+            id="P900", name="Provider", contact_name="c", contact_email="c@example.com",
+            contact_phone="1", address="a", created_at=date.today(),
+        )
+        cls.admin = User.objects.create_user(
+            email="admin@example.com", password="pw", id="U900", name="Admin",
+            role="Provider Admin", provider=cls.provider, created_at=date.today(),
+        )
+        cls.specialists = [
+            User.objects.create_user(
+                email=f"s{i}@example.com", password="pw", id=f"S90{i}", name=f"Specialist {i}",
+                role="Specialist", provider=cls.provider, created_at=date.today(), material_number=f"M{i}",
+            )
+            for i in range(3)
+        ]
+
+    def _create_orders(self, count):
+        for _ in range(count):
+            n = ServiceRequest.objects.count()
+            sr = ServiceRequest.objects.create(id=f"SR9{n:03d}", title="SR", type="TEAM", contract_id="C900")
+            offer = ServiceOffer.objects.create(service_request=sr, provider=self.provider, status="ACCEPTED")
+            order = ServiceOrder.objects.create(
+                service_offer=offer, service_request=sr, provider=self.provider, title="Order",
+                man_days=10, total_cost=Decimal("100"),
+            )
+            ServiceOrderAssignment.objects.bulk_create(
+                [ServiceOrderAssignment(order=order, specialist=s, daily_rate=Decimal("500")) for s in self.specialists]
+            )
+
+    def _get(self, path="/api/service-orders/", user=None):
+        client = APIClient()
+        client.force_authenticate(user or self.admin)
+        return client.get(path)
+
+    def test_query_count_is_independent_of_orders_and_assignments(self):
+        self._create_orders(2)
+        with self.assertNumQueries(2):  # orders page + assignments joined to specialists
+            small = self._get()
+
+        self._create_orders(8)
+        with self.assertNumQueries(2):
+            large = self._get()
+
+        self.assertEqual(len(small.data["results"]), 2)
+        self.assertEqual(len(large.data["results"]), 10)
+        assignment = large.data["results"][0]["assignments"][0]
+        self.assertEqual(assignment["specialistName"], "Specialist 0")
+        self.assertEqual(assignment["materialNumber"], "M0")
+
+    def test_since_filter(self):
+        self._create_orders(2)
+        ServiceOrder.objects.filter(id=ServiceOrder.objects.order_by("id").first().id).update(
+            created_at=timezone.now() - timedelta(days=30)
+        )
+        since = (timezone.localdate() - timedelta(days=1)).isoformat()
+        self.assertEqual(len(self._get(f"/api/service-orders/?since={since}").data["results"]), 1)
+        self.assertEqual(self._get("/api/service-orders/?since=yesterday").status_code, 400)
+
+    def test_specialist_sees_only_assigned_orders(self):
+        self._create_orders(3)
+        ServiceOrderAssignment.objects.filter(
+            specialist=self.specialists[0], order=ServiceOrder.objects.order_by("id").first()
+        ).delete()
+
+        with self.assertNumQueries(2):
+            response = self._get(user=self.specialists[0])
+        self.assertEqual(len(response.data["results"]), 2)  # no duplicate rows per assignment
+        self.assertEqual(len(self._get(user=self.specialists[1]).data["results"]), 3)
+
+
+class ChangeRequestCreateTests(TestCase):
+    """POST /api/service-order-change-requests/ saves the CR and forwards it to Group3."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.provider = Provider.objects.create(
+            id="P920", name="Provider", contact_name="c", contact_email="c@example.com",
+            contact_phone="1", address="a", created_at=date.today(),
+        )
+        cls.rep = User.objects.create_user(
+            email="cr-rep@example.com", password="pw", id="U920", name="Rep",
+            role="Supplier Representative", provider=cls.provider, created_at=date.today(),
+        )
+        cls.old, cls.new = [
+            User.objects.create_user(
+                email=f"cr-s{i}@example.com", password="pw", id=f"S92{i}", name=f"Specialist {i}",
+                role="Specialist", provider=cls.provider, created_at=date.today(),
+            )
+            for i in range(2)
+        ]
+        sr = ServiceRequest.objects.create(id="SR920", title="SR", type="SINGLE", contract_id="C920")
+        offer = ServiceOffer.objects.create(service_request=sr, provider=cls.provider, status="ACCEPTED")
+        cls.order = ServiceOrder.objects.create(service_offer=offer, service_request=sr, provider=cls.provider)
+        ServiceOrderAssignment.objects.create(order=cls.order, specialist=cls.old)
+
+    def _post(self, payload):
+        client = APIClient()
+        client.force_authenticate(self.rep)
+        group3 = mock.Mock(status_code=201, text="")
+        group3.json.return_value = {"accepted": True}
+        with mock.patch("procurement.views.http_client.post", return_value=group3) as post:
+            response = client.post("/api/service-order-change-requests/", payload, format="json")
+        return response, post
+
+    def test_substitution(self):
+        response, post = self._post({"serviceOrderId": self.order.id, "newSpecialistId": self.new.id, "reason": "r"})
+        self.assertEqual(response.status_code, 201, response.data)
+        cr = ServiceOrderChangeRequest.objects.get(service_order=self.order)
+        self.assertEqual((cr.type, cr.status, cr.created_by_system), ("Substitution", "Requested", False))
+        self.assertEqual((cr.old_specialist_id, cr.new_specialist_id), (self.old.id, self.new.id))
+        self.assertEqual(cr.group3_last_status, 201)
+        self.assertEqual(post.call_args.kwargs["json"]["body"]["newSpecialistName"], "Specialist 1")
+
+    def test_extension(self):
+        response, _ = self._post({"serviceOrderId": self.order.id, "newEndDate": "2027-01-31", "additionalManDays": 5})
+        self.assertEqual(response.status_code, 201, response.data)
+        cr = ServiceOrderChangeRequest.objects.get(service_order=self.order)
+        self.assertEqual((cr.type, str(cr.new_end_date), cr.additional_man_days), ("Extension", "2027-01-31", 5))
+
+
+class ServiceRequestSyncTests(TestCase):
+    """One bad Group3 item fails itself, never the whole sync."""
+
+    def _item(self, n, **extra):
+        return {"requestNumber": f"SR-SYNC-{n:03d}", "title": f"Request {n}", "type": "single", **extra}
+
+    def test_invalid_values_are_reported_per_item(self):
+        from .services.service_request_sync import sync_group3_service_requests
+
+        result = sync_group3_service_requests(
+            [self._item(1), self._item(2, title="x" * 300), self._item(3, maxOffers="many"), "junk", self._item(4)]
+        )
+        self.assertEqual((result.inserted, result.failed), (2, 3))
+        self.assertEqual([e["index"] for e in result.errors], [1, 2, 3])
+        self.assertIn("title", result.errors[0]["error"])
+        self.assertEqual(set(ServiceRequest.objects.values_list("id", flat=True)), {"SR-SYNC-001", "SR-SYNC-004"})
+
+    @unittest.skipUnless(connection.vendor == "postgresql", "jsonb rejects \\u0000")
+    def test_rejected_row_does_not_roll_back_its_batch(self):
+        from .services.service_request_sync import sync_group3_service_requests
+
+        items = [self._item(n) for n in range(5)]
+        items[2]["notes"] = "nul \u0000 byte"  # passes cleaning, fails in the database
+        result = sync_group3_service_requests(items, batch_size=10)
+
+        self.assertEqual((result.inserted, result.failed), (4, 1))
+        self.assertEqual(result.errors[0]["requestNumber"], "SR-SYNC-002")
+        self.assertEqual(ServiceRequest.objects.filter(id__startswith="SR-SYNC-").count(), 4)
+
+
+class SkillIndexInvalidationTests(TestCase):
+    """The cached per-provider SkillIndex follows specialist saves."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.providers = [
+            Provider.objects.create(
+                id=f"P94{n}", name=f"Provider {n}", contact_name="c", contact_email="c@example.com",
+                contact_phone="1", address="a", created_at=date.today(),
+            )
+            for n in range(2)
+        ]
+
+    def setUp(self):
+        cache.clear()
+
+    def test_moving_a_specialist_invalidates_both_providers(self):
+        from .services.specialist_matching import get_skill_index
+
+        old, new = self.providers
+        with self.captureOnCommitCallbacks(execute=True):
+            user = User.objects.create_user(
+                email="index-move@example.com", password="pw", id="S940", name="Specialist",
+                role="Specialist", provider=old, created_at=date.today(), skills=["Python"],
+            )
+        self.assertIn(user.id, get_skill_index(old.id).profiles)
+        self.assertNotIn(user.id, get_skill_index(new.id).profiles)
+
+        user.provider = new
+        with self.captureOnCommitCallbacks(execute=True):
+            user.save(update_fields=["provider"])
+        self.assertNotIn(user.id, get_skill_index(old.id).profiles)
+        self.assertIn(user.id, get_skill_index(new.id).profiles)
+
+
+class SpecialistBatchScoringParityTests(TestCase):
+    """The vectorized batch scorer ranks exactly like the per-request engine."""
+
+    SPECIALISTS = [
+        # experience, technology level, daily rate, availability, skills
+        ("Senior", "Advanced", "700", "Available", ["Python", "Django", "German"]),
+        ("Senior", "Advanced", "700", "Available", ["Python", "Django", "German"]),  # tie -> created_at order
+        ("Expert", "Expert", "950", "Partially Booked", ["Python", "Kubernetes", "English"]),
+        ("Mid", "Intermediate", "500", "Available", ["Java", "Spring Boot", "English"]),
+        ("Junior", "Basic", None, "Available", ["Python"]),
+        ("Senior", None, "650", "Partially Booked", ["Terraform", "AWS", "DevOps Engineer"]),
+        (None, "Advanced", "800", "Available", ["Data Engineer", "Spark", "German", "English"]),
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.provider = Provider.objects.create(
+            id="P930", name="Provider", contact_name="c", contact_email="c@example.com",
+            contact_phone="1", address="a", created_at=date.today(),
+        )
+        for n, (exp, tech, rate, availability, skills) in enumerate(cls.SPECIALISTS):
+            User.objects.create_user(
+                email=f"parity{n}@example.com", password="pw", id=f"S93{n}", name=f"Specialist {n}",
+                role="Specialist", provider=cls.provider, created_at=date.today(),
+                experience_level=exp, technology_level=tech,
+                average_daily_rate=Decimal(rate) if rate else None, availability=availability, skills=skills,
+            )
+        cls.requests = [
+            ServiceRequest.objects.create(
+                id="SR930", title="Backend", type="SINGLE", contract_id="C930",
+                roles=[{"roleName": "Python Developer", "experienceLevel": "Senior", "technology": "Advanced"}],
+                must_have_criteria=["Python", "Django"], nice_to_have_criteria=["Kubernetes"],
+                required_languages=["German"],
+            ),
+            ServiceRequest.objects.create(
+                id="SR931", title="Platform", type="TEAM", contract_id="C930",
+                roles=[
+                    {"roleName": "DevOps Engineer", "experienceLevel": "Senior", "technology": "Terraform"},
+                    {"roleName": "Data Engineer", "experienceLevel": "Expert", "technology": "Spark"},
+                ],
+                must_have_criteria=["AWS"], required_languages=["English"],
+            ),
+            ServiceRequest.objects.create(id="SR932", title="No criteria", type="SINGLE", contract_id="C930"),
+        ]
+
+    def setUp(self):
+        cache.clear()
+
+    def test_batch_scores_match_the_single_request_engine(self):
+        from .services.specialist_batch_scoring import rank_specialists_for_requests
+        from .services.specialist_matching import rank_specialists_for_request
+
+        limit = len(self.SPECIALISTS)
+        batch = rank_specialists_for_requests(self.requests, self.provider.id, limit=limit)
+        self.assertEqual(batch["eligibleCount"], limit)
+        for sr, result in zip(self.requests, batch["results"]):
+            single = rank_specialists_for_request(sr, self.provider.id, limit=limit)["specialists"]
+            self.assertEqual(result["serviceRequestId"], sr.id)
+            self.assertEqual(
+                [(s["id"], s["score"], s["bestRoleIndex"], s["matches"]) for s in result["specialists"]],
+                [(s["id"], s["score"], s["bestRoleIndex"], s["matches"]) for s in single],
+                sr.id,
+            )
+
+
+@unittest.skipUnless(connection.vendor == "postgresql", "?q= uses PostgreSQL full-text search (SearchVector)")
+class ServiceRequestSearchTests(TestCase):
+    """GET /api/service-requests/?q=...&ordering=..."""
+
+    @classmethod
+    def setUpTestData(cls):
+        provider = Provider.objects.create(
+            id="P950", name="Provider", contact_name="c", contact_email="c@example.com",
+            contact_phone="1", address="a", created_at=date.today(),
+        )
+        contract = Contract.objects.create(id="C950", title="Contract", status="ACTIVE")
+        ContractProviderStatus.objects.create(contract=contract, provider=provider, status="ACTIVE")
+        cls.admin = User.objects.create_user(
+            email="search-admin@example.com", password="pw", id="U950", name="Admin",
+            role="Provider Admin", provider=provider, created_at=date.today(),
+        )
+        ServiceRequest.objects.create(
+            id="SR-000101", title="Kubernetes migration", type="SINGLE", contract_id=contract.id,
+            roles=[{"roleName": "DevOps Engineer", "technology": "Terraform"}],
+        )
+        ServiceRequest.objects.create(
+            id="SR-000102", title="Reporting", type="SINGLE", contract_id=contract.id,
+            roles=[{"roleName": "Data Engineer"}],
+        )
+        for n in range(5):
+            ServiceRequest.objects.create(id=f"SR-00020{n}", title="Same title", type="SINGLE", contract_id=contract.id)
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def _ids(self, query: str):
+        resp = self.client.get(f"/api/service-requests/?view=summary&{query}")
+        self.assertEqual(resp.status_code, 200, resp.content)
+        return [row["id"] for row in resp.data["results"]], resp.data["next"]
+
+    def test_search_matches_text_id_and_role(self):
+        self.assertEqual(self._ids("q=kubernetes")[0], ["SR-000101"])
+        self.assertEqual(self._ids("q=sr-000102")[0], ["SR-000102"])
+        self.assertEqual(self._ids("q=000102")[0], [])  # request numbers match by prefix only
+        self.assertEqual(self._ids("q=devops")[0], ["SR-000101"])
+        self.assertEqual(self._ids("q=terraform")[0], ["SR-000101"])
+
+    def test_summary_sends_role_totals_not_roles(self):
+        resp = self.client.get("/api/service-requests/?view=summary&q=kubernetes")
+        row = resp.data["results"][0]
+        self.assertNotIn("roles", row)
+        self.assertEqual(
+            row["roleSummary"],
+            {"primaryRole": "DevOps Engineer", "technology": "Terraform", "count": 1, "manDays": 0, "onsiteDays": 0},
+        )
+
+    def test_title_ordering_pages_through_equal_titles(self):
+        seen = []
+        with CaptureQueriesContext(connection) as ctx:
+            ids, next_url = self._ids("q=SR-00020&ordering=title&page_size=2")
+        sql = next(q["sql"] for q in ctx.captured_queries if 'FROM "procurement_servicerequest"' in q["sql"])
+        self.assertRegex(sql, r'ORDER BY "procurement_servicerequest"."title" ASC, "procurement_servicerequest"."id" ASC')
+        seen += ids
+        while next_url:
+            resp = self.client.get(next_url)
+            seen += [row["id"] for row in resp.data["results"]]
+            next_url = resp.data["next"]
+        self.assertEqual(seen, [f"SR-00020{n}" for n in range(5)])
+
+
+@unittest.skipUnless(connection.vendor == "postgresql", "EXPLAIN plans are Postgres specific")
+class ListEndpointIndexPlanTests(TestCase):
+    """
+    Seeds many providers/contracts, then EXPLAINs the SQL each list endpoint
+    actually runs for one provider: the listed table must be read through an
+    index, never with a sequential scan.
+    """
+
+    PROVIDERS = 40
+    SR_PER_CONTRACT = 100
+    OFFERS_PER_PROVIDER = 50
+
+    @classmethod
+    def setUpTestData(cls):
+        today = date.today()
+        now = timezone.now()
+        providers = Provider.objects.bulk_create(
+            [
+                Provider(
+                    id=f"PX{p:03d}", name=f"Provider {p}", contact_name="c", contact_email="c@example.com",
+                    contact_phone="1", address="a", created_at=today,
+                )
+                for p in range(cls.PROVIDERS)
+            ]
+        )
+        contracts = Contract.objects.bulk_create(
+            [Contract(id=f"CX{p:03d}", title=f"Contract {p}", status="ACTIVE") for p in range(cls.PROVIDERS)]
+        )
+        ContractProviderStatus.objects.bulk_create(
+            [
+                ContractProviderStatus(contract=c, provider=p, status="ACTIVE" if i == j else "IN_NEGOTIATION")
+                for i, p in enumerate(providers)
+                for j, c in enumerate(contracts)
+            ]
+        )
+        srs = ServiceRequest.objects.bulk_create(
+            [
+                ServiceRequest(
+                    id=f"SRX{c:03d}{n:04d}", title="SR", type="SINGLE", contract_id=contracts[c].id,
+                    status="APPROVED_FOR_BIDDING" if n % 10 == 0 else "CLOSED", bidding_active=n % 10 == 0,
+                )
+                for c in range(cls.PROVIDERS)
+                for n in range(cls.SR_PER_CONTRACT)
+            ]
+        )
+        offers = ServiceOffer.objects.bulk_create(
+            [
+                ServiceOffer(service_request=srs[p * cls.SR_PER_CONTRACT + n], provider=provider, status="ACCEPTED")
+                for p, provider in enumerate(providers)
+                for n in range(cls.OFFERS_PER_PROVIDER)
+            ]
+        )
+        orders = ServiceOrder.objects.bulk_create(
+            [ServiceOrder(service_offer=o, service_request_id=o.service_request_id, provider_id=o.provider_id) for o in offers]
+        )
+        ServiceOrderChangeRequest.objects.bulk_create(
+            [
+                ServiceOrderChangeRequest(
+                    service_order=o, provider_id=o.provider_id, type="Extension", new_end_date=today,
+                    status="Requested" if n % 50 == 0 else "Approved",
+                )
+                for p in range(cls.PROVIDERS)
+                for n, o in enumerate(orders[p * cls.OFFERS_PER_PROVIDER:][: cls.OFFERS_PER_PROVIDER] * 8)
+            ]
+        )
+        # spread created_at so keyset ordering is meaningful
+        for model in (ServiceRequest, ServiceOffer, ServiceOrder, ServiceOrderChangeRequest):
+            model.objects.update(created_at=now - timedelta(days=1))
+
+        cls.admin = User.objects.create_user(
+            email="plan-admin@example.com", password="pw", id="UPX1", name="Admin",
+            role="Provider Admin", provider=providers[7], created_at=today,
+        )
+
+        with connection.cursor() as cursor:
+            for model in (ServiceRequest, ServiceOffer, ServiceOrder, ServiceOrderChangeRequest, ContractProviderStatus):
+                cursor.execute(f'ANALYZE "{model._meta.db_table}"')
+
+    def setUp(self):
+        cache.clear()  # entitlement lookups must hit the database
+
+    def _plan_for(self, path: str, model) -> str:
+        client = APIClient()
+        client.force_authenticate(self.admin)
+        with CaptureQueriesContext(connection) as ctx:
+            response = client.get(path)
+        self.assertEqual(response.status_code, 200, response.content)
+
+        table = model._meta.db_table
+        sql = next((q["sql"] for q in ctx.captured_queries if re.search(rf'\bFROM "{table}"', q["sql"])), None)
+        self.assertIsNotNone(sql, f"{path} did not query {table}")
+        with connection.cursor() as cursor:
+            cursor.execute("EXPLAIN " + sql)
+            return "\n".join(row[0] for row in cursor.fetchall())
+
+    def assertIndexScan(self, path: str, model):
+        plan = self._plan_for(path, model)
+        table = model._meta.db_table
+        self.assertNotRegex(plan, rf"Seq Scan on {table}\b", f"{path}:\n{plan}")
+        self.assertRegex(plan, rf"Index (Only )?Scan (Backward )?using \w+ on {table}\b|Bitmap Index Scan", f"{path}:\n{plan}")
+
+    def test_entitlement_lookup(self):
+        self.assertIndexScan("/api/service-requests/", ContractProviderStatus)
+
+    def test_service_request_list(self):
+        self.assertIndexScan("/api/service-requests/", ServiceRequest)
+
+    def test_service_request_search(self):
+        self.assertIndexScan("/api/service-requests/?q=kubernetes", ServiceRequest)
+        self.assertIn("sr_search_gin", self._plan_for("/api/service-requests/?q=kubernetes", ServiceRequest))
+        self.assertIndexScan("/api/service-requests/?q=SRX0070", ServiceRequest)
+
+    def test_open_for_bidding_list(self):
+        self.assertIndexScan("/api/service-requests/?status=APPROVED_FOR_BIDDING&bidding_active=true", ServiceRequest)
+
+    def test_service_offer_list(self):
+        self.assertIndexScan("/api/service-offers/", ServiceOffer)
+
+    def test_service_order_list(self):
+        self.assertIndexScan("/api/service-orders/", ServiceOrder)
+
+    def test_change_request_list(self):
+        self.assertIndexScan("/api/service-order-change-requests/", ServiceOrderChangeRequest)
 
-# Create your tests here.
+    def test_pending_change_requests_use_partial_index(self):
+        plan = self._plan_for("/api/service-order-change-requests/?status=Requested", ServiceOrderChangeRequest)
+        self.assertIn("cr_provider_pending_idx", plan)
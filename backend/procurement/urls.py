@@ -4,11 +4,13 @@ from .views import (
     ServiceRequestDetailView,
     Group3SyncServiceRequestsView,
     ServiceOfferListCreateView,
+    BulkServiceOfferCreateView,
     ServiceOfferDetailView,
     ServiceOrderListView,
     ServiceOrderDetailView,
     Group3OfferDecisionWebhookView,
     SuggestedSpecialistsView,
+    BatchSuggestedSpecialistsView,
     ServiceOrderChangeRequestListCreateView,
     ServiceOrderChangeRequestDecisionView,
     Group3InboundExtensionCreateView,
@@ -18,6 +20,11 @@ from .views import (
 urlpatterns = [
     # Service Requests
     path("service-requests/", ServiceRequestListView.as_view(), name="service-requests"),
+    path(
+        "service-requests/suggested-specialists/batch/",
+        BatchSuggestedSpecialistsView.as_view(),
+        name="service-requests-suggested-specialists-batch",
+    ),
     path("service-requests/<str:id>/", ServiceRequestDetailView.as_view(), name="service-request-detail"),
 
     # Group3 sync
@@ -25,6 +32,7 @@ urlpatterns = [
 
     # Service Offers
     path("service-offers/", ServiceOfferListCreateView.as_view(), name="service-offers"),
+    path("service-offers/bulk/", BulkServiceOfferCreateView.as_view(), name="service-offers-bulk"),
     path("service-offers/<int:id>/", ServiceOfferDetailView.as_view(), name="service-offer-detail"),
 
     # Group3 → offer decision callback (SECURED)
@@ -1,33 +1,54 @@
 import requests
 from django.conf import settings
-from django.db import transaction
+from django.contrib.postgres.search import SearchQuery
+from django.db import connection, transaction
+from django.db.models import Q
 from django.utils import timezone
 from django.utils.dateparse import parse_date, parse_datetime
 from rest_framework import generics
 from rest_framework.permissions import IsAuthenticated, AllowAny
-from rest_framework.exceptions import PermissionDenied, NotFound
+from rest_framework.exceptions import PermissionDenied, NotFound, ValidationError
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from typing import Any, Dict
 from copy import deepcopy
+from datetime import datetime, time
 from decimal import Decimal
 
 from activitylog.utils import log_activity
-from contracts.models import ContractProviderStatus
-
-from accounts.models import User
-from .models import ServiceRequest, ServiceOffer, ServiceOrder, ServiceOrderAssignment, ServiceOrderChangeRequest
+from contracts.services.entitlements import active_contract_ids_for, is_active_for_contract
+
+from .models import (
+    ServiceRequest,
+    ServiceOffer,
+    ServiceOrder,
+    ServiceOrderChangeRequest,
+    service_request_search_vector,
+)
+from .pagination import (
+    ChangeRequestCursorPagination,
+    ServiceOrderCursorPagination,
+    ServiceRequestCursorPagination,
+    TiebreakOrderingFilter,
+)
 from .serializers import (
     ServiceRequestSerializer,
+    ServiceRequestSummarySerializer,
     ServiceOfferSerializer,
     ServiceOfferCreateSerializer,
     ServiceOrderSerializer,
-    upsert_group3_service_request,
     ServiceOrderChangeRequestSerializer,
     ServiceOrderChangeRequestCreateSerializer,
     ServiceOrderChangeRequestDecisionSerializer,
 )
 from procurement.auth import Group3ApiKeyAuthentication
+from integrations import http_client
+from integrations.jobs import enqueue_job
+from .services.bulk_offers import submit_offers
+from .services.group3 import enqueue_offer_for_group3, group3_headers
+from .services.service_orders import assigned_to_specialist, assignments_prefetch, create_order_assignments
+from .services.specialist_batch_scoring import rank_specialists_for_requests
+from .services.specialist_matching import eligible_specialists, get_skill_index, rank_specialists_for_request
 
 
 def _assert_can_view_service_requests(user):
@@ -52,20 +73,139 @@ def _sr_total_man_days(sr: ServiceRequest) -> int:
     return int(total)
 
 
+def _parse_bool_param(params, name: str) -> bool | None:
+    raw = params.get(name)
+    if raw is None or str(raw).strip() == "":
+        return None
+    v = str(raw).strip().lower()
+    if v in ["true", "1", "yes"]:
+        return True
+    if v in ["false", "0", "no"]:
+        return False
+    raise ValidationError({name: "Must be true or false."})
+
+
+def _parse_date_param(params, name: str):
+    raw = params.get(name)
+    if not raw:
+        return None
+    d = parse_date(str(raw))
+    if not d:
+        raise ValidationError({name: "Must be a date (YYYY-MM-DD)."})
+    return d
+
+
+def _parse_datetime_param(params, name: str):
+    """ISO datetime, or a plain date meaning its start (in the current timezone)."""
+    raw = params.get(name)
+    if not raw:
+        return None
+    raw = str(raw)
+    try:
+        dt = parse_datetime(raw)
+        if dt is None:
+            d = parse_date(raw)
+            dt = datetime.combine(d, time.min) if d else None
+    except ValueError:
+        dt = None
+    if dt is None:
+        raise ValidationError({name: "Must be a date (YYYY-MM-DD) or an ISO 8601 datetime."})
+    if timezone.is_naive(dt):
+        dt = timezone.make_aware(dt)
+    return dt
+
+
+def _filter_service_requests(qs, params):
+    """
+    Server-side narrowing for the service request list:
+      status, type, contract      exact match (comma-separated for several)
+      bidding_active              true|false
+      date_from, date_to          SR period overlaps the window
+      q                           full-text over title, task_description, project_name and
+                                  role names/technologies, or a request number prefix
+    """
+    for param, field in [("status", "status"), ("type", "type"), ("contract", "contract_id")]:
+        raw = str(params.get(param) or "").strip()
+        if not raw:
+            continue
+        values = [v.strip() for v in raw.split(",") if v.strip()]
+        if param == "type":
+            values = [v.upper() for v in values]
+        qs = qs.filter(**{f"{field}__in": values})
+
+    bidding_active = _parse_bool_param(params, "bidding_active")
+    if bidding_active is not None:
+        qs = qs.filter(bidding_active=bidding_active)
+
+    date_from = _parse_date_param(params, "date_from")
+    date_to = _parse_date_param(params, "date_to")
+    if date_from:
+        qs = qs.filter(Q(end_date__isnull=True) | Q(end_date__gte=date_from))
+    if date_to:
+        qs = qs.filter(Q(start_date__isnull=True) | Q(start_date__lte=date_to))
+
+    q = str(params.get("q") or "").strip()
+    if q:
+        # request number prefix (SR-000024 also for "sr-0000"); served by sr_id_prefix_idx
+        by_id = Q(id__startswith=q)
+        if q.upper() != q:
+            by_id |= Q(id__startswith=q.upper())
+        if connection.vendor == "postgresql":
+            # same expression as the sr_search_gin index
+            qs = qs.annotate(search=service_request_search_vector()).filter(
+                Q(search=SearchQuery(q, config="english", search_type="websearch")) | by_id
+            )
+        else:
+            qs = qs.filter(
+                Q(title__icontains=q)
+                | Q(task_description__icontains=q)
+                | Q(project_name__icontains=q)
+                | Q(roles_text__icontains=q)
+                | by_id
+            )
+
+    return qs
+
+
 class ServiceRequestListView(generics.ListAPIView):
+    """
+    GET /api/service-requests/?view=full|summary&page_size=50&cursor=...
+
+    Cursor-paginated on (created_at, id).
+    view=summary skips the text/JSON blobs (roles, criteria, descriptions) and
+    sends roleSummary totals instead of the roles;
+    use the detail endpoint for the full payload.
+
+    Filters (see _filter_service_requests):
+      ?status=APPROVED_FOR_BIDDING&type=SINGLE&contract=C003&bidding_active=true
+      ?date_from=2026-01-01&date_to=2026-03-31&q=kubernetes
+    Sorting:
+      ?ordering=-created_at | created_at | title | -title   (ties broken by id)
+    """
     permission_classes = [IsAuthenticated]
-    serializer_class = ServiceRequestSerializer
+    pagination_class = ServiceRequestCursorPagination
+    filter_backends = [TiebreakOrderingFilter]
+    ordering_fields = ["created_at", "title"]
+
+    def _is_summary(self) -> bool:
+        return str(self.request.query_params.get("view") or "").lower() == "summary"
+
+    def get_serializer_class(self):
+        if self._is_summary():
+            return ServiceRequestSummarySerializer
+        return ServiceRequestSerializer
 
     def get_queryset(self):
         user = self.request.user
         _assert_can_view_service_requests(user)
 
-        active_contract_ids = ContractProviderStatus.objects.filter(
-            provider_id=user.provider_id,
-            status="ACTIVE",
-        ).values_list("contract_id", flat=True)
-
-        return ServiceRequest.objects.filter(contract_id__in=active_contract_ids).order_by("-created_at")
+        qs = ServiceRequest.objects.filter(contract_id__in=active_contract_ids_for(self.request))
+        qs = _filter_service_requests(qs, self.request.query_params)
+        if self._is_summary():
+            qs = qs.only(*ServiceRequestSummarySerializer.ONLY_FIELDS)
+        else:
+            qs = qs.defer("external_payload")
+        return qs
 
 
 class ServiceRequestDetailView(generics.RetrieveAPIView):
@@ -77,151 +217,30 @@ class ServiceRequestDetailView(generics.RetrieveAPIView):
         user = self.request.user
         _assert_can_view_service_requests(user)
 
-        active_contract_ids = ContractProviderStatus.objects.filter(
-            provider_id=user.provider_id,
-            status="ACTIVE",
-        ).values_list("contract_id", flat=True)
-
-        return ServiceRequest.objects.filter(contract_id__in=active_contract_ids)
+        return ServiceRequest.objects.filter(contract_id__in=active_contract_ids_for(self.request))
 
 
 class Group3SyncServiceRequestsView(APIView):
+    """
+    POST /api/integrations/group3/sync-service-requests/
+
+    Queues a background sync (run by `manage.py run_jobs`) and returns at once:
+      202 { jobId, status }
+    Poll GET /api/jobs/<jobId>/ for progress and inserted/updated/unchanged/failed counts.
+    """
     permission_classes = [IsAuthenticated]
 
     def post(self, request):
         if request.user.role not in ["Provider Admin", "Supplier Representative"]:
             raise PermissionDenied("Not allowed.")
 
-        url = settings.GROUP3_REQUESTS_URL
-        resp = requests.get(url)
-        if resp.status_code >= 400:
-            return Response({"detail": f"Group3 returned {resp.status_code}"}, status=502)
-
-        data = resp.json()
-        if not isinstance(data, list):
-            return Response({"detail": "Invalid payload from Group3 (expected list)."}, status=502)
-
-        upserted = 0
-        for item in data:
-            if not isinstance(item, dict):
-                continue
-            try:
-                upsert_group3_service_request(item)
-                upserted += 1
-            except Exception:
-                continue
-
-        log_activity(
+        job, created = enqueue_job(
+            "GROUP3_SYNC_SERVICE_REQUESTS",
             provider_id=request.user.provider_id,
-            actor_type="USER",
-            actor_user=request.user,
-            event_type="GROUP3_SYNC_SERVICE_REQUESTS",
-            entity_type="ServiceRequest",
-            entity_id="*",
-            message=f"Synced service requests from Group3: upserted={upserted}",
+            requested_by=request.user,
         )
 
-        return Response({"upserted": upserted})
-
-
-def _map_offer_to_group3_payload(offer: ServiceOffer) -> dict:
-    """
-    Payload sent to Group3.
-    - No deltas
-    - specialists[] list
-    - one totalCost for entire request
-    """
-    sr = offer.service_request
-    resp = offer.response if isinstance(offer.response, dict) else {}
-
-    # Group3 sample structure includes serviceRequest nested.
-    service_request_payload = {
-        "id": sr.external_id or 0,
-        "requestNumber": sr.request_number or sr.id,
-        "title": sr.title,
-        "type": sr.type,
-        "requestedByUsername": sr.requested_by_username,
-        "requestedByRole": sr.requested_by_role,
-        "projectId": sr.project_id,
-        "projectName": sr.project_name,
-        "contractId": sr.contract_id,
-        "contractSupplier": sr.contract_supplier,
-        "startDate": str(sr.start_date) if sr.start_date else None,
-        "endDate": str(sr.end_date) if sr.end_date else None,
-        "performanceLocation": sr.performance_location,
-        "maxOffers": sr.max_offers or 0,
-        "maxAcceptedOffers": sr.max_accepted_offers or 0,
-        "requiredLanguages": sr.required_languages or [],
-        "mustHaveCriteria": sr.must_have_criteria or [],
-        "niceToHaveCriteria": sr.nice_to_have_criteria or [],
-        "taskDescription": sr.task_description or "",
-        "furtherInformation": sr.further_information or "",
-        "status": sr.status,
-        "roles": sr.roles or [],
-        "biddingCycleDays": sr.bidding_cycle_days or 0,
-        "biddingStartAt": sr.bidding_start_at.isoformat() if sr.bidding_start_at else None,
-        "biddingEndAt": sr.bidding_end_at.isoformat() if sr.bidding_end_at else None,
-        "biddingActive": bool(sr.bidding_active) if sr.bidding_active is not None else None,
-    }
-
-    payload = {
-        "id": offer.id,
-        "serviceRequest": service_request_payload,
-        "specialists": resp.get("specialists", []),
-        "totalCost": resp.get("totalCost", 0),
-        "contractualRelationship": resp.get("contractualRelationship", ""),
-        "subcontractorCompany": resp.get("subcontractorCompany", ""),
-        "supplierName": resp.get("supplierName", offer.provider.name),
-        "supplierRepresentative": resp.get("supplierRepresentative", offer.created_by.name if offer.created_by else ""),
-        "offerStatus": offer.status,
-        "providerId": offer.provider_id,
-        "providerName": offer.provider.name,
-    }
-    return payload
-
-
-def _group3_bids_url() -> str:
-    url = getattr(settings, "GROUP3_BIDS_URL", "").strip()
-    if not url:
-        raise RuntimeError("GROUP3_BIDS_URL is not configured")
-    return url
-
-
-def _send_offer_to_group3(offer: ServiceOffer) -> None:
-    """
-    Send Service Offer (Bid) to Group3 (Service Management System).
-
-    MUST be POST /api/public/bids.
-    Header required:
-      ServiceRequestbids3a: <API_KEY>
-    """
-    url = _group3_bids_url()
-    payload = _map_offer_to_group3_payload(offer)
-
-    header_name = "ServiceRequestbids3a"
-    api_key = getattr(settings, "GROUP3_CONNECTION_API_KEY", "")
-
-    headers = {
-        "Content-Type": "application/json",
-        header_name: api_key,
-    }
-
-    print("Sending offer to Group3:", headers, url, payload)
-
-    resp = requests.post(url, json=payload, headers=headers, timeout=20)
-
-    offer.group3_last_status = resp.status_code
-    try:
-        offer.group3_last_response = resp.json()
-    except Exception:
-        offer.group3_last_response = {"raw": resp.text[:2000]}
-    offer.save(update_fields=["group3_last_status", "group3_last_response"])
-
-    print("Group3 bid POST response:", resp.status_code, resp.text)
-
-    if resp.status_code >= 400:
-        print("Group3 bid POST failed:", resp.status_code, resp.text)
-        # raise ValueError(f"Group3 bid POST failed: status={resp.status_code}")
+        return Response({"jobId": job.id, "status": job.status, "created": created}, status=202)
 
 
 class ServiceOfferListCreateView(generics.ListCreateAPIView):
@@ -251,11 +270,10 @@ class ServiceOfferListCreateView(generics.ListCreateAPIView):
         with transaction.atomic():
             offer: ServiceOffer = input_serializer.save(created_by=user)
 
-            # If SUBMITTED -> send to Group3 immediately
+            # If SUBMITTED -> queue the bid for Group3 (same transaction as the offer)
             if offer.status == "SUBMITTED":
-                offer.submitted_at = timezone.now()
-                offer.save(update_fields=["submitted_at"])
-                _send_offer_to_group3(offer)
+                # delivered by `dispatch_outbound` after commit
+                enqueue_offer_for_group3(offer)
 
         log_activity(
             provider_id=offer.provider_id,
@@ -273,6 +291,39 @@ class ServiceOfferListCreateView(generics.ListCreateAPIView):
         return Response(out.data, status=201)
 
 
+class BulkServiceOfferCreateView(APIView):
+    """
+    POST /api/service-offers/bulk/
+    Body:
+      { "offers": [ <same body as POST /api/service-offers/>, ... ] }
+    Returns:
+      {
+        results: [ { index, ok: true, id } | { index, ok: false, errors } ],
+        created: N,
+        failed: M
+      }
+    Valid offers are created even if others fail; status is 201 if at least
+    one offer was created, 400 otherwise.
+    """
+    permission_classes = [IsAuthenticated]
+    MAX_OFFERS = 100
+
+    def post(self, request):
+        user = request.user
+        if user.role not in ["Provider Admin", "Supplier Representative"]:
+            raise PermissionDenied("Only Provider Admin or Supplier Representative can create offers.")
+
+        data = request.data if isinstance(request.data, dict) else {}
+        items = data.get("offers")
+        if not isinstance(items, list) or not items:
+            raise ValidationError({"offers": "Provide a non-empty list of offers."})
+        if len(items) > self.MAX_OFFERS:
+            raise ValidationError({"offers": f"At most {self.MAX_OFFERS} offers per call."})
+
+        result = submit_offers(request, items).as_dict()
+        return Response(result, status=201 if result["created"] else 400)
+
+
 class ServiceOfferDetailView(generics.RetrieveAPIView):
     permission_classes = [IsAuthenticated]
     serializer_class = ServiceOfferSerializer
@@ -365,33 +416,7 @@ class Group3OfferDecisionWebhookView(APIView):
                         order.save(update_fields=update_fields)
 
                 if created:
-                    specs = resp.get("specialists")
-                    if isinstance(specs, list):
-                        for s in specs:
-                            if not isinstance(s, dict):
-                                continue
-                            uid = str(s.get("userId") or "").strip()
-                            if not uid:
-                                continue
-                            specialist = User.objects.filter(id=uid, role="Specialist").first()
-                            if not specialist:
-                                continue
-
-                            # Keep same values as offer (core business logic)
-                            daily_rate = Decimal(str(s.get("dailyRate") or 0))
-                            travelling_cost = Decimal(str(s.get("travellingCost") or 0))
-                            specialist_cost = Decimal(str(s.get("specialistCost") or 0))
-
-                            ServiceOrderAssignment.objects.create(
-                                order=order,
-                                specialist=specialist,
-                                daily_rate=daily_rate,
-                                travelling_cost=travelling_cost,
-                                specialist_cost=specialist_cost,
-                                match_must_have_criteria=bool(s.get("matchMustHaveCriteria", True)),
-                                match_nice_to_have_criteria=bool(s.get("matchNiceToHaveCriteria", True)),
-                                match_language_skills=bool(s.get("matchLanguageSkills", True)),
-                            )
+                    create_order_assignments(order, resp.get("specialists"))
 
                 created_order = order  # <-- capture for response
 
@@ -403,7 +428,7 @@ class Group3OfferDecisionWebhookView(APIView):
             created_order = (
                 ServiceOrder.objects
                 .select_related("provider", "service_request", "service_offer")
-                .prefetch_related("assignments")
+                .prefetch_related(assignments_prefetch())
                 .get(id=created_order.id)
             )
             payload["serviceOrder"] = ServiceOrderSerializer(created_order).data
@@ -414,6 +439,12 @@ class Group3OfferDecisionWebhookView(APIView):
 class SuggestedSpecialistsView(APIView):
     """
     GET /api/service-requests/<pk>/suggested-specialists/?mode=recommended|eligible&limit=10
+
+    recommended: specialists ranked against all SR roles + criteria
+                 (score 0..100, bestRoleIndex, per-criterion `matches` flags)
+    eligible:    all eligible specialists by created_at; ?skills=AWS,React keeps
+                 those having any of the given skills
+
     Returns:
       { specialists: [...], eligibleCount: N }
     """
@@ -428,77 +459,110 @@ class SuggestedSpecialistsView(APIView):
             raise NotFound("Service request not found.")
 
         # only if provider is ACTIVE for contract
-        ok = ContractProviderStatus.objects.filter(
-            contract_id=sr.contract_id,
-            provider_id=user.provider_id,
-            status="ACTIVE",
-        ).exists()
-        if not ok:
+        if not is_active_for_contract(request, sr.contract_id):
             raise PermissionDenied("Not allowed for this contract.")
 
         mode = str(request.query_params.get("mode") or "recommended").lower()
-        limit = int(request.query_params.get("limit") or 10)
-
-        base = User.objects.filter(
-            provider_id=user.provider_id,
-            role="Specialist",
-            is_active=True,
-        ).exclude(availability="Fully Booked")
-
-        eligible_count = base.count()
-
-        # very simple matching heuristic for now:
-        # - if sr.roles has technology/roleName/experienceLevel, try to match
-        roles = sr.roles if isinstance(sr.roles, list) else []
-        target = roles[0] if roles else {}
-        t_exp = str(target.get("experienceLevel") or "").strip()
-        t_tech = str(target.get("technology") or "").strip()
-        t_role = str(target.get("roleName") or "").strip()
-
-        qs = base
-        if mode == "recommended" and (t_exp or t_tech or t_role):
-            # Prefer experience match
-            if t_exp:
-                qs = qs.order_by()  # reset ordering
-                qs = qs.extra(
-                    select={"exp_match": "CASE WHEN experience_level = %s THEN 0 ELSE 1 END"},
-                    select_params=[t_exp],
-                    order_by=["exp_match", "created_at"],
-                )
-        else:
-            qs = qs.order_by("created_at")
-
-        specialists = []
-        for s in qs[:limit]:
-            specialists.append(
-                {
-                    "id": s.id,
-                    "name": s.name,
-                    "materialNumber": getattr(s, "material_number", "") or "",
-                    "experienceLevel": getattr(s, "experience_level", "") or "",
-                    "technologyLevel": getattr(s, "technology_level", "") or "",
-                    "averageDailyRate": getattr(s, "average_daily_rate", None),
-                    "availability": getattr(s, "availability", "") or "",
-                    "skills": getattr(s, "skills", []) or [],
-                }
+        try:
+            limit = int(request.query_params.get("limit") or 10)
+        except ValueError:
+            raise ValidationError({"limit": "Must be an integer."})
+
+        if mode == "recommended":
+            return Response(rank_specialists_for_request(sr, user.provider_id, limit=limit))
+
+        index = get_skill_index(user.provider_id)
+        profiles = sorted(index.profiles.values(), key=lambda p: p.rank)
+
+        skills = [s.strip() for s in str(request.query_params.get("skills") or "").split(",") if s.strip()]
+        if skills:
+            # GIN (user_skills_gin) backed; exact skill strings
+            ids = set(
+                eligible_specialists(user.provider_id)
+                .filter(skills__has_any_keys=skills)
+                .values_list("id", flat=True)
             )
+            profiles = [p for p in profiles if p.id in ids]
+
+        return Response(
+            {
+                "specialists": [p.as_dict() for p in profiles[:limit]],
+                "eligibleCount": len(index.profiles),
+            }
+        )
+
+
+class BatchSuggestedSpecialistsView(APIView):
+    """
+    POST /api/service-requests/suggested-specialists/batch/
+    Body:
+      { "serviceRequestIds": ["SR001", "SR002", ...], "limit": 3 }
+    Returns:
+      {
+        results: [ { serviceRequestId, specialists: [...] } ],   # same entries as suggested-specialists
+        eligibleCount: N,
+        missing: ["SR404", ...]                                    # unknown or not visible
+      }
+    All requests are scored against the provider's specialists in one vectorized pass.
+    """
+    permission_classes = [IsAuthenticated]
+    MAX_REQUESTS = 200
+
+    def post(self, request):
+        user = request.user
+        _assert_can_view_service_requests(user)
 
-        return Response({"specialists": specialists, "eligibleCount": eligible_count})
+        data = request.data if isinstance(request.data, dict) else {}
+        ids = data.get("serviceRequestIds")
+        if not isinstance(ids, list) or not ids:
+            raise ValidationError({"serviceRequestIds": "Provide a non-empty list of service request ids."})
+        ids = list(dict.fromkeys(str(i) for i in ids))
+        if len(ids) > self.MAX_REQUESTS:
+            raise ValidationError({"serviceRequestIds": f"At most {self.MAX_REQUESTS} ids per call."})
+
+        try:
+            limit = int(data.get("limit") or 3)
+        except (TypeError, ValueError):
+            raise ValidationError({"limit": "Must be an integer."})
+
+        found = ServiceRequest.objects.filter(
+            id__in=ids,
+            contract_id__in=active_contract_ids_for(request),
+        ).only("id", "roles", "must_have_criteria", "nice_to_have_criteria", "required_languages").in_bulk()
+        srs = [found[i] for i in ids if i in found]
+
+        result = rank_specialists_for_requests(srs, user.provider_id, limit=limit)
+        result["missing"] = [i for i in ids if i not in found]
+        return Response(result)
 
 
 class ServiceOrderListView(generics.ListAPIView):
+    """
+    GET /api/service-orders/
+    Query params:
+      page_size  cursor page size (default 50, max 200)
+      since      only orders created at/after this date or datetime (ISO 8601)
+
+    Two queries per page: the orders, and their assignments joined to the
+    specialist (ServiceOrderSerializer only reads FK ids otherwise).
+    """
     permission_classes = [IsAuthenticated]
     serializer_class = ServiceOrderSerializer
+    pagination_class = ServiceOrderCursorPagination
 
     def get_queryset(self):
         user = self.request.user
-        qs = ServiceOrder.objects.all().order_by("-created_at")
+        qs = ServiceOrder.objects.prefetch_related(assignments_prefetch())
+
+        since = _parse_datetime_param(self.request.query_params, "since")
+        if since:
+            qs = qs.filter(created_at__gte=since)
 
         if user.role in ["Provider Admin", "Supplier Representative"]:
-            return qs.filter(provider=user.provider)
+            return qs.filter(provider_id=user.provider_id)
 
         if user.role == "Specialist":
-            return qs.filter(assignments__specialist=user).distinct()
+            return qs.filter(assigned_to_specialist(user.id))
 
         raise PermissionDenied("Not allowed.")
 
@@ -510,11 +574,11 @@ class ServiceOrderDetailView(generics.RetrieveAPIView):
 
     def get_queryset(self):
         user = self.request.user
-        qs = ServiceOrder.objects.select_related("provider", "service_request", "service_offer").prefetch_related("assignments")
+        qs = ServiceOrder.objects.prefetch_related(assignments_prefetch())
         if user.role in ["Provider Admin", "Supplier Representative"]:
             return qs.filter(provider=user.provider)
         if user.role == "Specialist":
-            return qs.filter(assignments__specialist=user).distinct()
+            return qs.filter(assigned_to_specialist(user.id))
         raise PermissionDenied("Not allowed.")
 
 
@@ -525,7 +589,7 @@ def _post_group3_extension(order_id: int, body: dict) -> requests.Response:
 
     headers = {"Content-Type": "application/json", header_name: api_key}
     payload = {"orderId": order_id, "body": body}
-    return requests.post(url, json=payload, headers=headers, timeout=20)
+    return http_client.post(url, json=payload, headers=headers)
 
 
 def _post_group3_substitution(order_id: int, body: dict) -> requests.Response:
@@ -535,13 +599,7 @@ def _post_group3_substitution(order_id: int, body: dict) -> requests.Response:
 
     headers = {"Content-Type": "application/json", header_name: api_key}
     payload = {"orderId": order_id, "body": body}
-    return requests.post(url, json=payload, headers=headers, timeout=20)
-
-def _group3_headers() -> dict:
-    header_name = getattr(settings, "GROUP3_API_KEY_HEADER", "ServiceRequestbids3a")
-    api_key = getattr(settings, "GROUP3_CONNECTION_API_KEY", "")
-    return {"Content-Type": "application/json", header_name: api_key}
-
+    return http_client.post(url, json=payload, headers=headers)
 
 def _post_group3_extension_decision(order_id: int, decision: str, body: dict) -> requests.Response | None:
     """
@@ -552,7 +610,7 @@ def _post_group3_extension_decision(order_id: int, decision: str, body: dict) ->
     if not url:
         return None
     payload = {"orderId": order_id, "decision": decision, "body": body}
-    return requests.post(url, json=payload, headers=_group3_headers(), timeout=20)
+    return http_client.post(url, json=payload, headers=group3_headers())
 
 
 def _post_group3_substitution_decision(order_id: int, decision: str, body: dict) -> requests.Response | None:
@@ -565,24 +623,58 @@ def _post_group3_substitution_decision(order_id: int, decision: str, body: dict)
         return None
     payload = {"orderId": order_id, "decision": decision, "body": body}
     print("Posting to Group3 substitution decision:", url, payload)
-    request = requests.post(url, json=payload, headers=_group3_headers(), timeout=20)
+    request = http_client.post(url, json=payload, headers=group3_headers())
     print("Group3 substitution decision response:", request.status_code, request.text)
     return request
 
 
+def _filter_change_requests(qs, params):
+    """
+    Narrowing for the change request feed:
+      status, type        exact match (comma-separated for several)
+      order               service order id
+      created_by_system   true|false (inbound from Group3 vs. raised by us)
+    """
+    for param, field in [("status", "status"), ("type", "type")]:
+        raw = str(params.get(param) or "").strip()
+        if raw:
+            qs = qs.filter(**{f"{field}__in": [v.strip() for v in raw.split(",") if v.strip()]})
+
+    order = str(params.get("order") or "").strip()
+    if order:
+        if not order.isdigit():
+            raise ValidationError({"order": "Must be a service order id."})
+        qs = qs.filter(service_order_id=int(order))
+
+    created_by_system = _parse_bool_param(params, "created_by_system")
+    if created_by_system is not None:
+        qs = qs.filter(created_by_system=created_by_system)
+
+    return qs
+
+
 class ServiceOrderChangeRequestListCreateView(generics.ListCreateAPIView):
+    """
+    GET /api/service-order-change-requests/
+      cursor-paginated, newest first; filters see _filter_change_requests
+      ("pending decisions" inbox: ?status=Requested)
+    POST /api/service-order-change-requests/
+    """
     permission_classes = [IsAuthenticated]
+    pagination_class = ChangeRequestCursorPagination
 
     def get_queryset(self):
         user = self.request.user
-        qs = ServiceOrderChangeRequest.objects.select_related("service_order", "provider").order_by("-created_at")
+        qs = ServiceOrderChangeRequest.objects.all()
+        if self.request.method == "GET":
+            qs = _filter_change_requests(qs, self.request.query_params)
 
         if user.role in ["Provider Admin", "Supplier Representative"]:
             return qs.filter(provider_id=user.provider_id)
 
         if user.role == "Specialist":
             # Specialists can see CRs for orders they are assigned to
-            return qs.filter(service_order__assignments__specialist=user).distinct()
+            return qs.filter(assigned_to_specialist(user.id, "service_order_id"))
 
         raise PermissionDenied("Not allowed.")
 
@@ -1,13 +1,19 @@
 import csv
+import io
 import json
 import os
 import zipfile
+from contextlib import contextmanager
 from pathlib import Path
-from datetime import datetime
-from typing import Any, Callable
+from datetime import datetime, timezone
+from typing import Any, Iterable, Iterator
 
 from django.core.management.base import BaseCommand
-from django.utils.timezone import is_aware
+
+
+# rows fetched per round trip; with values_list() + iterator() only one chunk
+# is held in memory, so peak memory does not grow with the table size
+EXPORT_CHUNK_SIZE = 2000
 
 
 # ------------------------------------------------------------
@@ -37,28 +43,48 @@ def json_to_str(v: Any) -> str:
         return json.dumps(v, ensure_ascii=False)
     return str(v)
 
-def write_csv(path: Path, headers: list[str], rows: list[list[Any]]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", newline="", encoding="utf-8") as f:
-        w = csv.writer(f)
-        w.writerow(headers)
-        for r in rows:
-            w.writerow([iso(x) for x in r])
-
-def zip_folder(folder: Path, zip_path: Path) -> None:
-    with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as z:
-        for p in folder.rglob("*"):
-            if p.is_file():
-                z.write(p, arcname=p.relative_to(folder))
-
-def write_readme(path: Path, schema_version: str, ts: str, files: list[str]) -> None:
+def pluck(items: Any, key: str) -> str:
+    """Flatten one key of a list of JSON objects: [{"a": 1}, {"a": 2}] -> "1 | 2"."""
+    if not isinstance(items, list):
+        return ""
+    return " | ".join(str(i.get(key)) for i in items if isinstance(i, dict) and i.get(key) not in (None, ""))
+
+def total(items: Any, key: str):
+    if not isinstance(items, list):
+        return None
+    return sum(i.get(key) or 0 for i in items if isinstance(i, dict))
+
+def as_dict(v: Any) -> dict:
+    return v if isinstance(v, dict) else {}
+
+def iter_rows(Model, spec: dict) -> Iterator[Iterable[Any]]:
+    """Stream one export: values_list() tuples through the spec's row mapping."""
+    qs = Model.objects.all()
+    if spec.get("filter"):
+        qs = qs.filter(**spec["filter"])
+    qs = qs.order_by(*spec["order_by"]).values_list(*spec["fields"])
+
+    row = spec.get("row")
+    for values in qs.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+        yield row(*values) if row else values
+
+def write_csv(f, headers: list[str], rows: Iterable[Iterable[Any]]) -> int:
+    w = csv.writer(f)
+    w.writerow(headers)
+    n = 0
+    for r in rows:
+        w.writerow([iso(x) for x in r])
+        n += 1
+    return n
+
+def write_readme(f, schema_version: str, ts: str, files: list[str]) -> None:
     content = f"""# Reporting Data Export (CSV)
 
 Generated at (UTC): {ts}
 Schema version: {schema_version}
 
 ## Files
-{os.linesep.join([f"- {f}" for f in files])}
+{os.linesep.join([f"- {name}" for name in files])}
 
 ## Join keys (recommended)
 - provider_id appears on most tables for easy joins
@@ -71,23 +97,59 @@ Schema version: {schema_version}
   - dicts -> JSON string
 - This is a full snapshot export.
 """
-    path.write_text(content, encoding="utf-8")
+    f.write(content)
 
-def write_data_dictionary(path: Path, entries: list[dict]) -> None:
+def write_data_dictionary(f, entries: list[dict]) -> None:
     headers = ["file", "table", "column", "type", "notes"]
-    with path.open("w", newline="", encoding="utf-8") as f:
-        w = csv.writer(f)
-        w.writerow(headers)
-        for e in entries:
-            w.writerow([e["file"], e["table"], e["column"], e["type"], e.get("notes", "")])
+    w = csv.writer(f)
+    w.writerow(headers)
+    for e in entries:
+        w.writerow([e["file"], e["table"], e["column"], e["type"], e.get("notes", "")])
+
+
+class FolderOutput:
+    """One file per export in a folder."""
+
+    def __init__(self, folder: Path):
+        self.folder = folder
+        self.location = folder
+
+    @contextmanager
+    def open(self, name: str):
+        ensure_dir(self.folder)
+        with (self.folder / name).open("w", newline="", encoding="utf-8") as f:
+            yield f
+
+    def close(self) -> None:
+        pass
+
+
+class ZipOutput:
+    """Every export streamed straight into an entry of one zip archive (no temp files)."""
+
+    def __init__(self, zip_path: Path):
+        ensure_dir(zip_path.parent)
+        self.location = zip_path
+        self.zip = zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED)
+
+    @contextmanager
+    def open(self, name: str):
+        # size is unknown up front; zip64 keeps entries over 2 GiB valid
+        with self.zip.open(name, "w", force_zip64=True) as raw:
+            with io.TextIOWrapper(raw, encoding="utf-8", newline="") as f:
+                yield f
+
+    def close(self) -> None:
+        self.zip.close()
 
 
 # ------------------------------------------------------------
 # Explicit export definitions (stable schema for BI)
 # ------------------------------------------------------------
 
-# Each export: file name, Django model import path, columns, value extractors
-# We use explicit columns so BI won't break when you add fields later.
+# Each export: file name, Django model, CSV columns, the values_list() fields
+# to read and (optionally) a `row` function mapping those values to the
+# columns. We use explicit columns so BI won't break when you add fields later.
 
 EXPORTS = [
     # Providers
@@ -99,14 +161,12 @@ EXPORTS = [
             "address", "email_notifications", "sms_notifications", "preferred_language",
             "status", "created_at",
         ],
-        "rows": lambda Provider: [
-            [
-                p.id, p.name, p.contact_name, p.contact_email, p.contact_phone,
-                p.address, p.email_notifications, p.sms_notifications, p.preferred_language,
-                p.status, p.created_at
-            ]
-            for p in Provider.objects.all().order_by("id")
+        "fields": [
+            "id", "name", "contact_name", "contact_email", "contact_phone",
+            "address", "email_notifications", "sms_notifications", "preferred_language",
+            "status", "created_at",
         ],
+        "order_by": ["id"],
         "dictionary": [
             ("provider_id", "string", "Primary key (P001 etc.)"),
         ],
@@ -125,16 +185,15 @@ EXPORTS = [
             # auth flags (sometimes useful for filtering)
             "is_active", "is_staff",
         ],
-        "rows": lambda User: [
-            [
-                u.id, u.provider_id, u.name, u.email, u.role, u.status, u.created_at,
-                u.material_number, u.experience_level, u.technology_level, u.performance_grade,
-                u.average_daily_rate, json_to_str(u.skills), u.availability,
-                u.service_requests_completed, u.service_orders_active,
-                u.is_active, u.is_staff,
-            ]
-            for u in User.objects.select_related("provider").all().order_by("id")
+        "fields": [
+            "id", "provider_id", "name", "email", "role", "status", "created_at",
+            "material_number", "experience_level", "technology_level", "performance_grade",
+            "average_daily_rate", "skills", "availability",
+            "service_requests_completed", "service_orders_active",
+            "is_active", "is_staff",
         ],
+        "row": lambda *v: [*v[:12], json_to_str(v[12]), *v[13:]],
+        "order_by": ["id"],
         "dictionary": [
             ("skills", "string", 'Flattened list: "Skill1 | Skill2 | ..."'),
         ],
@@ -146,47 +205,54 @@ EXPORTS = [
         "table": "contracts.Contract",
         "columns": [
             "contract_id", "title", "status", "kind",
-            "published_at", "offer_deadline", "start_date", "end_date",
-            "awarded_provider_id",
+            "published_at", "offer_deadline",
             "functional_weight", "commercial_weight",
             "scope_of_work", "terms_and_conditions",
             # flattened JSON config fields (BI-friendly)
             "accepted_request_types", "allowed_domains", "allowed_roles", "experience_levels",
+            "created_at",
+        ],
+        "fields": [
+            "id", "title", "status", "kind", "publishing_date", "offer_deadline_at",
+            "weighting", "scope_of_work", "terms_and_conditions", "config", "created_at",
         ],
-        "rows": lambda Contract: [
-            [
-                c.id, c.title, c.status, c.kind,
-                c.published_at, c.offer_deadline, c.start_date, c.end_date,
-                c.awarded_provider_id,
-                c.functional_weight, c.commercial_weight,
-                c.scope_of_work, c.terms_and_conditions,
-                json_to_str(c.accepted_request_types),
-                json_to_str(c.allowed_domains),
-                json_to_str(c.allowed_roles),
-                json_to_str(c.experience_levels),
-            ]
-            for c in Contract.objects.select_related("awarded_provider").all().order_by("id")
+        "row": lambda cid, title, status, kind, published, deadline, weighting, scope, terms, config, created: [
+            cid, title, status, kind, published, deadline,
+            as_dict(weighting).get("functional"), as_dict(weighting).get("commercial"),
+            scope, terms,
+            " | ".join(
+                str(t.get("type")) for t in as_dict(config).get("acceptedServiceRequestTypes") or []
+                if isinstance(t, dict) and t.get("isAccepted")
+            ),
+            json_to_str(as_dict(config).get("domains")),
+            json_to_str(as_dict(config).get("roles")),
+            json_to_str(as_dict(config).get("experienceLevels")),
+            created,
         ],
+        "order_by": ["id"],
         "dictionary": [
-            ("accepted_request_types", "string", "Flattened list"),
+            ("functional_weight", "number", "weighting.functional (%)"),
+            ("commercial_weight", "number", "weighting.commercial (%)"),
+            ("accepted_request_types", "string", "Flattened list of accepted service request types"),
             ("allowed_domains", "string", "Flattened list"),
             ("allowed_roles", "string", "Flattened list"),
             ("experience_levels", "string", "Flattened list"),
         ],
     },
 
-    # Contract Awards
+    # Contract Awards (provider links with an award date)
     {
         "file": "contract_awards.csv",
-        "table": "contracts.ContractAward",
+        "table": "contracts.ContractProviderStatus",
         "columns": [
-            "contract_id", "provider_id", "awarded_at", "created_by_system", "note"
+            "contract_id", "provider_id", "status", "awarded_at", "note"
         ],
-        "rows": lambda ContractAward: [
-            [a.contract_id, a.provider_id, a.awarded_at, a.created_by_system, a.note]
-            for a in ContractAward.objects.select_related("contract", "provider").all().order_by("awarded_at")
+        "fields": ["contract_id", "provider_id", "status", "awarded_at", "note"],
+        "filter": {"awarded_at__isnull": False},
+        "order_by": ["awarded_at", "id"],
+        "dictionary": [
+            ("status", "string", "Provider status on the contract (ACTIVE, EXPIRED, ...)"),
         ],
-        "dictionary": [],
     },
 
     # Contract Offers
@@ -195,18 +261,18 @@ EXPORTS = [
         "table": "contracts.ContractOffer",
         "columns": [
             "contract_offer_id", "contract_id", "provider_id", "created_by_user_id",
-            "status", "proposed_daily_rate", "proposed_terms", "note",
+            "status", "note", "deltas",
             "submitted_at", "created_at",
         ],
-        "rows": lambda ContractOffer: [
-            [
-                o.id, o.contract_id, o.provider_id, o.created_by_id,
-                o.status, o.proposed_daily_rate, o.proposed_terms, o.note,
-                o.submitted_at, o.created_at
-            ]
-            for o in ContractOffer.objects.select_related("contract", "provider", "created_by").all().order_by("created_at")
+        "fields": [
+            "id", "contract_id", "provider_id", "created_by_user_id",
+            "status", "note", "deltas", "submitted_at", "created_at",
+        ],
+        "row": lambda *v: [*v[:6], json_to_str(v[6]), *v[7:]],
+        "order_by": ["created_at", "id"],
+        "dictionary": [
+            ("deltas", "string", "JSON string (proposed changes)"),
         ],
-        "dictionary": [],
     },
 
     # Service Requests
@@ -215,7 +281,7 @@ EXPORTS = [
         "table": "procurement.ServiceRequest",
         "columns": [
             "service_request_id", "linked_contract_id", "title", "type", "status",
-            "offer_deadline_at", "cycles",
+            "offer_deadline_at", "bidding_cycle_days",
             "role", "technology", "experience_level",
             "start_date", "end_date",
             "total_man_days", "onsite_days", "performance_location",
@@ -223,22 +289,29 @@ EXPORTS = [
             "task_description",
             "created_at",
         ],
-        "rows": lambda ServiceRequest: [
-            [
-                sr.id, sr.linked_contract_id, sr.title, sr.type, sr.status,
-                sr.offer_deadline_at, sr.cycles,
-                sr.role, sr.technology, sr.experience_level,
-                sr.start_date, sr.end_date,
-                sr.total_man_days, sr.onsite_days, sr.performance_location,
-                json_to_str(sr.required_languages),
-                json_to_str(sr.must_have_criteria),
-                json_to_str(sr.nice_to_have_criteria),
-                sr.task_description,
-                sr.created_at,
-            ]
-            for sr in ServiceRequest.objects.all().order_by("created_at")
+        "fields": [
+            "id", "contract_id", "title", "type", "status",
+            "bidding_end_at", "bidding_cycle_days", "roles",
+            "start_date", "end_date", "performance_location",
+            "required_languages", "must_have_criteria", "nice_to_have_criteria",
+            "task_description", "created_at",
         ],
+        "row": lambda sid, contract, title, typ, status, deadline, cycle, roles, start, end, location,
+                      languages, must, nice, task, created: [
+            sid, contract, title, typ, status, deadline, cycle,
+            pluck(roles, "roleName"), pluck(roles, "technology"), pluck(roles, "experienceLevel"),
+            start, end,
+            total(roles, "manDays"), total(roles, "onsiteDays"), location,
+            json_to_str(languages), json_to_str(must), json_to_str(nice),
+            task, created,
+        ],
+        "order_by": ["created_at", "id"],
         "dictionary": [
+            ("role", "string", "Flattened list (one entry per SR role)"),
+            ("technology", "string", "Flattened list (one entry per SR role)"),
+            ("experience_level", "string", "Flattened list (one entry per SR role)"),
+            ("total_man_days", "number", "Sum over SR roles"),
+            ("onsite_days", "number", "Sum over SR roles"),
             ("required_languages", "string", "Flattened list"),
             ("must_have_criteria", "string", "Flattened list"),
             ("nice_to_have_criteria", "string", "Flattened list"),
@@ -250,23 +323,27 @@ EXPORTS = [
         "file": "service_offers.csv",
         "table": "procurement.ServiceOffer",
         "columns": [
-            "service_offer_id", "service_request_id", "provider_id", "specialist_user_id", "created_by_user_id",
-            "daily_rate", "travel_cost_per_onsite_day", "total_cost",
+            "service_offer_id", "service_request_id", "provider_id", "specialist_user_ids", "created_by_user_id",
+            "daily_rates", "total_cost",
             "contractual_relationship", "subcontractor_company",
-            "must_have_match_percentage", "nice_to_have_match_percentage",
             "status", "submitted_at", "created_at",
         ],
-        "rows": lambda ServiceOffer: [
-            [
-                so.id, so.service_request_id, so.provider_id, so.specialist_id, so.created_by_id,
-                so.daily_rate, so.travel_cost_per_onsite_day, so.total_cost,
-                so.contractual_relationship, so.subcontractor_company,
-                so.must_have_match_percentage, so.nice_to_have_match_percentage,
-                so.status, so.submitted_at, so.created_at
-            ]
-            for so in ServiceOffer.objects.select_related("service_request", "provider", "specialist", "created_by").all().order_by("created_at")
+        "fields": [
+            "id", "service_request_id", "provider_id", "created_by_id",
+            "response", "status", "submitted_at", "created_at",
+        ],
+        "row": lambda oid, sr, provider, created_by, response, status, submitted, created: [
+            oid, sr, provider,
+            pluck(as_dict(response).get("specialists"), "userId"), created_by,
+            pluck(as_dict(response).get("specialists"), "dailyRate"), as_dict(response).get("totalCost"),
+            as_dict(response).get("contractualRelationship"), as_dict(response).get("subcontractorCompany"),
+            status, submitted, created,
+        ],
+        "order_by": ["created_at", "id"],
+        "dictionary": [
+            ("specialist_user_ids", "string", "Flattened list of offered specialists"),
+            ("daily_rates", "string", "Flattened list, same order as specialist_user_ids"),
         ],
-        "dictionary": [],
     },
 
     # Service Orders
@@ -275,21 +352,37 @@ EXPORTS = [
         "table": "procurement.ServiceOrder",
         "columns": [
             "service_order_id", "service_offer_id", "service_request_id",
-            "provider_id", "specialist_user_id",
+            "provider_id",
             "title", "start_date", "end_date", "location",
             "man_days", "total_cost",
             "status", "created_at",
         ],
-        "rows": lambda ServiceOrder: [
-            [
-                o.id, o.service_offer_id, o.service_request_id,
-                o.provider_id, o.specialist_id,
-                o.title, o.start_date, o.end_date, o.location,
-                o.man_days, o.total_cost,
-                o.status, o.created_at
-            ]
-            for o in ServiceOrder.objects.select_related("service_offer", "service_request", "provider", "specialist").all().order_by("created_at")
+        "fields": [
+            "id", "service_offer_id", "service_request_id",
+            "provider_id",
+            "title", "start_date", "end_date", "location",
+            "man_days", "total_cost",
+            "status", "created_at",
+        ],
+        "order_by": ["created_at", "id"],
+        "dictionary": [],
+    },
+
+    # Service Order Assignments (specialists per order)
+    {
+        "file": "service_order_assignments.csv",
+        "table": "procurement.ServiceOrderAssignment",
+        "columns": [
+            "service_order_id", "specialist_user_id",
+            "daily_rate", "travelling_cost", "specialist_cost",
+            "start_date",
+        ],
+        "fields": [
+            "order_id", "specialist_id",
+            "daily_rate", "travelling_cost", "specialist_cost",
+            "start_date",
         ],
+        "order_by": ["order_id", "id"],
         "dictionary": [],
     },
 
@@ -306,20 +399,16 @@ EXPORTS = [
             "new_end_date", "additional_man_days", "new_total_cost",
             "old_specialist_user_id", "new_specialist_user_id",
         ],
-        "rows": lambda ServiceOrderChangeRequest: [
-            [
-                cr.id, cr.service_order_id, cr.provider_id,
-                cr.type, cr.status,
-                cr.created_by_system, cr.created_by_user_id, cr.decided_by_user_id,
-                cr.created_at, cr.decided_at,
-                cr.reason, cr.provider_response_note,
-                cr.new_end_date, cr.additional_man_days, cr.new_total_cost,
-                cr.old_specialist_id, cr.new_specialist_id
-            ]
-            for cr in ServiceOrderChangeRequest.objects.select_related(
-                "service_order", "provider", "created_by_user", "decided_by_user"
-            ).all().order_by("created_at")
+        "fields": [
+            "id", "service_order_id", "provider_id",
+            "type", "status",
+            "created_by_system", "created_by_user_id", "decided_by_user_id",
+            "created_at", "decided_at",
+            "reason", "provider_response_note",
+            "new_end_date", "additional_man_days", "new_total_cost",
+            "old_specialist_id", "new_specialist_id",
         ],
+        "order_by": ["created_at", "id"],
         "dictionary": [],
     },
 
@@ -333,15 +422,14 @@ EXPORTS = [
             "message", "metadata",
             "created_at",
         ],
-        "rows": lambda ActivityLog: [
-            [
-                a.id, a.provider_id, a.actor_type, a.actor_user_id,
-                a.event_type, a.entity_type, a.entity_id,
-                a.message, json_to_str(a.metadata),
-                a.created_at
-            ]
-            for a in ActivityLog.objects.select_related("provider", "actor_user").all().order_by("created_at")
+        "fields": [
+            "id", "provider_id", "actor_type", "actor_user_id",
+            "event_type", "entity_type", "entity_id",
+            "message", "metadata",
+            "created_at",
         ],
+        "row": lambda *v: [*v[:8], json_to_str(v[8]), v[9]],
+        "order_by": ["created_at", "id"],
         "dictionary": [
             ("metadata", "string", "JSON string (event-dependent)"),
         ],
@@ -350,91 +438,71 @@ EXPORTS = [
 
 
 class Command(BaseCommand):
-    help = "Export major modules as BI-friendly CSVs (Tableau/Power BI), plus README + data dictionary, optionally zipped."
+    help = (
+        "Export major modules as BI-friendly CSVs (Tableau/Power BI), plus README + data dictionary, "
+        "optionally zipped. Rows are streamed, so memory use does not depend on the data size."
+    )
 
     def add_arguments(self, parser):
         parser.add_argument("--out", type=str, default="exports/reporting", help="Base output directory.")
         parser.add_argument("--schema-version", type=str, default="v1", help="Schema version label (e.g., v1).")
-        parser.add_argument("--zip", action="store_true", help="Create a zip archive of the export folder.")
+        parser.add_argument(
+            "--zip", action="store_true",
+            help="Write one zip archive (<out>/<schema-version>/<timestamp>.zip) instead of a folder.",
+        )
 
     def handle(self, *args, **options):
+        from django.apps import apps
+
         out_base = Path(options["out"]).resolve()
         schema_version = options["schema_version"]
-        do_zip = options["zip"]
 
-        ts = datetime.utcnow().strftime("%Y-%m-%dT%H-%M-%SZ")
+        ts = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H-%M-%SZ")
         out_dir = out_base / schema_version / ts
-        ensure_dir(out_dir)
+        output = ZipOutput(out_dir.with_suffix(".zip")) if options["zip"] else FolderOutput(out_dir)
 
-        self.stdout.write(self.style.WARNING(f"Exporting reporting CSV pack to: {out_dir}"))
+        self.stdout.write(self.style.WARNING(f"Exporting reporting CSV pack to: {output.location}"))
 
         created_files: list[str] = []
         dictionary_entries: list[dict] = []
 
-        # Lazy import models inside handle so Django is fully ready
-        from providers.models import Provider
-        from accounts.models import User
-        from contracts.models import Contract, ContractOffer, ContractAward
-        from procurement.models import (
-            ServiceRequest, ServiceOffer, ServiceOrder, ServiceOrderChangeRequest
-        )
-        from activitylog.models import ActivityLog
-
-        model_map = {
-            "providers.Provider": Provider,
-            "accounts.User": User,
-            "contracts.Contract": Contract,
-            "contracts.ContractAward": ContractAward,
-            "contracts.ContractOffer": ContractOffer,
-            "procurement.ServiceRequest": ServiceRequest,
-            "procurement.ServiceOffer": ServiceOffer,
-            "procurement.ServiceOrder": ServiceOrder,
-            "procurement.ServiceOrderChangeRequest": ServiceOrderChangeRequest,
-            "activitylog.ActivityLog": ActivityLog,
-        }
-
-        for spec in EXPORTS:
-            file_name = spec["file"]
-            table = spec["table"]
-            columns = spec["columns"]
-            Model = model_map[table]
-
-            # Build rows
-            rows = spec["rows"](Model)
-
-            # Write CSV
-            write_csv(out_dir / file_name, columns, rows)
-            created_files.append(file_name)
-
-            # Dictionary entries
-            for col in columns:
-                dictionary_entries.append({
-                    "file": file_name,
-                    "table": table,
-                    "column": col,
-                    "type": "mixed",
-                    "notes": "",
-                })
-            for (col, typ, notes) in spec.get("dictionary", []):
-                # patch notes for known fields
-                for e in dictionary_entries:
-                    if e["file"] == file_name and e["column"] == col:
-                        e["type"] = typ
-                        e["notes"] = notes
-
-            self.stdout.write(self.style.SUCCESS(f"✔ {file_name} ({len(rows)} rows)"))
-
-        # README + data dictionary
-        write_readme(out_dir / "README.md", schema_version=schema_version, ts=ts, files=created_files + ["data_dictionary.csv", "README.md"])
-        created_files.append("README.md")
-
-        write_data_dictionary(out_dir / "data_dictionary.csv", dictionary_entries)
-        created_files.append("data_dictionary.csv")
-
-        # Optional zip
-        if do_zip:
-            zip_path = out_dir.with_suffix(".zip")  # .../v1/<timestamp>.zip
-            zip_folder(out_dir, zip_path)
-            self.stdout.write(self.style.SUCCESS(f"📦 Zip created: {zip_path}"))
+        try:
+            for spec in EXPORTS:
+                file_name = spec["file"]
+                table = spec["table"]
+                columns = spec["columns"]
+                Model = apps.get_model(table)
+
+                with output.open(file_name) as f:
+                    count = write_csv(f, columns, iter_rows(Model, spec))
+                created_files.append(file_name)
+
+                # Dictionary entries
+                notes = {col: (typ, note) for col, typ, note in spec.get("dictionary", [])}
+                for col in columns:
+                    typ, note = notes.get(col, ("mixed", ""))
+                    dictionary_entries.append({
+                        "file": file_name,
+                        "table": table,
+                        "column": col,
+                        "type": typ,
+                        "notes": note,
+                    })
+
+                self.stdout.write(self.style.SUCCESS(f"✔ {file_name} ({count} rows)"))
+
+            # README + data dictionary
+            with output.open("README.md") as f:
+                write_readme(f, schema_version=schema_version, ts=ts, files=created_files + ["data_dictionary.csv", "README.md"])
+            created_files.append("README.md")
+
+            with output.open("data_dictionary.csv") as f:
+                write_data_dictionary(f, dictionary_entries)
+            created_files.append("data_dictionary.csv")
+        finally:
+            output.close()
+
+        if options["zip"]:
+            self.stdout.write(self.style.SUCCESS(f"📦 Zip created: {output.location}"))
 
         self.stdout.write(self.style.SUCCESS("✅ Export completed."))
@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from providers.services.metrics import refresh_all_provider_metrics
+
+
+class Command(BaseCommand):
+    help = (
+        "Recomputes the denormalized ProviderMetrics rows. The signals keep them current for "
+        "model saves; run this after bulk writes that bypass them (QuerySet.update, bulk_create, "
+        "raw SQL, loaddata)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("provider_ids", nargs="*", help="Only these providers (default: all).")
+
+    def handle(self, *args, **options):
+        refreshed = refresh_all_provider_metrics(options["provider_ids"] or None)
+        self.stdout.write(self.style.SUCCESS(f"Refreshed metrics of {refreshed} provider(s)."))
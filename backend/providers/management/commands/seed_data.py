@@ -9,6 +9,7 @@ from django.db import transaction
 from django.utils import timezone
 
 from providers.models import Provider
+from providers.services.metrics import refresh_all_provider_metrics
 from accounts.models import User
 from contracts.models import Contract, ContractOffer, ContractAward
 from procurement.models import (
@@ -230,6 +231,9 @@ class Command(BaseCommand):
             open_contracts=open_contracts,
         )
 
+        # QuerySet.update() / bulk writes above bypass the metrics signals
+        refresh_all_provider_metrics()
+
         self.stdout.write(self.style.SUCCESS("✅ Deterministic seeding completed.\n"))
         self._print_summary(providers, users_by_provider, specialists_by_provider, contracts_by_provider, stats)
 
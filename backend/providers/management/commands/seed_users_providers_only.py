@@ -10,6 +10,7 @@ from django.db import transaction
 from django.utils import timezone
 
 from providers.models import Provider
+from providers.services.metrics import refresh_all_provider_metrics
 from accounts.models import User
 
 PASSWORD = "login123"
@@ -125,6 +126,9 @@ class Command(BaseCommand):
         self.stdout.write(self.style.WARNING("👤 Seeding Users + Specialists (deterministic)..."))
         users_by_provider, specialists_by_provider = self._seed_users(providers)
 
+        # QuerySet.update() / bulk writes above bypass the metrics signals
+        refresh_all_provider_metrics()
+
         self.stdout.write(self.style.SUCCESS("✅ Providers + Users seeding completed.\n"))
         self._print_summary(providers, users_by_provider, specialists_by_provider)
 
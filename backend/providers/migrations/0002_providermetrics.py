@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-16 22:52
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('providers', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProviderMetrics',
+            fields=[
+                ('provider', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='metrics', serialize=False, to='providers.provider')),
+                ('total_users', models.IntegerField(default=0)),
+                ('active_specialists', models.IntegerField(default=0)),
+                ('active_service_orders', models.IntegerField(default=0)),
+                ('active_contracts', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
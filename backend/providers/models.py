@@ -21,3 +21,27 @@ class Provider(models.Model):
 
     def __str__(self):
         return f"{self.id} - {self.name}"
+
+
+class ProviderMetrics(models.Model):
+    """
+    Denormalized dashboard counters for a provider.
+
+    Refreshed by signals (providers/signals.py) whenever users, service orders
+    or contract provider statuses change, so /auth/me/ and /providers/me/
+    read one row instead of running COUNT queries. Writes that skip the
+    signals (QuerySet.update, bulk_create, raw SQL) must call
+    refresh_all_provider_metrics() or `manage.py rebuild_provider_metrics`.
+    """
+
+    provider = models.OneToOneField(Provider, on_delete=models.CASCADE, primary_key=True, related_name="metrics")
+
+    total_users = models.IntegerField(default=0)
+    active_specialists = models.IntegerField(default=0)
+    active_service_orders = models.IntegerField(default=0)
+    active_contracts = models.IntegerField(default=0)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Metrics {self.provider_id}"
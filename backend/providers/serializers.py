@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from .models import Provider
+from .services.metrics import get_provider_metrics
 
 
 class ProviderSerializer(serializers.ModelSerializer):
@@ -34,11 +35,13 @@ class ProviderSerializer(serializers.ModelSerializer):
         }
 
     def get_metrics(self, obj):
+        # denormalized row kept fresh by providers/signals.py
+        m = get_provider_metrics(obj)
         return {
-            "totalUsers": obj.users.count(),
-            "activeSpecialists": obj.users.filter(role="Specialist", status="Active").count(),
-            "activeServiceOrders": 0,
-            "activeContracts": 0,
+            "totalUsers": m.total_users if m else 0,
+            "activeSpecialists": m.active_specialists if m else 0,
+            "activeServiceOrders": m.active_service_orders if m else 0,
+            "activeContracts": m.active_contracts if m else 0,
         }
 
 
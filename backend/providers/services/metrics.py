@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from typing import Dict, Iterable, Optional
+
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from providers.models import Provider, ProviderMetrics
+
+
+def _count_per_provider(qs) -> Coalesce:
+    """Correlated COUNT(*) of qs rows belonging to the outer provider."""
+    sub = (
+        qs.filter(provider_id=OuterRef("pk"))
+        .order_by()
+        .values("provider_id")
+        .annotate(n=Count("*"))
+        .values("n")
+    )
+    return Coalesce(Subquery(sub, output_field=IntegerField()), Value(0))
+
+
+METRIC_FIELDS = ["total_users", "active_specialists", "active_service_orders", "active_contracts"]
+
+
+def _with_metrics(qs):
+    # Local imports: these apps import providers.models themselves
+    from accounts.models import User
+    from contracts.models import ContractProviderStatus
+    from procurement.models import ServiceOrder
+
+    return qs.annotate(
+        total_users=_count_per_provider(User.objects.all()),
+        active_specialists=_count_per_provider(User.objects.filter(role="Specialist", status="Active")),
+        active_service_orders=_count_per_provider(ServiceOrder.objects.filter(status="ACTIVE")),
+        active_contracts=_count_per_provider(ContractProviderStatus.objects.filter(status="ACTIVE")),
+    )
+
+
+def compute_provider_metrics(provider_id: str) -> Dict[str, int] | None:
+    """
+    All four provider metrics in ONE aggregate query (scalar subqueries).
+    Returns None if the provider does not exist.
+    """
+    return _with_metrics(Provider.objects.filter(pk=provider_id)).values(*METRIC_FIELDS).first()
+
+
+def refresh_provider_metrics(provider_id: str) -> ProviderMetrics | None:
+    counts = compute_provider_metrics(provider_id)
+    if counts is None:
+        return None
+    metrics, _ = ProviderMetrics.objects.update_or_create(provider_id=provider_id, defaults=counts)
+    return metrics
+
+
+def refresh_all_provider_metrics(provider_ids: Optional[Iterable[str]] = None) -> int:
+    """
+    Recompute the metrics of every provider (or of `provider_ids`) with one
+    aggregate query and one upsert. For writes the signals don't see:
+    QuerySet.update(), bulk_create(), raw SQL, fixtures.
+    """
+    qs = Provider.objects.all()
+    if provider_ids is not None:
+        qs = qs.filter(pk__in=list(provider_ids))
+    rows = [
+        ProviderMetrics(provider_id=row.pop("pk"), **row)
+        for row in _with_metrics(qs).values("pk", *METRIC_FIELDS).iterator(chunk_size=2000)
+    ]
+    ProviderMetrics.objects.bulk_create(
+        rows,
+        batch_size=1000,
+        update_conflicts=True,
+        unique_fields=["provider"],
+        update_fields=[*METRIC_FIELDS, "updated_at"],
+    )
+    return len(rows)
+
+
+def get_provider_metrics(provider: Provider) -> ProviderMetrics | None:
+    """
+    Read the denormalized metrics row; build it on first access.
+    """
+    try:
+        return provider.metrics
+    except ProviderMetrics.DoesNotExist:
+        return refresh_provider_metrics(provider.pk)
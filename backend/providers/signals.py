@@ -0,0 +1,65 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from accounts.models import User
+from contracts.models import ContractProviderStatus
+from procurement.models import ServiceOrder
+from providers.services.metrics import refresh_provider_metrics
+
+
+def _touches(update_fields, relevant: set) -> bool:
+    # update_fields=None means a full save
+    return update_fields is None or bool(relevant & set(update_fields))
+
+
+def _schedule_refresh(provider_id):
+    if not provider_id:
+        return
+    # recompute after the write is committed (and only if it is)
+    transaction.on_commit(partial(refresh_provider_metrics, provider_id))
+
+
+@receiver(pre_save, sender=User)
+@receiver(pre_save, sender=ServiceOrder)
+@receiver(pre_save, sender=ContractProviderStatus)
+def metrics_source_pre_save(sender, instance, raw=False, update_fields=None, **kwargs):
+    # remember the provider a row is moved away from; it needs a refresh too
+    instance._metrics_old_provider_id = None
+    if raw or instance._state.adding or not _touches(update_fields, {"provider", "provider_id"}):
+        return
+    old = sender.objects.filter(pk=instance.pk).values_list("provider_id", flat=True).first()
+    if old != instance.provider_id:
+        instance._metrics_old_provider_id = old
+
+
+def _refresh_after_save(instance, created, update_fields, relevant: set):
+    if created or _touches(update_fields, relevant):
+        _schedule_refresh(instance.provider_id)
+    _schedule_refresh(getattr(instance, "_metrics_old_provider_id", None))
+    instance._metrics_old_provider_id = None
+
+
+@receiver(post_save, sender=User)
+def user_saved(sender, instance, created, update_fields=None, **kwargs):
+    # login only touches last_login -> skip
+    _refresh_after_save(instance, created, update_fields, {"role", "status", "provider"})
+
+
+@receiver(post_save, sender=ServiceOrder)
+def service_order_saved(sender, instance, created, update_fields=None, **kwargs):
+    _refresh_after_save(instance, created, update_fields, {"status", "provider"})
+
+
+@receiver(post_save, sender=ContractProviderStatus)
+def contract_provider_status_saved(sender, instance, created, update_fields=None, **kwargs):
+    _refresh_after_save(instance, created, update_fields, {"status", "provider"})
+
+
+@receiver(post_delete, sender=User)
+@receiver(post_delete, sender=ServiceOrder)
+@receiver(post_delete, sender=ContractProviderStatus)
+def metrics_source_deleted(sender, instance, **kwargs):
+    _schedule_refresh(instance.provider_id)
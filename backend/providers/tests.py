@@ -1,3 +1,74 @@
+from datetime import date
+from io import StringIO
+
+from django.core.management import call_command
 from django.test import TestCase
 
-# Create your tests here.
+from accounts.models import User
+from procurement.models import ServiceOffer, ServiceOrder, ServiceRequest
+
+from .models import Provider, ProviderMetrics
+from .services.metrics import refresh_all_provider_metrics
+
+
+class ProviderMetricsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.providers = [
+            Provider.objects.create(
+                id=f"P96{n}", name=f"Provider {n}", contact_name="c", contact_email="c@example.com",
+                contact_phone="1", address="a", created_at=date.today(),
+            )
+            for n in range(2)
+        ]
+
+    def _metrics(self, provider):
+        return ProviderMetrics.objects.get(provider=provider)
+
+    def _specialist(self, provider, n=0):
+        with self.captureOnCommitCallbacks(execute=True):
+            return User.objects.create_user(
+                email=f"metrics{n}@example.com", password="pw", id=f"U96{n}", name="Specialist",
+                role="Specialist", provider=provider, created_at=date.today(),
+            )
+
+    def test_moving_a_user_refreshes_both_providers(self):
+        old, new = self.providers
+        user = self._specialist(old)
+        self.assertEqual(self._metrics(old).active_specialists, 1)
+
+        user.provider = new
+        with self.captureOnCommitCallbacks(execute=True):
+            user.save()
+        self.assertEqual(self._metrics(old).active_specialists, 0)
+        self.assertEqual(self._metrics(new).active_specialists, 1)
+
+    def test_moving_an_order_refreshes_both_providers(self):
+        old, new = self.providers
+        sr = ServiceRequest.objects.create(id="SR960", title="SR", type="SINGLE", contract_id="C960")
+        offer = ServiceOffer.objects.create(service_request=sr, provider=old, status="ACCEPTED")
+        with self.captureOnCommitCallbacks(execute=True):
+            order = ServiceOrder.objects.create(
+                service_offer=offer, service_request=sr, provider=old, title="Order", status="ACTIVE",
+            )
+        self.assertEqual(self._metrics(old).active_service_orders, 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            order.provider = new
+            order.save(update_fields=["provider"])
+        self.assertEqual(self._metrics(old).active_service_orders, 0)
+        self.assertEqual(self._metrics(new).active_service_orders, 1)
+
+    def test_rebuild_after_queryset_update(self):
+        provider = self.providers[0]
+        user = self._specialist(provider)
+        User.objects.filter(pk=user.pk).update(status="Inactive")
+        self.assertEqual(self._metrics(provider).active_specialists, 1)  # signals did not see it
+
+        self.assertEqual(refresh_all_provider_metrics([provider.pk]), 1)
+        self.assertEqual(self._metrics(provider).active_specialists, 0)
+
+        User.objects.filter(pk=user.pk).update(status="Active")
+        call_command("rebuild_provider_metrics", stdout=StringIO())
+        self.assertEqual(self._metrics(provider).active_specialists, 1)
+        self.assertEqual(self._metrics(self.providers[1]).total_users, 0)
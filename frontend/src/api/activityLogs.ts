@@ -1,5 +1,5 @@
 // frontend/src/api/activityLogs.ts
-import { authFetch } from "./http";
+import { authFetch, pagePath, toPage, type Page } from "./http";
 
 export type ActivityLog = {
   id: number;
@@ -18,9 +18,45 @@ export type ActivityLog = {
   created_at: string;
 };
 
-export async function getActivityLogs(access: string): Promise<ActivityLog[]> {
-  const res = await authFetch("/api/activity-logs/", access, { method: "GET" });
+export type ActivityLogListParams = {
+  eventType?: string; // comma-separated for several
+  actorType?: string;
+  entityType?: string;
+  entityId?: string;
+  dateFrom?: string; // YYYY-MM-DD or ISO datetime
+  dateTo?: string; // a plain date includes that day
+  pageSize?: number;
+};
+
+/**
+ * One page of the activity log, newest first. Pass the previous page's
+ * `next` link as `cursor` to load older events (params are then ignored,
+ * the link already carries them).
+ */
+export async function getActivityLogs(
+  access: string,
+  params?: ActivityLogListParams,
+  cursor?: string | null
+): Promise<Page<ActivityLog>> {
+  let path: string;
+  if (cursor) {
+    path = pagePath(cursor);
+  } else {
+    const qs = new URLSearchParams();
+    if (params?.eventType) qs.set("event_type", params.eventType);
+    if (params?.actorType) qs.set("actor_type", params.actorType);
+    if (params?.entityType) qs.set("entity_type", params.entityType);
+    if (params?.entityId) qs.set("entity_id", params.entityId);
+    if (params?.dateFrom) qs.set("date_from", params.dateFrom);
+    if (params?.dateTo) qs.set("date_to", params.dateTo);
+    if (params?.pageSize) qs.set("page_size", String(params.pageSize));
+    const query = qs.toString();
+    path = `/api/activity-logs/${query ? `?${query}` : ""}`;
+  }
+
+  const res = await authFetch(path, access, { method: "GET" });
   const data = await res.json().catch(() => null);
   if (!res.ok) throw new Error(data?.detail || `Failed to load activity logs (${res.status})`);
-  return data as ActivityLog[];
+  // cursor-paginated: { next, previous, results }
+  return toPage<ActivityLog>(data);
 }
@@ -20,11 +20,20 @@ export async function getContractById(access: string, id: string): Promise<Contr
   return data as Contract;
 }
 
-export async function syncContractsFromGroup2(access: string): Promise<{ upserted: number; skipped: number }> {
+export type ContractSyncResult = {
+  inserted: number;
+  updated: number;
+  unchanged: number;
+  skipped: number;
+  notModified: boolean;
+  upserted: number;
+};
+
+export async function syncContractsFromGroup2(access: string): Promise<ContractSyncResult> {
   const res = await authFetch("/api/integrations/group2/sync-contracts/", access, { method: "POST" });
   const data = await parseJsonSafe(res);
   if (!res.ok) throw new Error(data?.detail || `Failed to sync contracts (${res.status})`);
-  return data as { upserted: number; skipped: number };
+  return data as ContractSyncResult;
 }
 
 export async function createContractOffer(
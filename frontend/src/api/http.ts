@@ -119,3 +119,17 @@ export async function authFetch(
     return res;
   }
 }
+
+/** One page of a DRF cursor-paginated list. */
+export type Page<T> = { results: T[]; next: string | null };
+
+export function toPage<T>(data: any): Page<T> {
+  if (Array.isArray(data)) return { results: data as T[], next: null };
+  return { results: (data?.results || []) as T[], next: data?.next || null };
+}
+
+/** DRF `next` links are absolute; authFetch wants the path (it prefixes API_BASE). */
+export function pagePath(link: string): string {
+  const url = new URL(link, API_BASE);
+  return `${url.pathname}${url.search}`;
+}
@@ -0,0 +1,47 @@
+// frontend/src/api/jobs.ts
+import { authFetch } from "./http";
+
+export type SyncJob = {
+  id: number;
+  kind: string;
+  status: "QUEUED" | "RUNNING" | "SUCCEEDED" | "FAILED";
+  progress: Record<string, any>;
+  result: Record<string, any> | null;
+  error: string;
+  attempts: number;
+  created_at: string;
+  started_at: string | null;
+  finished_at: string | null;
+};
+
+export async function getJob(access: string, id: number): Promise<SyncJob> {
+  const res = await authFetch(`/api/jobs/${id}/`, access, { method: "GET" });
+  const data = await res.json().catch(() => null);
+  if (!res.ok) throw new Error(data?.detail || `Failed to fetch job (${res.status})`);
+  return data as SyncJob;
+}
+
+/**
+ * Poll a background job until it finishes.
+ * Resolves with the job on SUCCEEDED, throws on FAILED or timeout.
+ */
+export async function waitForJob(
+  access: string,
+  id: number,
+  opts?: { intervalMs?: number; timeoutMs?: number; onProgress?: (job: SyncJob) => void }
+): Promise<SyncJob> {
+  const intervalMs = opts?.intervalMs ?? 1500;
+  const timeoutMs = opts?.timeoutMs ?? 5 * 60 * 1000;
+  const started = Date.now();
+
+  while (true) {
+    const job = await getJob(access, id);
+    opts?.onProgress?.(job);
+
+    if (job.status === "SUCCEEDED") return job;
+    if (job.status === "FAILED") throw new Error(job.error?.split("\n")[0] || "Background job failed");
+    if (Date.now() - started > timeoutMs) throw new Error("Timed out waiting for background job");
+
+    await new Promise((r) => setTimeout(r, intervalMs));
+  }
+}
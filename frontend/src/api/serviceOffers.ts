@@ -36,6 +36,7 @@ export type CreateServiceOfferPayload = {
 
   specialists: Array<{
     userId: string;
+    roleIndex?: number;
     dailyRate: number;
     travellingCost: number;
     specialistCost?: number;
@@ -68,3 +69,29 @@ export async function createServiceOffer(access: string, payload: CreateServiceO
   if (!res.ok) throw new Error(extractError(data, `Failed to create offer (${res.status})`));
   return data as ServiceOffer;
 }
+
+export type BulkServiceOfferResult = {
+  results: Array<
+    | { index: number; ok: true; id: number }
+    | { index: number; ok: false; errors: Record<string, any> }
+  >;
+  created: number;
+  failed: number;
+};
+
+// Creates many offers in one call; invalid items are reported per index and don't block the others.
+export async function createServiceOffersBulk(
+  access: string,
+  offers: CreateServiceOfferPayload[]
+): Promise<BulkServiceOfferResult> {
+  const res = await authFetch("/api/service-offers/bulk/", access, {
+    method: "POST",
+    body: JSON.stringify({ offers }),
+  });
+  const data = await parseJsonSafe(res);
+  // 400 with per-item results = every offer was invalid; still a result, not a transport error
+  if (!res.ok && !(data && Array.isArray(data.results))) {
+    throw new Error(extractError(data, `Failed to create offers (${res.status})`));
+  }
+  return data as BulkServiceOfferResult;
+}
@@ -31,11 +31,33 @@ export type ServiceOrderChangeRequest = {
   newSpecialistId?: string | null;
 };
 
-export async function listChangeRequests(access: string): Promise<ServiceOrderChangeRequest[]> {
-  const res = await authFetch("/api/service-order-change-requests/", access, { method: "GET" });
+export type ChangeRequestListParams = {
+  status?: ChangeRequestStatus;
+  type?: ChangeRequestType;
+  order?: number;
+  createdBySystem?: boolean;
+  pageSize?: number;
+};
+
+export async function listChangeRequests(
+  access: string,
+  params?: ChangeRequestListParams
+): Promise<ServiceOrderChangeRequest[]> {
+  const qs = new URLSearchParams();
+  if (params?.status) qs.set("status", params.status);
+  if (params?.type) qs.set("type", params.type);
+  if (params?.order !== undefined) qs.set("order", String(params.order));
+  if (params?.createdBySystem !== undefined) qs.set("created_by_system", String(params.createdBySystem));
+  if (params?.pageSize) qs.set("page_size", String(params.pageSize));
+  const query = qs.toString();
+
+  const res = await authFetch(`/api/service-order-change-requests/${query ? `?${query}` : ""}`, access, {
+    method: "GET",
+  });
   const data = await res.json().catch(() => null);
   if (!res.ok) throw new Error(data?.detail || `Failed to fetch change requests (${res.status})`);
-  return data as ServiceOrderChangeRequest[];
+  // cursor-paginated: { next, previous, results }
+  return (Array.isArray(data) ? data : data?.results || []) as ServiceOrderChangeRequest[];
 }
 
 export async function requestSubstitution(access: string, payload: { serviceOrderId: number; newSpecialistId: string; reason?: string }) {
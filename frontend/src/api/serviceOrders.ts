@@ -1,5 +1,5 @@
 // frontend/src/api/serviceOrders.ts
-import { authFetch } from "./http";
+import { authFetch, pagePath, toPage, type Page } from "./http";
 
 export type ServiceOrderAssignment = {
   specialistId: string;
@@ -110,11 +110,38 @@ function mapOrder(raw: any): ServiceOrder {
   };
 }
 
-export async function getServiceOrders(access: string): Promise<ServiceOrder[]> {
-  const res = await authFetch("/api/service-orders/", access, { method: "GET" });
+export type ServiceOrderListParams = {
+  pageSize?: number;
+  since?: string; // YYYY-MM-DD or ISO datetime
+};
+
+/**
+ * One page of service orders. Pass the previous page's `next` link as
+ * `cursor` to load the following page (params are then ignored, the link
+ * already carries them).
+ */
+export async function getServiceOrders(
+  access: string,
+  params?: ServiceOrderListParams,
+  cursor?: string | null
+): Promise<Page<ServiceOrder>> {
+  let path: string;
+  if (cursor) {
+    path = pagePath(cursor);
+  } else {
+    const qs = new URLSearchParams();
+    if (params?.pageSize) qs.set("page_size", String(params.pageSize));
+    if (params?.since) qs.set("since", params.since);
+    const query = qs.toString();
+    path = `/api/service-orders/${query ? `?${query}` : ""}`;
+  }
+
+  const res = await authFetch(path, access, { method: "GET" });
   const data = await res.json().catch(() => null);
   if (!res.ok) throw new Error(data?.detail || `Failed to fetch service orders (${res.status})`);
-  return (Array.isArray(data) ? data : []).map(mapOrder);
+  // cursor-paginated: { next, previous, results }
+  const page = toPage<any>(data);
+  return { results: page.results.map(mapOrder), next: page.next };
 }
 
 export async function getServiceOrderById(access: string, id: number | string): Promise<ServiceOrder> {
@@ -124,6 +151,6 @@ export async function getServiceOrderById(access: string, id: number | string):
   return mapOrder(data);
 }
 
-export async function getMyOrders(access: string): Promise<ServiceOrder[]> {
-  return getServiceOrders(access);
+export async function getMyOrders(access: string, cursor?: string | null): Promise<Page<ServiceOrder>> {
+  return getServiceOrders(access, undefined, cursor);
 }
@@ -1,5 +1,6 @@
 // frontend/src/api/serviceRequests.ts
-import { authFetch } from "./http";
+import { authFetch, pagePath, toPage, type Page } from "./http";
+import { waitForJob } from "./jobs";
 
 async function parseJsonSafe(res: Response) {
   return await res.json().catch(() => null);
@@ -12,11 +13,54 @@ function extractError(data: any, fallback: string) {
   return fallback;
 }
 
-export async function getServiceRequests(access: string): Promise<any[]> {
-  const res = await authFetch("/api/service-requests/", access, { method: "GET" });
+export type ServiceRequestListParams = {
+  view?: "full" | "summary";
+  pageSize?: number;
+  // server-side filters
+  q?: string;
+  status?: string;
+  type?: string;
+  contract?: string;
+  biddingActive?: boolean;
+  dateFrom?: string;
+  dateTo?: string;
+  ordering?: string;
+};
+
+/**
+ * One page of service requests. Pass the previous page's `next` link as
+ * `cursor` to load the following page (params are then ignored, the link
+ * already carries them).
+ */
+export async function getServiceRequests(
+  access: string,
+  params?: ServiceRequestListParams,
+  cursor?: string | null
+): Promise<Page<any>> {
+  let path: string;
+  if (cursor) {
+    path = pagePath(cursor);
+  } else {
+    const qs = new URLSearchParams();
+    if (params?.view) qs.set("view", params.view);
+    if (params?.pageSize) qs.set("page_size", String(params.pageSize));
+    if (params?.q) qs.set("q", params.q);
+    if (params?.status) qs.set("status", params.status);
+    if (params?.type) qs.set("type", params.type);
+    if (params?.contract) qs.set("contract", params.contract);
+    if (params?.biddingActive !== undefined) qs.set("bidding_active", String(params.biddingActive));
+    if (params?.dateFrom) qs.set("date_from", params.dateFrom);
+    if (params?.dateTo) qs.set("date_to", params.dateTo);
+    if (params?.ordering) qs.set("ordering", params.ordering);
+    const query = qs.toString();
+    path = `/api/service-requests/${query ? `?${query}` : ""}`;
+  }
+
+  const res = await authFetch(path, access, { method: "GET" });
   const data = await parseJsonSafe(res);
   if (!res.ok) throw new Error(extractError(data, `Failed to fetch service requests (${res.status})`));
-  return data as any[];
+  // cursor-paginated: { next, previous, results }
+  return toPage<any>(data);
 }
 
 export async function getServiceRequestById(access: string, id: string): Promise<any> {
@@ -26,14 +70,25 @@ export async function getServiceRequestById(access: string, id: string): Promise
   return data as any;
 }
 
-export async function syncServiceRequestsFromGroup3(access: string): Promise<{ upserted: number }> {
+export type ServiceRequestSyncResult = {
+  inserted: number;
+  updated: number;
+  unchanged: number;
+  failed: number;
+  upserted: number;
+};
+
+export async function syncServiceRequestsFromGroup3(access: string): Promise<ServiceRequestSyncResult> {
   const res = await authFetch("/api/integrations/group3/sync-service-requests/", access, {
     method: "POST",
     body: JSON.stringify({}),
   });
   const data = await parseJsonSafe(res);
   if (!res.ok) throw new Error(extractError(data, `Failed to sync from Group3 (${res.status})`));
-  return data as { upserted: number };
+
+  // Sync runs in a background worker: { jobId, status } -> poll until done
+  const job = await waitForJob(access, data.jobId);
+  return job.result as ServiceRequestSyncResult;
 }
 
 export async function getSuggestedSpecialists(
@@ -54,3 +109,25 @@ export async function getSuggestedSpecialists(
   if (!res.ok) throw new Error(extractError(data, `Failed to load suggested specialists (${res.status})`));
   return data as { specialists: any[]; eligibleCount: number };
 }
+
+export type BatchSuggestedSpecialists = {
+  results: { serviceRequestId: string; specialists: any[] }[];
+  eligibleCount: number;
+  missing: string[];
+};
+
+// Best matching specialists for many requests in one call (scored server-side in one pass)
+export async function getBatchSuggestedSpecialists(
+  access: string,
+  serviceRequestIds: string[],
+  limit = 3
+): Promise<BatchSuggestedSpecialists> {
+  const res = await authFetch("/api/service-requests/suggested-specialists/batch/", access, {
+    method: "POST",
+    body: JSON.stringify({ serviceRequestIds, limit }),
+  });
+
+  const data = await parseJsonSafe(res);
+  if (!res.ok) throw new Error(extractError(data, `Failed to load suggested specialists (${res.status})`));
+  return data as BatchSuggestedSpecialists;
+}
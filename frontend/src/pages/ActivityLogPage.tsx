@@ -12,16 +12,20 @@ export const ActivityLogPage: React.FC = () => {
   const canSee = hasAnyRole(currentUser, ["Provider Admin"]);
 
   const [logs, setLogs] = useState<ActivityLog[]>([]);
+  const [next, setNext] = useState<string | null>(null);
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [err, setErr] = useState<string | null>(null);
+  const [moreErr, setMoreErr] = useState<string | null>(null);
 
   const refresh = async () => {
     if (!access) return;
     setLoading(true);
     setErr(null);
     try {
-      const data = await getActivityLogs(access);
-      setLogs(data);
+      const page = await getActivityLogs(access, { pageSize: 100 });
+      setLogs(page.results);
+      setNext(page.next);
     } catch (e: any) {
       setErr(e?.message || "Failed to load activity logs");
     } finally {
@@ -29,6 +33,21 @@ export const ActivityLogPage: React.FC = () => {
     }
   };
 
+  const loadMore = async () => {
+    if (!access || !next) return;
+    setLoadingMore(true);
+    setMoreErr(null);
+    try {
+      const page = await getActivityLogs(access, undefined, next);
+      setLogs((prev) => [...prev, ...page.results]);
+      setNext(page.next);
+    } catch (e: any) {
+      setMoreErr(e?.message || "Failed to load older activity");
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   useEffect(() => {
     if (!canSee) {
       setLoading(false);
@@ -122,6 +141,20 @@ export const ActivityLogPage: React.FC = () => {
             ))
           )}
         </div>
+
+        {next && (
+          <div className="p-4 border-t border-gray-200 text-center">
+            <button
+              type="button"
+              onClick={loadMore}
+              disabled={loadingMore}
+              className="px-4 py-2 text-sm text-gray-700 border border-gray-300 rounded-lg hover:bg-gray-50 disabled:opacity-50"
+            >
+              {loadingMore ? "Loading..." : "Load more"}
+            </button>
+            {moreErr && <p className="text-sm text-red-600 mt-2">{moreErr}</p>}
+          </div>
+        )}
       </div>
     </div>
   );
@@ -255,6 +255,7 @@ export const CreateServiceOffer: React.FC = () => {
         subcontractorCompany: selected[0]?.subcontractorCompany || "",
         specialists: selected.map((line) => ({
           userId: line.specialistId,
+          roleIndex: line.roleIndex,
           dailyRate: Number(line.dailyRate || 0),
           travellingCost: Number(line.travellingCost || 0),
           matchMustHaveCriteria: !!line.matchMustHaveCriteria,
@@ -27,6 +27,9 @@ import { getSpecialists } from "../api/specialists";
 import { getContracts, syncContractsFromGroup2 } from "../api/contracts";
 import { getMyProvider } from "../api/providers";
 
+// First page of the requests open for bidding; the KPI shows "N+" past it
+const OPEN_REQUESTS = { view: "summary", status: "APPROVED_FOR_BIDDING", pageSize: 100 } as const;
+
 type StatCard = {
   label: string;
   value: number | string;
@@ -39,6 +42,11 @@ function isOpenForBidding(sr: ServiceRequest): boolean {
   return sr.status === "APPROVED_FOR_BIDDING" || Boolean((sr as any)?.biddingActive);
 }
 
+/** Count of a list the dashboard only loaded the first page of. */
+function pageCount(n: number, hasMore: boolean): number | string {
+  return hasMore ? `${n}+` : n;
+}
+
 function providerProfileCompleteness(provider: Provider) {
   const required: Array<keyof Provider> = ["name", "contactName", "contactEmail", "contactPhone", "address"];
   const missing = required.filter((k) => !provider[k]);
@@ -67,8 +75,10 @@ export const Dashboard: React.FC = () => {
   const [error, setError] = useState<string>("");
 
   const [serviceRequests, setServiceRequests] = useState<ServiceRequest[]>([]);
+  const [moreServiceRequests, setMoreServiceRequests] = useState(false);
   const [serviceOffers, setServiceOffers] = useState<ServiceOffer[]>([]);
   const [serviceOrders, setServiceOrders] = useState<ServiceOrder[]>([]);
+  const [moreServiceOrders, setMoreServiceOrders] = useState(false);
   const [contracts, setContracts] = useState<Contract[]>([]);
   const [provider, setProvider] = useState<Provider | null>(null);
   const [availableSpecialists, setAvailableSpecialists] = useState(0);
@@ -102,14 +112,16 @@ export const Dashboard: React.FC = () => {
         // Supplier Representative: SR + Offers + Orders (+ specialists for available count)
         if (role === "Supplier Representative") {
           const [srs, offers, orders, specialists] = await Promise.all([
-            getServiceRequests(access),
+            getServiceRequests(access, OPEN_REQUESTS),
             getServiceOffers(access),
-            getServiceOrders(access),
+            getServiceOrders(access, { pageSize: 5 }),
             getSpecialists(access),
           ]);
-          setServiceRequests(srs);
+          setServiceRequests(srs.results);
+          setMoreServiceRequests(Boolean(srs.next));
           setServiceOffers(offers);
-          setServiceOrders(orders);
+          setServiceOrders(orders.results);
+          setMoreServiceOrders(Boolean(orders.next));
           setContracts([]); // ensure coordinator-only data isn't shown
           setAvailableSpecialists(
             (specialists || []).filter((s: any) => s?.availability === "Available").length
@@ -122,17 +134,21 @@ export const Dashboard: React.FC = () => {
           const cs = await getContracts(access);
           setContracts(cs);
           setServiceRequests([]);
+          setMoreServiceRequests(false);
           setServiceOffers([]);
           setServiceOrders([]);
+          setMoreServiceOrders(false);
           setAvailableSpecialists(0);
           return;
         }
 
         // Specialist: only orders
         if (role === "Specialist") {
-          const orders = await getServiceOrders(access);
-          setServiceOrders(orders);
+          const orders = await getServiceOrders(access, { pageSize: 100 });
+          setServiceOrders(orders.results);
+          setMoreServiceOrders(Boolean(orders.next));
           setServiceRequests([]);
+          setMoreServiceRequests(false);
           setServiceOffers([]);
           setContracts([]);
           setAvailableSpecialists(0);
@@ -143,14 +159,16 @@ export const Dashboard: React.FC = () => {
         if (role === "Provider Admin") {
           const [cs, srs, offers, orders] = await Promise.all([
             getContracts(access),
-            getServiceRequests(access),
+            getServiceRequests(access, OPEN_REQUESTS),
             getServiceOffers(access),
-            getServiceOrders(access),
+            getServiceOrders(access, { pageSize: 5 }),
           ]);
           setContracts(cs);
-          setServiceRequests(srs);
+          setServiceRequests(srs.results);
+          setMoreServiceRequests(Boolean(srs.next));
           setServiceOffers(offers);
-          setServiceOrders(orders);
+          setServiceOrders(orders.results);
+          setMoreServiceOrders(Boolean(orders.next));
           setAvailableSpecialists(0);
           return;
         }
@@ -167,11 +185,17 @@ export const Dashboard: React.FC = () => {
 
   /* -------------------- stats per role -------------------- */
 
+  // Admins and supplier reps only load the latest orders for the preview;
+  // the provider's denormalized metrics carry the full count
+  const activeOrderCount =
+    provider?.metrics?.activeServiceOrders ??
+    pageCount(serviceOrders.filter((o) => o.status === "ACTIVE").length, moreServiceOrders);
+
   const supplierStats: StatCard[] = useMemo(() => {
     return [
       {
         label: "Open Service Requests",
-        value: serviceRequests.filter(isOpenForBidding).length,
+        value: pageCount(serviceRequests.filter(isOpenForBidding).length, moreServiceRequests),
         icon: FileText,
         color: "bg-blue-50 text-blue-600",
         link: "/service-requests",
@@ -185,7 +209,7 @@ export const Dashboard: React.FC = () => {
       },
       {
         label: "Active Orders",
-        value: serviceOrders.filter((o) => o.status === "ACTIVE").length,
+        value: activeOrderCount,
         icon: Package,
         color: "bg-green-50 text-green-600",
         link: "/service-orders",
@@ -198,7 +222,7 @@ export const Dashboard: React.FC = () => {
         link: "/specialists",
       },
     ];
-  }, [serviceRequests, serviceOffers, serviceOrders, availableSpecialists]);
+  }, [serviceRequests, moreServiceRequests, serviceOffers, activeOrderCount, availableSpecialists]);
 
   const adminStats: StatCard[] = useMemo(() => {
     const c = provider ? providerProfileCompleteness(provider) : { percent: 0, missing: [] };
@@ -219,7 +243,7 @@ export const Dashboard: React.FC = () => {
       },
       {
         label: "Active Orders",
-        value: serviceOrders.filter((o) => o.status === "ACTIVE").length,
+        value: activeOrderCount,
         icon: Package,
         color: "bg-purple-50 text-purple-600",
         link: "/service-orders",
@@ -232,7 +256,7 @@ export const Dashboard: React.FC = () => {
         link: "/activity-log",
       },
     ];
-  }, [provider, contracts, serviceOrders]);
+  }, [provider, contracts, activeOrderCount]);
 
   const coordinatorStats: StatCard[] = useMemo(() => {
     return [
@@ -264,14 +288,14 @@ export const Dashboard: React.FC = () => {
     return [
       {
         label: "My Active Orders",
-        value: serviceOrders.filter((o) => o.status === "ACTIVE").length,
+        value: pageCount(serviceOrders.filter((o) => o.status === "ACTIVE").length, moreServiceOrders),
         icon: Package,
         color: "bg-green-50 text-green-600",
         link: "/my-orders",
       },
       {
         label: "Completed Orders",
-        value: serviceOrders.filter((o) => o.status === "COMPLETED").length,
+        value: pageCount(serviceOrders.filter((o) => o.status === "COMPLETED").length, moreServiceOrders),
         icon: Package,
         color: "bg-gray-50 text-gray-700",
         link: "/my-orders",
@@ -284,7 +308,7 @@ export const Dashboard: React.FC = () => {
         link: `/specialists/${currentUser?.id}`,
       },
     ];
-  }, [serviceOrders, currentUser?.id]);
+  }, [serviceOrders, moreServiceOrders, currentUser?.id]);
 
   const stats =
     role === "Provider Admin"
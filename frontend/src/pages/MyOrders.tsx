@@ -17,8 +17,11 @@ export const MyOrders: React.FC = () => {
   const { currentUser, tokens } = useApp();
 
   const [rows, setRows] = useState<ServiceOrder[]>([]);
+  const [next, setNext] = useState<string | null>(null);
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [error, setError] = useState<string | null>(null);
+  const [moreError, setMoreError] = useState<string | null>(null);
 
   useEffect(() => {
     const run = async () => {
@@ -37,8 +40,9 @@ export const MyOrders: React.FC = () => {
       setError(null);
 
       try {
-        const data = await getMyOrders(tokens.access);
-        setRows(data);
+        const page = await getMyOrders(tokens.access);
+        setRows(page.results);
+        setNext(page.next);
       } catch (e: any) {
         setError(e?.message || "Failed to load my orders");
       } finally {
@@ -49,6 +53,24 @@ export const MyOrders: React.FC = () => {
     run();
   }, [tokens?.access, currentUser?.role]);
 
+  const loadMore = async () => {
+    if (!tokens?.access || !next) return;
+    setLoadingMore(true);
+    setMoreError(null);
+    try {
+      const page = await getMyOrders(tokens.access, next);
+      setRows((prev) => [...prev, ...page.results]);
+      setNext(page.next);
+    } catch (e: any) {
+      setMoreError(e?.message || "Failed to load more orders");
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
+  // counts only cover the pages loaded so far
+  const more = next ? "+" : "";
+
   const activeOrders = useMemo(() => rows.filter((o) => o.status === "ACTIVE"), [rows]);
   const completedOrders = useMemo(() => rows.filter((o) => o.status === "COMPLETED"), [rows]);
 
@@ -70,7 +92,7 @@ export const MyOrders: React.FC = () => {
               <div className="flex items-center justify-between">
                 <div>
                   <p className="text-sm text-gray-500">Total Orders</p>
-                  <p className="text-3xl text-gray-900 mt-2">{rows.length}</p>
+                  <p className="text-3xl text-gray-900 mt-2">{rows.length}{more}</p>
                 </div>
                 <div className="w-12 h-12 rounded-lg bg-blue-50 text-blue-600 flex items-center justify-center">
                   <Package size={24} />
@@ -82,7 +104,7 @@ export const MyOrders: React.FC = () => {
               <div className="flex items-center justify-between">
                 <div>
                   <p className="text-sm text-gray-500">Active Orders</p>
-                  <p className="text-3xl text-gray-900 mt-2">{activeOrders.length}</p>
+                  <p className="text-3xl text-gray-900 mt-2">{activeOrders.length}{more}</p>
                 </div>
                 <div className="w-12 h-12 rounded-lg bg-green-50 text-green-600 flex items-center justify-center">
                   <Package size={24} />
@@ -94,7 +116,7 @@ export const MyOrders: React.FC = () => {
               <div className="flex items-center justify-between">
                 <div>
                   <p className="text-sm text-gray-500">Completed</p>
-                  <p className="text-3xl text-gray-900 mt-2">{completedOrders.length}</p>
+                  <p className="text-3xl text-gray-900 mt-2">{completedOrders.length}{more}</p>
                 </div>
                 <div className="w-12 h-12 rounded-lg bg-gray-100 text-gray-600 flex items-center justify-center">
                   <Package size={24} />
@@ -200,6 +222,20 @@ export const MyOrders: React.FC = () => {
             </div>
           )}
 
+          {next && (
+            <div className="mt-8 text-center">
+              <button
+                type="button"
+                onClick={loadMore}
+                disabled={loadingMore}
+                className="px-4 py-2 text-sm text-gray-700 border border-gray-300 rounded-lg hover:bg-gray-50 disabled:opacity-50"
+              >
+                {loadingMore ? "Loading..." : "Load more"}
+              </button>
+              {moreError && <p className="text-sm text-red-600 mt-2">{moreError}</p>}
+            </div>
+          )}
+
           {rows.length === 0 && (
             <div className="bg-white rounded-lg border border-gray-200 p-12 text-center">
               <Package size={48} className="mx-auto text-gray-400 mb-4" />
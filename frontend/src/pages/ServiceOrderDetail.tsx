@@ -109,8 +109,7 @@ export const ServiceOrderDetail: React.FC = () => {
       const o = (await getServiceOrderById(access, Number(id))) as unknown as ServiceOrderDetailModel;
       setOrder(o);
 
-      const crAll = await listChangeRequests(access);
-      const cr = crAll.filter((x) => x.serviceOrderId === Number(id));
+      const cr = await listChangeRequests(access, { order: Number(id), pageSize: 200 });
       setChangeRequests(cr);
 
       if (canProviderAct) {
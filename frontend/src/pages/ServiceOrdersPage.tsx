@@ -12,8 +12,11 @@ export const ServiceOrdersPage: React.FC = () => {
   const { tokens } = useApp();
 
   const [rows, setRows] = useState<ServiceOrder[]>([]);
+  const [next, setNext] = useState<string | null>(null);
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [error, setError] = useState<string | null>(null);
+  const [moreError, setMoreError] = useState<string | null>(null);
 
   useEffect(() => {
     const run = async () => {
@@ -26,8 +29,9 @@ export const ServiceOrdersPage: React.FC = () => {
       setError(null);
 
       try {
-        const data = await getServiceOrders(tokens.access);
-        setRows(data);
+        const page = await getServiceOrders(tokens.access, { pageSize: 100 });
+        setRows(page.results);
+        setNext(page.next);
       } catch (e: any) {
         setError(e?.message || "Failed to load service orders");
       } finally {
@@ -38,6 +42,21 @@ export const ServiceOrdersPage: React.FC = () => {
     run();
   }, [tokens?.access]);
 
+  const loadMore = async () => {
+    if (!tokens?.access || !next) return;
+    setLoadingMore(true);
+    setMoreError(null);
+    try {
+      const page = await getServiceOrders(tokens.access, undefined, next);
+      setRows((prev) => [...prev, ...page.results]);
+      setNext(page.next);
+    } catch (e: any) {
+      setMoreError(e?.message || "Failed to load more service orders");
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   return (
     <div className="p-8">
       <div className="mb-6">
@@ -105,6 +124,20 @@ export const ServiceOrdersPage: React.FC = () => {
           </div>
 
           {rows.length === 0 && <div className="p-8 text-center text-gray-500">No service orders found</div>}
+
+          {next && (
+            <div className="p-4 border-t border-gray-200 text-center">
+              <button
+                type="button"
+                onClick={loadMore}
+                disabled={loadingMore}
+                className="px-4 py-2 text-sm text-gray-700 border border-gray-300 rounded-lg hover:bg-gray-50 disabled:opacity-50"
+              >
+                {loadingMore ? "Loading..." : "Load more"}
+              </button>
+              {moreError && <p className="text-sm text-red-600 mt-2">{moreError}</p>}
+            </div>
+          )}
         </div>
       )}
     </div>
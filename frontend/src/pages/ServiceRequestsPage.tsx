@@ -1,5 +1,5 @@
 // frontend/src/pages/ServiceRequestsPage.tsx
-import React, { useEffect, useMemo, useState } from "react";
+import React, { useEffect, useState } from "react";
 import { Link } from "react-router-dom";
 import { StatusBadge } from "../components/StatusBadge";
 import { Search, Filter, Calendar, MapPin, Clock, RefreshCw } from "lucide-react";
@@ -39,7 +39,13 @@ function safeArr<T>(v: any): T[] {
   return Array.isArray(v) ? v : [];
 }
 
+// The list loads ?view=summary rows, which carry `roleSummary` instead of `roles`
 function getPrimaryRoleLabel(req: any): string {
+  const summary = req?.roleSummary;
+  if (summary) {
+    if (!summary.primaryRole) return "-";
+    return summary.technology ? `${summary.primaryRole} (${summary.technology})` : summary.primaryRole;
+  }
   const roles = safeArr<any>(req?.roles);
   if (!roles.length) return "-";
   const r = roles[0];
@@ -48,13 +54,20 @@ function getPrimaryRoleLabel(req: any): string {
   return `${roleName}${tech}`;
 }
 
+function getRoleCount(req: any): number {
+  if (req?.roleSummary) return Number(req.roleSummary.count) || 0;
+  return safeArr<any>(req?.roles).length;
+}
+
 function getTotalManDays(req: any): number {
+  if (req?.roleSummary) return Number(req.roleSummary.manDays) || 0;
   const roles = safeArr<any>(req?.roles);
   if (!roles.length) return 0;
   return roles.reduce((sum, r) => sum + (Number(r?.manDays) || 0), 0);
 }
 
 function getTotalOnsiteDays(req: any): number {
+  if (req?.roleSummary) return Number(req.roleSummary.onsiteDays) || 0;
   const roles = safeArr<any>(req?.roles);
   if (!roles.length) return 0;
   return roles.reduce((sum, r) => sum + (Number(r?.onsiteDays) || 0), 0);
@@ -68,20 +81,39 @@ export const ServiceRequestsPage: React.FC = () => {
   const [statusFilter, setStatusFilter] = useState<string>("all");
 
   const [rows, setRows] = useState<any[]>([]);
+  const [next, setNext] = useState<string | null>(null);
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [syncing, setSyncing] = useState(false);
   const [error, setError] = useState<string | null>(null);
+  const [moreError, setMoreError] = useState<string | null>(null);
 
   const isBlockedRole = currentUser?.role === "Contract Coordinator";
   const canSync =
     currentUser?.role === "Provider Admin" || currentUser?.role === "Supplier Representative";
 
+  // Debounce free-text search so we don't hit the API on every keystroke
+  const [debouncedSearch, setDebouncedSearch] = useState("");
+  useEffect(() => {
+    const t = setTimeout(() => setDebouncedSearch(searchTerm.trim()), 300);
+    return () => clearTimeout(t);
+  }, [searchTerm]);
+
   const load = async () => {
     setLoading(true);
     setError(null);
+    setMoreError(null);
     try {
-      const data = await getServiceRequests(access);
-      setRows(data);
+      // Filtering happens server-side (status + full-text search); the table
+      // only needs the list representation, details load on their own page
+      const page = await getServiceRequests(access, {
+        view: "summary",
+        pageSize: 100,
+        q: debouncedSearch || undefined,
+        status: statusFilter !== "all" ? statusFilter : undefined,
+      });
+      setRows(page.results);
+      setNext(page.next);
     } catch (e: any) {
       setError(e?.message || "Failed to load service requests");
     } finally {
@@ -89,6 +121,21 @@ export const ServiceRequestsPage: React.FC = () => {
     }
   };
 
+  const loadMore = async () => {
+    if (!access || !next) return;
+    setLoadingMore(true);
+    setMoreError(null);
+    try {
+      const page = await getServiceRequests(access, undefined, next);
+      setRows((prev) => [...prev, ...page.results]);
+      setNext(page.next);
+    } catch (e: any) {
+      setMoreError(e?.message || "Failed to load more service requests");
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   useEffect(() => {
     if (!access) return;
     if (isBlockedRole) {
@@ -98,7 +145,7 @@ export const ServiceRequestsPage: React.FC = () => {
     }
     load();
     // eslint-disable-next-line react-hooks/exhaustive-deps
-  }, [access, isBlockedRole]);
+  }, [access, isBlockedRole, debouncedSearch, statusFilter]);
 
   const doSync = async () => {
     if (!access) return;
@@ -107,7 +154,10 @@ export const ServiceRequestsPage: React.FC = () => {
     try {
       const res = await syncServiceRequestsFromGroup3(access);
       await load();
-      alert(`Synced from Group 3. Upserted: ${res.upserted}`);
+      alert(
+        `Synced from Group 3. New: ${res.inserted}, updated: ${res.updated}, ` +
+          `unchanged: ${res.unchanged}, failed: ${res.failed}`
+      );
     } catch (e: any) {
       setError(e?.message || "Sync failed");
     } finally {
@@ -115,28 +165,22 @@ export const ServiceRequestsPage: React.FC = () => {
     }
   };
 
-  // Build status options from data (so filters match reality)
-  const statusOptions = useMemo(() => {
-    const s = new Set<string>();
-    rows.forEach((r) => {
-      if (r?.status) s.add(String(r.status));
+  // Build status options from data seen so far (so filters match reality).
+  // Accumulate, because a server-side status filter narrows `rows`.
+  const [seenStatuses, setSeenStatuses] = useState<string[]>([]);
+  useEffect(() => {
+    setSeenStatuses((prev) => {
+      const s = new Set<string>(prev);
+      rows.forEach((r) => {
+        if (r?.status) s.add(String(r.status));
+      });
+      return s.size === prev.length ? prev : Array.from(s).sort();
     });
-    return Array.from(s).sort();
   }, [rows]);
+  const statusOptions = seenStatuses;
 
-  const filteredRequests = useMemo(() => {
-    const t = searchTerm.toLowerCase();
-    return rows.filter((req) => {
-      const id = String(req?.id || req?.requestNumber || "").toLowerCase();
-      const title = String(req?.title || "").toLowerCase();
-      const roleLabel = getPrimaryRoleLabel(req).toLowerCase();
-
-      const matchesSearch = !t || title.includes(t) || id.includes(t) || roleLabel.includes(t);
-      const matchesStatus = statusFilter === "all" || String(req?.status) === statusFilter;
-
-      return matchesSearch && matchesStatus;
-    });
-  }, [rows, searchTerm, statusFilter]);
+  // Rows are already filtered by the backend
+  const filteredRequests = rows;
 
   return (
     <div className="p-8">
@@ -254,9 +298,7 @@ export const ServiceRequestsPage: React.FC = () => {
                       <td className="px-6 py-4 text-sm text-gray-700">
                         {getPrimaryRoleLabel(req)}
                         <div className="text-xs text-gray-500 mt-1">
-                          {safeArr<any>(req?.roles).length > 1
-                            ? `+${safeArr<any>(req?.roles).length - 1} more`
-                            : ""}
+                          {getRoleCount(req) > 1 ? `+${getRoleCount(req) - 1} more` : ""}
                         </div>
                       </td>
 
@@ -319,6 +361,20 @@ export const ServiceRequestsPage: React.FC = () => {
               </div>
             </div>
           )}
+
+          {next && (
+            <div className="p-4 border-t border-gray-200 text-center">
+              <button
+                type="button"
+                onClick={loadMore}
+                disabled={loadingMore}
+                className="px-4 py-2 text-sm text-gray-700 border border-gray-300 rounded-lg hover:bg-gray-50 disabled:opacity-50"
+              >
+                {loadingMore ? "Loading..." : "Load more"}
+              </button>
+              {moreError && <p className="text-sm text-red-600 mt-2">{moreError}</p>}
+            </div>
+          )}
         </div>
       )}
     </div>